@@ -13,6 +13,7 @@ Python библиотека для работы с Anytype API с интерфе
 
 Доступные модули:
     - AnytypeClient - прямой клиент API
+    - AsyncAnytypeClient - асинхронный клиент API
     - AnytypeDatabase - интерфейс как у БД
     - Anytype - ORM стиль с моделями
     - AnytypeDB - максимально простой интерфейс
@@ -20,7 +21,13 @@ Python библиотека для работы с Anytype API с интерфе
 
 __version__ = "0.2.0"
 
-from .client import AnytypeClient
+from .client import AnytypeClient, AsyncAnytypeClient
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter
+from .cache import ResponseCache
+from .httpcache import HTTPCache, MemoryHTTPCacheBackend, SQLiteHTTPCacheBackend
+from .pool import ClientPool
+from .transport import TransportConfig
 from . import models
 from . import exceptions
 from . import utils
@@ -30,6 +37,15 @@ from .simple import AnytypeDB
 
 __all__ = [
     "AnytypeClient",
+    "AsyncAnytypeClient",
+    "RetryPolicy",
+    "RateLimiter",
+    "ResponseCache",
+    "HTTPCache",
+    "MemoryHTTPCacheBackend",
+    "SQLiteHTTPCacheBackend",
+    "ClientPool",
+    "TransportConfig",
     "AnytypeDatabase",
     "AnytypeConnection",
     "Anytype",
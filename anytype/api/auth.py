@@ -1,11 +1,11 @@
-from ..client import AnytypeClient
+from ..client import BaseAnytypeClient
 from .. import models
 from typing import Optional
 
 class AuthAPI:
     """API для аутентификации"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def create_challenge(self, app_name: str) -> models.CreateChallengeResponse:
@@ -41,10 +41,10 @@ class AuthAPI:
             challenge_id=challenge_id,
             code=code
         )
-        response = self.client._request(
+        return self.client._request(
             "POST",
             "/auth/api_keys",
             data=request,
-            response_model=models.CreateApiKeyResponse
+            response_model=models.CreateApiKeyResponse,
+            unwrap="api_key"
         )
-        return response.api_key
@@ -1,11 +1,13 @@
-from typing import List, Optional
-from ..client import AnytypeClient
+from functools import partial
+from typing import List, Optional, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class ListsAPI:
     """API для работы со списками (коллекции и сеты)"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def add_objects(
@@ -50,6 +52,20 @@ class ListsAPI:
             response_model=models.PaginatedResponse[models.View]
         )
     
+    def iter_views(
+        self,
+        space_id: str,
+        list_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.View]:
+        """Перебрать все представления списка по одному"""
+        return self.client._iter_items(
+            partial(self.get_views, space_id, list_id),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
     def get_objects(
         self,
         space_id: str,
@@ -66,3 +82,18 @@ class ListsAPI:
             params=params,
             response_model=models.PaginatedResponse[models.Object]
         )
+    
+    def iter_objects(
+        self,
+        space_id: str,
+        list_id: str,
+        view_id: str,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.Object]:
+        """Перебрать все объекты представления списка по одному"""
+        return self.client._iter_items(
+            partial(self.get_objects, space_id, list_id, view_id),
+            page_size=page_size,
+            prefetch=prefetch
+        )
\ No newline at end of file
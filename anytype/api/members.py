@@ -1,11 +1,13 @@
-from typing import Optional, Dict, Any
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, Dict, Any, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class MembersAPI:
     """API для работы с участниками пространства"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def list(
@@ -28,11 +30,25 @@ class MembersAPI:
             response_model=models.PaginatedResponse[models.Member]
         )
     
+    def iter_list(
+        self,
+        space_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.Member]:
+        """Перебрать всех участников пространства по одному"""
+        return self.client._iter_items(
+            partial(self.list, space_id, filters=filters),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
     def get(self, space_id: str, member_id: str) -> models.Member:
         """Получить информацию об участнике"""
-        response = self.client._request(
+        return self.client._request(
             "GET",
             f"/spaces/{space_id}/members/{member_id}",
-            response_model=models.MemberResponse
+            response_model=models.MemberResponse,
+            unwrap="member"
         )
-        return response.member
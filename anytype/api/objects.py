@@ -1,11 +1,14 @@
-from typing import Optional, List, Dict, Any
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, List, Dict, Any, Iterator, Iterable, Tuple, Union
+from ..client import BaseAnytypeClient
 from .. import models
+from ..exceptions import NotFoundError, ResourceGoneError
+from ..utils import MAX_PAGE_SIZE
 
 class ObjectsAPI:
     """API для работы с объектами"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def list(
@@ -36,6 +39,34 @@ class ObjectsAPI:
             response_model=models.PaginatedResponse[models.Object]
         )
     
+    def iter_list(
+        self,
+        space_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True
+    ) -> Iterator[models.Object]:
+        """
+        Перебрать все объекты пространства по одному
+        
+        Страницы запрашиваются по мере перебора, в памяти держится не больше
+        двух страниц. С prefetch=True следующая страница загружается, пока
+        обрабатывается текущая. У асинхронного клиента возвращает async-итератор.
+        
+        С concurrency > 1 после первой страницы все оставшиеся страницы
+        запрашиваются параллельно (пул потоков или asyncio задачи). При
+        ordered=False страницы отдаются по мере готовности, а не по порядку.
+        """
+        return self.client._iter_items(
+            partial(self.list, space_id, filters=filters),
+            page_size=page_size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered
+        )
+    
     def get(
         self,
         space_id: str,
@@ -44,13 +75,56 @@ class ObjectsAPI:
     ) -> models.ObjectWithBody:
         """Получить объект по ID"""
         params = {"format": format} if format else {}
-        response = self.client._request(
+        return self.client._request(
             "GET",
             f"/spaces/{space_id}/objects/{object_id}",
             params=params,
-            response_model=models.ObjectResponse
+            response_model=models.ObjectResponse,
+            unwrap="object"
         )
-        return response.object
+    
+    def get_many(
+        self,
+        space_id: str,
+        object_ids: Iterable[str],
+        format: Optional[str] = None,
+        concurrency: int = 8
+    ) -> models.ObjectsByIds:
+        """
+        Получить много объектов по ID параллельно
+        
+        Повторяющиеся ID запрашиваются один раз. Удобно для разрешения
+        связей (ObjectsPropertyValue.objects) без N+1 запросов.
+        
+        Args:
+            space_id: ID пространства
+            object_ids: ID объектов
+            format: Формат тела ("md"); по умолчанию тело не запрашивается
+            concurrency: Сколько запросов выполнять одновременно
+        
+        Returns:
+            ObjectsByIds: found - объекты по ID, missing - ID, которых нет
+            (404/410), errors - остальные ошибки по ID
+        """
+        ids = list(dict.fromkeys(object_ids))
+        bulk = self.client._run_concurrent(
+            (partial(self.get, space_id, object_id, format=format) for object_id in ids),
+            concurrency=concurrency
+        )
+        
+        def collect(response: models.BulkResponse) -> models.ObjectsByIds:
+            result = models.ObjectsByIds(found={}, missing=[], errors={})
+            for item in response.results:
+                object_id = ids[item.index]
+                if item.ok:
+                    result.found[object_id] = item.result
+                elif isinstance(item.error, (NotFoundError, ResourceGoneError)):
+                    result.missing.append(object_id)
+                else:
+                    result.errors[object_id] = item.error
+            return result
+        
+        return self.client._then(bulk, collect)
     
     def create(
         self,
@@ -71,13 +145,13 @@ class ObjectsAPI:
             template_id=template_id,
             properties=properties
         )
-        response = self.client._request(
+        return self.client._request(
             "POST",
             f"/spaces/{space_id}/objects",
             data=request,
-            response_model=models.ObjectResponse
+            response_model=models.ObjectResponse,
+            unwrap="object"
         )
-        return response.object
     
     def update(
         self,
@@ -97,19 +171,102 @@ class ObjectsAPI:
             type_key=type_key,
             properties=properties
         )
-        response = self.client._request(
+        return self.client._request(
             "PATCH",
             f"/spaces/{space_id}/objects/{object_id}",
             data=request,
-            response_model=models.ObjectResponse
+            response_model=models.ObjectResponse,
+            unwrap="object"
         )
-        return response.object
     
     def delete(self, space_id: str, object_id: str) -> models.ObjectWithBody:
         """Удалить объект (архивировать)"""
-        response = self.client._request(
+        return self.client._request(
             "DELETE",
             f"/spaces/{space_id}/objects/{object_id}",
-            response_model=models.ObjectResponse
+            response_model=models.ObjectResponse,
+            unwrap="object"
         )
-        return response.object
+    
+    def bulk_create(
+        self,
+        space_id: str,
+        items: Iterable[Union[models.CreateObjectRequest, Dict[str, Any]]],
+        concurrency: int = 8
+    ) -> models.BulkResponse:
+        """
+        Создать много объектов параллельно
+        
+        Args:
+            space_id: ID пространства
+            items: CreateObjectRequest или словари с теми же полями
+            concurrency: Сколько запросов выполнять одновременно
+        
+        Returns:
+            BulkResponse: для каждого элемента созданный объект или ошибка.
+            Ошибка одного элемента не останавливает остальные.
+        """
+        def call(item):
+            request = models.CreateObjectRequest.model_validate(item)
+            return self.client._request(
+                "POST",
+                f"/spaces/{space_id}/objects",
+                data=request,
+                response_model=models.ObjectResponse,
+                unwrap="object"
+            )
+        
+        return self.client._run_concurrent(
+            (partial(call, item) for item in items),
+            concurrency=concurrency
+        )
+    
+    def bulk_update(
+        self,
+        space_id: str,
+        items: Iterable[Union[
+            Tuple[str, Union[models.UpdateObjectRequest, Dict[str, Any]]],
+            Dict[str, Any]
+        ]],
+        concurrency: int = 8
+    ) -> models.BulkResponse:
+        """
+        Обновить много объектов параллельно
+        
+        Args:
+            space_id: ID пространства
+            items: Пары (object_id, UpdateObjectRequest | dict) или словари
+                с полем "id" и полями UpdateObjectRequest
+            concurrency: Сколько запросов выполнять одновременно
+        """
+        def call(item):
+            if isinstance(item, dict):
+                item = dict(item)
+                object_id, request = item.pop("id"), item
+            else:
+                object_id, request = item
+            request = models.UpdateObjectRequest.model_validate(request)
+            return self.client._request(
+                "PATCH",
+                f"/spaces/{space_id}/objects/{object_id}",
+                data=request,
+                response_model=models.ObjectResponse,
+                unwrap="object"
+            )
+        
+        return self.client._run_concurrent(
+            (partial(call, item) for item in items),
+            concurrency=concurrency
+        )
+    
+    def bulk_delete(
+        self,
+        space_id: str,
+        object_ids: Iterable[str],
+        concurrency: int = 8
+    ) -> models.BulkResponse:
+        """Удалить (архивировать) много объектов параллельно"""
+        return self.client._run_concurrent(
+            (partial(self.delete, space_id, object_id) for object_id in object_ids),
+            concurrency=concurrency
+        )
\ No newline at end of file
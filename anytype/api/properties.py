@@ -1,11 +1,13 @@
-from typing import Optional, Dict, Any, List
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, Dict, Any, List, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class PropertiesAPI:
     """API для работы со свойствами"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def list(
@@ -28,14 +30,28 @@ class PropertiesAPI:
             response_model=models.PaginatedResponse[models.Property]
         )
     
+    def iter_list(
+        self,
+        space_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.Property]:
+        """Перебрать все свойства пространства по одному"""
+        return self.client._iter_items(
+            partial(self.list, space_id, filters=filters),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
     def get(self, space_id: str, property_id: str) -> models.Property:
         """Получить свойство по ID"""
-        response = self.client._request(
+        return self.client._request(
             "GET",
             f"/spaces/{space_id}/properties/{property_id}",
-            response_model=models.PropertyResponse
+            response_model=models.PropertyResponse,
+            unwrap="property"
         )
-        return response.property
     
     def create(
         self,
@@ -52,13 +68,13 @@ class PropertiesAPI:
             key=key,
             tags=tags
         )
-        response = self.client._request(
+        return self.client._request(
             "POST",
             f"/spaces/{space_id}/properties",
             data=request,
-            response_model=models.PropertyResponse
+            response_model=models.PropertyResponse,
+            unwrap="property"
         )
-        return response.property
     
     def update(
         self,
@@ -69,19 +85,19 @@ class PropertiesAPI:
     ) -> models.Property:
         """Обновить свойство"""
         request = models.UpdatePropertyRequest(name=name, key=key)
-        response = self.client._request(
+        return self.client._request(
             "PATCH",
             f"/spaces/{space_id}/properties/{property_id}",
             data=request,
-            response_model=models.PropertyResponse
+            response_model=models.PropertyResponse,
+            unwrap="property"
         )
-        return response.property
     
     def delete(self, space_id: str, property_id: str) -> models.Property:
         """Удалить свойство"""
-        response = self.client._request(
+        return self.client._request(
             "DELETE",
             f"/spaces/{space_id}/properties/{property_id}",
-            response_model=models.PropertyResponse
+            response_model=models.PropertyResponse,
+            unwrap="property"
         )
-        return response.property
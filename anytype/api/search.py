@@ -1,11 +1,13 @@
-from typing import Optional, List
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, List, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class SearchAPI:
     """API для поиска"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def global_search(
@@ -81,3 +83,56 @@ class SearchAPI:
             data=request,
             response_model=models.PaginatedResponse[models.Object]
         )
+    
+    def iter_global_search(
+        self,
+        query: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        filters: Optional[models.FilterExpression] = None,
+        sort: Optional[models.SortOptions] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True
+    ) -> Iterator[models.Object]:
+        """Перебрать все результаты глобального поиска по одному"""
+        return self.client._iter_items(
+            partial(self.global_search, query=query, types=types, filters=filters, sort=sort),
+            page_size=page_size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered
+        )
+    
+    def iter_search_in_space(
+        self,
+        space_id: str,
+        query: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        filters: Optional[models.FilterExpression] = None,
+        sort: Optional[models.SortOptions] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True
+    ) -> Iterator[models.Object]:
+        """
+        Перебрать все результаты поиска в пространстве по одному
+        
+        Для стабильного порядка между страницами лучше явно задать sort.
+        Параметры concurrency и ordered как у ObjectsAPI.iter_list.
+        """
+        return self.client._iter_items(
+            partial(
+                self.search_in_space,
+                space_id,
+                query=query,
+                types=types,
+                filters=filters,
+                sort=sort
+            ),
+            page_size=page_size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered
+        )
\ No newline at end of file
@@ -1,11 +1,13 @@
-from typing import Optional, Dict, Any
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, Dict, Any, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class SpacesAPI:
     """API для работы с пространствами"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def list(
@@ -34,25 +36,38 @@ class SpacesAPI:
             response_model=models.PaginatedResponse[models.Space]
         )
     
+    def iter_list(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.Space]:
+        """Перебрать все пространства по одному"""
+        return self.client._iter_items(
+            partial(self.list, filters=filters),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
     def get(self, space_id: str) -> models.Space:
         """Получить пространство по ID"""
-        response = self.client._request(
+        return self.client._request(
             "GET",
             f"/spaces/{space_id}",
-            response_model=models.SpaceResponse
+            response_model=models.SpaceResponse,
+            unwrap="space"
         )
-        return response.space
     
     def create(self, name: str, description: Optional[str] = None) -> models.Space:
         """Создать новое пространство"""
         request = models.CreateSpaceRequest(name=name, description=description)
-        response = self.client._request(
+        return self.client._request(
             "POST",
             "/spaces",
             data=request,
-            response_model=models.SpaceResponse
+            response_model=models.SpaceResponse,
+            unwrap="space"
         )
-        return response.space
     
     def update(
         self,
@@ -62,10 +77,10 @@ class SpacesAPI:
     ) -> models.Space:
         """Обновить пространство"""
         request = models.UpdateSpaceRequest(name=name, description=description)
-        response = self.client._request(
+        return self.client._request(
             "PATCH",
             f"/spaces/{space_id}",
             data=request,
-            response_model=models.SpaceResponse
+            response_model=models.SpaceResponse,
+            unwrap="space"
         )
-        return response.space
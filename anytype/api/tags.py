@@ -1,11 +1,13 @@
-from typing import Optional, Dict, Any
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, Dict, Any, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class TagsAPI:
     """API для работы с тегами"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def list(
@@ -29,14 +31,29 @@ class TagsAPI:
             response_model=models.PaginatedResponse[models.Tag]
         )
     
+    def iter_list(
+        self,
+        space_id: str,
+        property_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.Tag]:
+        """Перебрать все теги свойства по одному"""
+        return self.client._iter_items(
+            partial(self.list, space_id, property_id, filters=filters),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
     def get(self, space_id: str, property_id: str, tag_id: str) -> models.Tag:
         """Получить тег по ID"""
-        response = self.client._request(
+        return self.client._request(
             "GET",
             f"/spaces/{space_id}/properties/{property_id}/tags/{tag_id}",
-            response_model=models.TagResponse
+            response_model=models.TagResponse,
+            unwrap="tag"
         )
-        return response.tag
     
     def create(
         self,
@@ -48,13 +65,13 @@ class TagsAPI:
     ) -> models.Tag:
         """Создать новый тег"""
         request = models.CreateTagRequest(name=name, color=color, key=key)
-        response = self.client._request(
+        return self.client._request(
             "POST",
             f"/spaces/{space_id}/properties/{property_id}/tags",
             data=request,
-            response_model=models.TagResponse
+            response_model=models.TagResponse,
+            unwrap="tag"
         )
-        return response.tag
     
     def update(
         self,
@@ -67,19 +84,19 @@ class TagsAPI:
     ) -> models.Tag:
         """Обновить тег"""
         request = models.UpdateTagRequest(name=name, color=color, key=key)
-        response = self.client._request(
+        return self.client._request(
             "PATCH",
             f"/spaces/{space_id}/properties/{property_id}/tags/{tag_id}",
             data=request,
-            response_model=models.TagResponse
+            response_model=models.TagResponse,
+            unwrap="tag"
         )
-        return response.tag
     
     def delete(self, space_id: str, property_id: str, tag_id: str) -> models.Tag:
         """Удалить тег"""
-        response = self.client._request(
+        return self.client._request(
             "DELETE",
             f"/spaces/{space_id}/properties/{property_id}/tags/{tag_id}",
-            response_model=models.TagResponse
+            response_model=models.TagResponse,
+            unwrap="tag"
         )
-        return response.tag
@@ -1,11 +1,13 @@
-from typing import Optional, Dict, Any
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, Dict, Any, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class TemplatesAPI:
     """API для работы с шаблонами"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def list(
@@ -29,6 +31,21 @@ class TemplatesAPI:
             response_model=models.PaginatedResponse[models.Object]
         )
     
+    def iter_list(
+        self,
+        space_id: str,
+        type_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.Object]:
+        """Перебрать все шаблоны типа по одному"""
+        return self.client._iter_items(
+            partial(self.list, space_id, type_id, filters=filters),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
     def get(
         self,
         space_id: str,
@@ -36,9 +53,9 @@ class TemplatesAPI:
         template_id: str
     ) -> models.ObjectWithBody:
         """Получить шаблон по ID"""
-        response = self.client._request(
+        return self.client._request(
             "GET",
             f"/spaces/{space_id}/types/{type_id}/templates/{template_id}",
-            response_model=models.TemplateResponse
+            response_model=models.TemplateResponse,
+            unwrap="template"
         )
-        return response.template
@@ -1,11 +1,13 @@
-from typing import Optional, List, Dict, Any
-from ..client import AnytypeClient
+from functools import partial
+from typing import Optional, List, Dict, Any, Iterator
+from ..client import BaseAnytypeClient
 from .. import models
+from ..utils import MAX_PAGE_SIZE
 
 class TypesAPI:
     """API для работы с типами"""
     
-    def __init__(self, client: AnytypeClient):
+    def __init__(self, client: BaseAnytypeClient):
         self.client = client
     
     def list(
@@ -28,14 +30,28 @@ class TypesAPI:
             response_model=models.PaginatedResponse[models.Type]
         )
     
+    def iter_list(
+        self,
+        space_id: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False
+    ) -> Iterator[models.Type]:
+        """Перебрать все типы пространства по одному"""
+        return self.client._iter_items(
+            partial(self.list, space_id, filters=filters),
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
     def get(self, space_id: str, type_id: str) -> models.Type:
         """Получить тип по ID"""
-        response = self.client._request(
+        return self.client._request(
             "GET",
             f"/spaces/{space_id}/types/{type_id}",
-            response_model=models.TypeResponse
+            response_model=models.TypeResponse,
+            unwrap="type"
         )
-        return response.type
     
     def create(
         self,
@@ -56,13 +72,13 @@ class TypesAPI:
             key=key,
             properties=properties
         )
-        response = self.client._request(
+        return self.client._request(
             "POST",
             f"/spaces/{space_id}/types",
             data=request,
-            response_model=models.TypeResponse
+            response_model=models.TypeResponse,
+            unwrap="type"
         )
-        return response.type
     
     def update(
         self,
@@ -84,19 +100,19 @@ class TypesAPI:
             key=key,
             properties=properties
         )
-        response = self.client._request(
+        return self.client._request(
             "PATCH",
             f"/spaces/{space_id}/types/{type_id}",
             data=request,
-            response_model=models.TypeResponse
+            response_model=models.TypeResponse,
+            unwrap="type"
         )
-        return response.type
     
     def delete(self, space_id: str, type_id: str) -> models.Type:
         """Удалить тип"""
-        response = self.client._request(
+        return self.client._request(
             "DELETE",
             f"/spaces/{space_id}/types/{type_id}",
-            response_model=models.TypeResponse
+            response_model=models.TypeResponse,
+            unwrap="type"
         )
-        return response.type
@@ -0,0 +1,214 @@
+import copy
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, Tuple, Hashable
+
+# Маркер промаха, т.к. None - допустимое закешированное значение
+MISSING = object()
+
+# TTL по умолчанию (секунды) для редко меняющихся метаданных
+DEFAULT_TTLS: Dict[str, float] = {
+    "spaces": 60.0,
+    "types": 300.0,
+    "properties": 300.0,
+    "tags": 300.0,
+}
+
+# Какие ресурсы устаревают при изменении ресурса
+_INVALIDATES: Dict[str, Tuple[str, ...]] = {
+    "spaces": ("spaces",),
+    "types": ("types",),
+    # Свойства встречаются в типах, а теги живут внутри свойств
+    "properties": ("properties", "types", "tags"),
+    "tags": ("tags",),
+}
+
+_PATH_RE = re.compile(r"^/v1/spaces(?:/(?P<space>[^/]+)(?:/(?P<rest>.*))?)?$")
+
+def classify_path(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """Определить (ресурс, space_id) по пути запроса"""
+    match = _PATH_RE.match(url)
+    if not match:
+        return None, None
+    space_id, rest = match.group("space"), match.group("rest")
+    if rest is None:
+        return "spaces", space_id
+    parts = rest.split("/")
+    if parts[0] == "types" and len(parts) <= 2:
+        return "types", space_id
+    if parts[0] == "properties":
+        if len(parts) >= 3 and parts[2] == "tags":
+            return "tags", space_id
+        if len(parts) <= 2:
+            return "properties", space_id
+    return None, space_id
+
+class MemoryCache:
+    """
+    Потокобезопасный LRU кеш в памяти с TTL на запись.
+    
+    Записи можно помечать тегами и сбрасывать по тегу.
+    Реализует интерфейс бекенда для ResponseCache: get, set,
+    invalidate_tags, clear и stats.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            expires, value, _ = entry
+            if expires < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: float, tags: Iterable[str] = ()):
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+    
+    def invalidate_tags(self, tags: Iterable[str]):
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+    
+    def _remove(self, key: Hashable):
+        _, _, tags = self._data.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+        }
+
+class ResponseCache:
+    """
+    Кеш ответов для метаданных: пространств, типов, свойств и тегов.
+    
+    Кешируются только GET запросы к ресурсам из ttls. Успешные
+    create/update/delete через тот же клиент сбрасывают связанные
+    записи этого пространства. Каждый вызов получает свою копию
+    ответа, поэтому изменение результата не портит кеш.
+    
+    Пример использования:
+    ```python
+    cache = ResponseCache(ttls={"types": 600, "properties": 600}, maxsize=2048)
+    client = AnytypeClient(api_key="your-api-key", cache=cache)
+    client.types.list(space_id)   # запрос к API
+    client.types.list(space_id)   # из кеша
+    print(cache.stats)            # {"hits": 1, "misses": 1, ...}
+    ```
+    
+    Args:
+        ttls: TTL по ресурсам, по умолчанию DEFAULT_TTLS
+        maxsize: Максимум записей в MemoryCache по умолчанию
+        backend: Свой бекенд с интерфейсом MemoryCache
+    """
+    
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        maxsize: int = 1024,
+        backend: Optional[Any] = None
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.backend = backend if backend is not None else MemoryCache(maxsize)
+    
+    def _key(self, request: Dict[str, Any], api_key: Optional[str], unwrap: Optional[str]):
+        # Значения параметров бывают списками, поэтому ключ строим из строк
+        params = tuple(sorted((k, str(v)) for k, v in (request.get("params") or {}).items()))
+        return (api_key, request["url"], params, unwrap)
+    
+    def get(self, request: Dict[str, Any], api_key: Optional[str], unwrap: Optional[str]) -> Any:
+        """Закешированный ответ или MISSING"""
+        if request["method"] != "GET":
+            return MISSING
+        resource, _ = classify_path(request["url"])
+        if resource not in self.ttls:
+            return MISSING
+        value = self.backend.get(self._key(request, api_key, unwrap))
+        return value if value is MISSING else copy.deepcopy(value)
+    
+    def store(
+        self,
+        request: Dict[str, Any],
+        api_key: Optional[str],
+        unwrap: Optional[str],
+        result: Any
+    ):
+        """Сохранить ответ GET или сбросить связанные записи после изменения"""
+        resource, space_id = classify_path(request["url"])
+        if resource is None:
+            return
+        if request["method"] != "GET":
+            self.invalidate(resource, space_id)
+            return
+        if resource in self.ttls:
+            self.backend.set(
+                self._key(request, api_key, unwrap),
+                copy.deepcopy(result),
+                self.ttls[resource],
+                tags=(self._tag(resource, space_id),)
+            )
+    
+    def invalidate(self, resource: str, space_id: Optional[str] = None):
+        """Сбросить записи ресурса (и зависящих от него) в пространстве"""
+        tags = []
+        for affected in _INVALIDATES.get(resource, (resource,)):
+            if affected == "spaces":
+                # Список пространств и отдельные пространства кешируются под одним тегом
+                tags.append(self._tag(affected, None))
+            else:
+                tags.append(self._tag(affected, space_id))
+        self.backend.invalidate_tags(tags)
+    
+    def _tag(self, resource: str, space_id: Optional[str]) -> str:
+        if resource == "spaces":
+            return "spaces"
+        return f"{resource}:{space_id}"
+    
+    def clear(self):
+        self.backend.clear()
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        return self.backend.stats
@@ -1,11 +1,25 @@
+import asyncio
+import contextvars
+from abc import ABC, abstractmethod
+import time
+from contextlib import contextmanager
 import httpx
 from typing import Optional, Dict, Any, List, Union, TypeVar, Generic, Type
 from pydantic import BaseModel
 from . import models
+from . import utils
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter
+from .cache import ResponseCache, MISSING
+from .httpcache import HTTPCache
+from .lazy import LazyModel, construct, RESPONSE_MODES
+from .codec import JSONCodec, get_codec
+from .transport import TransportConfig, as_transport_config
+from .singleflight import SingleFlight, AsyncSingleFlight
 from .exceptions import (
-    AnytypeAPIError, 
-    UnauthorizedError, 
-    NotFoundError, 
+    AnytypeAPIError,
+    UnauthorizedError,
+    NotFoundError,
     ValidationError,
     RateLimitError,
     ForbiddenError,
@@ -14,25 +28,13 @@ from .exceptions import (
 
 T = TypeVar('T')
 
-class AnytypeClient:
+class BaseAnytypeClient(ABC):
     """
-    Главный клиент для работы с Anytype API.
-    
-    Пример использования:
-    ```python
-    client = AnytypeClient(api_key="your-api-key")
+    Общая часть синхронного и асинхронного клиентов.
     
-    # Получить все пространства
-    spaces = client.spaces.list()
-    
-    # Создать объект
-    obj = client.objects.create(
-        space_id=spaces.data[0].id,
-        type_key="page",
-        name="Моя страница",
-        body="Содержимое страницы"
-    )
-    ```
+    Здесь собирается запрос, разбирается ответ и маппятся ошибки API,
+    поэтому AnytypeClient и AsyncAnytypeClient ведут себя одинаково и
+    отличаются только способом отправки запроса.
     """
     
     def __init__(
@@ -40,17 +42,44 @@ class AnytypeClient:
         api_key: Optional[str] = None,
         base_url: str = "http://127.0.0.1:31009",
         api_version: str = "2025-11-08",
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        http_cache: Optional[HTTPCache] = None,
+        response_mode: str = "model",
+        codec: Optional[Union[str, JSONCodec]] = None,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[Union[TransportConfig, httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+        coalesce: bool = False
     ):
+        self.api_key = api_key
+        # Клиент из ClientPool: общий для подключений с тем же ключом
+        self._pooled = False
         self.base_url = base_url.rstrip('/')
         self.api_version = api_version
         self.timeout = timeout
-        
-        self.client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            headers=self._build_headers(api_key)
+        # HTTP/2, лимиты соединений, таймауты по фазам или свой httpx транспорт
+        self.transport = as_transport_config(transport)
+        self.limits = limits if limits is not None else self.transport.limits
+        self.retry = retry
+        self._retry_budget = retry.create_budget() if retry else None
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.http_cache = http_cache
+        self._check_response_mode(response_mode)
+        self.response_mode = response_mode
+        self._response_mode_override = contextvars.ContextVar(
+            f"anytype_response_mode_{id(self)}", default=None
         )
+        # JSON кодек для тел запросов и ответов вне режима model
+        self.codec = get_codec(codec)
+        # Одинаковые одновременные GET запросы делят один HTTP вызов и один
+        # экземпляр результата, поэтому включается явно
+        self.coalesce = coalesce
+        self._singleflight = self._create_singleflight()
+        
+        self.client = self._create_http_client(self._build_headers(api_key))
         
         # Инициализация API модулей
         from .api import (
@@ -70,6 +99,14 @@ class AnytypeClient:
         self.search = SearchAPI(self)
         self.tags = TagsAPI(self)
     
+    @abstractmethod
+    def _create_http_client(self, headers: Dict[str, str]):
+        """httpx.Client или httpx.AsyncClient с общими заголовками"""
+    
+    @abstractmethod
+    def _create_singleflight(self):
+        """SingleFlight или AsyncSingleFlight для объединения GET запросов"""
+    
     def _build_headers(self, api_key: Optional[str]) -> Dict[str, str]:
         headers = {
             "Anytype-Version": self.api_version,
@@ -81,17 +118,75 @@ class AnytypeClient:
     
     def set_api_key(self, api_key: str):
         """Обновить API ключ"""
+        if self._pooled:
+            # Пул выдает клиента всем подключениям с прежним ключом
+            raise RuntimeError(
+                "Cannot change the API key of a pooled client; "
+                "acquire a client for the new key from the pool instead"
+            )
+        self.api_key = api_key
         self.client.headers["Authorization"] = f"Bearer {api_key}"
     
-    def _request(
+    def _check_response_mode(self, mode: str):
+        if mode not in RESPONSE_MODES:
+            raise ValueError(f"Unknown response mode {mode!r}, expected one of {RESPONSE_MODES}")
+    
+    @contextmanager
+    def with_response_mode(self, mode: str):
+        """
+        Временно сменить режим разбора ответов в текущем потоке или задаче
+        
+        Режимы:
+            model - полная валидация pydantic (по умолчанию)
+            lazy - LazyModel, поля валидируются при обращении
+            trusted - model_construct без валидации; моделями становятся
+                ответ и его объекты (data, object), вложенные значения
+                (properties, icon) остаются словарями
+            raw - словари как в JSON
+        
+        Пример:
+        ```python
+        with client.with_response_mode("lazy"):
+            for obj in client.objects.iter_list(space_id):
+                print(obj.id, obj.name)
+        ```
+        """
+        self._check_response_mode(mode)
+        token = self._response_mode_override.set(mode)
+        try:
+            yield self
+        finally:
+            self._response_mode_override.reset(token)
+    
+    def _current_response_mode(self) -> str:
+        return self._response_mode_override.get() or self.response_mode
+    
+    def _validate(self, response_model: Type[T], data: Any) -> Any:
+        """Превратить JSON ответа в результат согласно режиму разбора"""
+        mode = self._current_response_mode()
+        if mode == "model":
+            return response_model.model_validate(data)
+        if mode == "lazy":
+            return LazyModel(response_model, data)
+        if mode == "trusted":
+            return construct(response_model, data)
+        return data
+    
+    def _unwrap(self, result: Any, unwrap: Optional[str]) -> Any:
+        if not unwrap:
+            return result
+        if isinstance(result, dict):
+            return result.get(unwrap)
+        return getattr(result, unwrap)
+    
+    def _build_request(
         self,
         method: str,
         path: str,
         params: Optional[Dict] = None,
-        data: Optional[BaseModel] = None,
-        response_model: Optional[Type[T]] = None
-    ) -> Union[Dict[str, Any], T]:
-        """Базовый метод для выполнения HTTP запросов"""
+        data: Optional[BaseModel] = None
+    ) -> Dict[str, Any]:
+        """Собрать аргументы для httpx запроса"""
         url = f"/v1{path}"
         
         # Convert params to proper format
@@ -103,43 +198,156 @@ class AnytypeClient:
                     clean_params[key] = value
             params = clean_params
         
-        # Convert data to dict
-        json_data = None
-        if data:
-            json_data = data.model_dump(exclude_none=True)
+        # Тело сразу сериализуем в байты, без промежуточного dict
+        content = None
+        if isinstance(data, BaseModel):
+            content = data.model_dump_json(exclude_none=True).encode("utf-8")
+        elif data:
+            content = self.codec.dumps(data)
         
-        try:
-            response = self.client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data
+        return {
+            "method": method,
+            "url": url,
+            "params": params,
+            "content": content
+        }
+    
+    def _flight_key(
+        self,
+        request: Dict[str, Any],
+        response_model: Optional[Type[T]],
+        unwrap: Optional[str]
+    ) -> Optional[tuple]:
+        """Ключ для объединения одинаковых GET запросов или None"""
+        if not self.coalesce or request["method"] != "GET":
+            return None
+        params = tuple(sorted((k, str(v)) for k, v in (request.get("params") or {}).items()))
+        return (
+            self.api_key,
+            request["url"],
+            params,
+            response_model,
+            unwrap,
+            self._current_response_mode()
+        )
+    
+    def _cache_lookup(self, request: Dict[str, Any], unwrap: Optional[str]) -> Any:
+        """Ответ из кеша метаданных или MISSING"""
+        if self.cache is None or self._current_response_mode() != "model":
+            return MISSING
+        return self.cache.get(request, self.api_key, unwrap)
+    
+    def _cache_store(self, request: Dict[str, Any], unwrap: Optional[str], result: Any):
+        if self.cache is None:
+            return
+        # Не-model результаты не кешируем, но изменения сбрасывают кеш в любом режиме
+        if request["method"] == "GET" and self._current_response_mode() != "model":
+            return
+        self.cache.store(request, self.api_key, unwrap, result)
+    
+    def _conditional_request(self, request: Dict[str, Any], unwrap: Optional[str]):
+        """Добавить к GET валидаторы из HTTP кеша, вернуть (ключ, запись)"""
+        if self.http_cache is None or self._current_response_mode() != "model":
+            return None, None
+        return self.http_cache.prepare(request, self.api_key, unwrap)
+    
+    def _finish_request(
+        self,
+        request: Dict[str, Any],
+        response: httpx.Response,
+        response_model: Optional[Type[T]],
+        unwrap: Optional[str],
+        conditional
+    ) -> Any:
+        """Разобрать ответ с учетом HTTP кеша и сохранить в кеш метаданных"""
+        http_key, http_entry = conditional
+        if response.status_code == 304 and http_entry is not None:
+            result = self.http_cache.revalidated(
+                http_key,
+                http_entry,
+                lambda body: self._parse_body(body, response_model, unwrap)
             )
-            
-            # Handle errors
-            if response.status_code >= 400:
-                self._handle_error(response)
-            
-            # Parse response
-            if response.status_code == 200 or response.status_code == 201:
-                if response_model:
-                    return response_model.model_validate(response.json())
-                return response.json()
-            elif response.status_code == 204:
-                return None
-            
-            return response.json()
-            
-        except httpx.TimeoutException:
-            raise AnytypeAPIError("Request timeout")
-        except httpx.HTTPError as e:
-            raise AnytypeAPIError(f"HTTP error: {str(e)}")
+        else:
+            result = self._parse_response(response, response_model, unwrap)
+            if http_key is not None:
+                self.http_cache.store(http_key, response, result)
+        self._cache_store(request, unwrap, result)
+        return result
+    
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None
+    ) -> Optional[float]:
+        """Задержка перед повтором попытки attempt или None, если повтора не будет"""
+        if self.retry is None or attempt >= self.retry.max_attempts:
+            return None
+        if not self.retry.is_retryable(method, response=response, error=error):
+            return None
+        if not self._retry_budget.withdraw():
+            return None
+        return self.retry.get_delay(attempt, response)
+    
+    def _rate_limit_delay(self, request: Dict[str, Any]) -> float:
+        """Сколько подождать перед отправкой по лимиту rate_limiter"""
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve(request["method"], request["url"])
+    
+    def _record_response(self, request: Dict[str, Any], response: httpx.Response):
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(request["method"], request["url"], response.status_code)
+    
+    def _transport_error(self, error: httpx.HTTPError) -> AnytypeAPIError:
+        if isinstance(error, httpx.TimeoutException):
+            return AnytypeAPIError("Request timeout")
+        return AnytypeAPIError(f"HTTP error: {str(error)}")
+    
+    def _parse_response(
+        self,
+        response: httpx.Response,
+        response_model: Optional[Type[T]] = None,
+        unwrap: Optional[str] = None
+    ) -> Union[Dict[str, Any], T, None]:
+        """Разобрать ответ API или поднять исключение"""
+        # Handle errors
+        if response.status_code >= 400:
+            self._handle_error(response)
+        
+        # Parse response
+        if response.status_code == 204 or not response.content:
+            return None
+        if response.status_code == 200 or response.status_code == 201:
+            return self._parse_body(response.content, response_model, unwrap)
+        
+        return self.codec.loads(response.content)
+    
+    def _parse_body(
+        self,
+        body: bytes,
+        response_model: Optional[Type[T]] = None,
+        unwrap: Optional[str] = None
+    ) -> Any:
+        """Разобрать тело успешного ответа"""
+        if not response_model:
+            return self.codec.loads(body)
+        if self._current_response_mode() == "model":
+            # pydantic разбирает байты сам, минуя промежуточный dict
+            result = response_model.model_validate_json(body)
+        else:
+            result = self._validate(response_model, self.codec.loads(body))
+        # Ответы-обертки ({"object": {...}}) разворачиваем сразу
+        return self._unwrap(result, unwrap)
     
     def _handle_error(self, response: httpx.Response):
         """Обработка ошибок API"""
         try:
-            error_data = response.json()
-        except:
+            error_data = self.codec.loads(response.content)
+        except Exception:
+            error_data = {}
+        if not isinstance(error_data, dict):
             error_data = {}
         
         status = response.status_code
@@ -160,6 +368,117 @@ class AnytypeClient:
             raise RateLimitError(message, status, code, error_data)
         else:
             raise AnytypeAPIError(message, status, code, error_data)
+
+class AnytypeClient(BaseAnytypeClient):
+    """
+    Главный клиент для работы с Anytype API.
+    
+    Пример использования:
+    ```python
+    client = AnytypeClient(api_key="your-api-key")
+    
+    # Получить все пространства
+    spaces = client.spaces.list()
+    
+    # Создать объект
+    obj = client.objects.create(
+        space_id=spaces.data[0].id,
+        type_key="page",
+        name="Моя страница",
+        body="Содержимое страницы"
+    )
+    ```
+    """
+    
+    def _create_singleflight(self) -> SingleFlight:
+        return SingleFlight()
+    
+    def _create_http_client(self, headers: Dict[str, str]) -> httpx.Client:
+        return httpx.Client(
+            base_url=self.base_url,
+            headers=headers,
+            **self.transport.client_kwargs(self.timeout, self.limits)
+        )
+    
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        data: Optional[BaseModel] = None,
+        response_model: Optional[Type[T]] = None,
+        unwrap: Optional[str] = None
+    ) -> Union[Dict[str, Any], T]:
+        """Базовый метод для выполнения HTTP запросов"""
+        request = self._build_request(method, path, params, data)
+        
+        cached = self._cache_lookup(request, unwrap)
+        if cached is not MISSING:
+            return cached
+        
+        key = self._flight_key(request, response_model, unwrap)
+        if key is None:
+            return self._fetch(request, response_model, unwrap)
+        return self._singleflight.do(key, lambda: self._fetch(request, response_model, unwrap))
+    
+    def _fetch(
+        self,
+        request: Dict[str, Any],
+        response_model: Optional[Type[T]],
+        unwrap: Optional[str]
+    ) -> Any:
+        conditional = self._conditional_request(request, unwrap)
+        response = self._send(request)
+        return self._finish_request(request, response, response_model, unwrap, conditional)
+    
+    def _send(self, request: Dict[str, Any]) -> httpx.Response:
+        """Отправить запрос с повторами по политике retry"""
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        
+        attempt = 1
+        while True:
+            wait = self._rate_limit_delay(request)
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                response = self.client.request(**request)
+            except httpx.HTTPError as e:
+                delay = self._retry_delay(request["method"], attempt, error=e)
+                if delay is None:
+                    raise self._transport_error(e) from e
+            else:
+                self._record_response(request, response)
+                delay = self._retry_delay(request["method"], attempt, response=response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
+    
+    def _iter_items(
+        self,
+        fetch,
+        page_size: int = utils.MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True
+    ):
+        """Постраничный перебор для iter_* методов API модулей"""
+        return utils.iter_items(
+            fetch,
+            page_size=page_size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered
+        )
+    
+    def _run_concurrent(self, calls, concurrency: int = 8):
+        """Пакетное выполнение для bulk_* методов API модулей"""
+        return utils.run_concurrent(calls, concurrency=concurrency)
+    
+    def _then(self, result, fn):
+        """Применить fn к результату вызова API (у асинхронного клиента - после await)"""
+        return fn(result)
     
     def close(self):
         """Закрыть HTTP клиент"""
@@ -170,3 +489,123 @@ class AnytypeClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+class AsyncAnytypeClient(BaseAnytypeClient):
+    """
+    Асинхронный клиент для работы с Anytype API.
+    
+    Содержит те же API модули, что и AnytypeClient, но все методы
+    возвращают корутины.
+    
+    Пример использования:
+    ```python
+    async with AsyncAnytypeClient(api_key="your-api-key") as client:
+        spaces = await client.spaces.list()
+        objects = await asyncio.gather(*(
+            client.objects.get(space_id, object_id) for object_id in ids
+        ))
+    ```
+    """
+    
+    def _create_singleflight(self) -> AsyncSingleFlight:
+        return AsyncSingleFlight()
+    
+    def _create_http_client(self, headers: Dict[str, str]) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            **self.transport.client_kwargs(self.timeout, self.limits)
+        )
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        data: Optional[BaseModel] = None,
+        response_model: Optional[Type[T]] = None,
+        unwrap: Optional[str] = None
+    ) -> Union[Dict[str, Any], T]:
+        """Базовый метод для выполнения HTTP запросов"""
+        request = self._build_request(method, path, params, data)
+        
+        cached = self._cache_lookup(request, unwrap)
+        if cached is not MISSING:
+            return cached
+        
+        key = self._flight_key(request, response_model, unwrap)
+        if key is None:
+            return await self._fetch(request, response_model, unwrap)
+        return await self._singleflight.do(key, lambda: self._fetch(request, response_model, unwrap))
+    
+    async def _fetch(
+        self,
+        request: Dict[str, Any],
+        response_model: Optional[Type[T]],
+        unwrap: Optional[str]
+    ) -> Any:
+        conditional = self._conditional_request(request, unwrap)
+        response = await self._send(request)
+        return self._finish_request(request, response, response_model, unwrap, conditional)
+    
+    async def _send(self, request: Dict[str, Any]) -> httpx.Response:
+        """Отправить запрос с повторами по политике retry"""
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        
+        attempt = 1
+        while True:
+            wait = self._rate_limit_delay(request)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                response = await self.client.request(**request)
+            except httpx.HTTPError as e:
+                delay = self._retry_delay(request["method"], attempt, error=e)
+                if delay is None:
+                    raise self._transport_error(e) from e
+            else:
+                self._record_response(request, response)
+                delay = self._retry_delay(request["method"], attempt, response=response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    def _iter_items(
+        self,
+        fetch,
+        page_size: int = utils.MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True
+    ):
+        """Постраничный перебор для iter_* методов API модулей"""
+        return utils.aiter_items(
+            fetch,
+            page_size=page_size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered
+        )
+    
+    def _run_concurrent(self, calls, concurrency: int = 8):
+        """Пакетное выполнение для bulk_* методов API модулей"""
+        return utils.arun_concurrent(calls, concurrency=concurrency)
+    
+    def _then(self, result, fn):
+        """Применить fn к результату вызова API (у асинхронного клиента - после await)"""
+        async def run():
+            return fn(await result)
+        
+        return run()
+    
+    async def close(self):
+        """Закрыть HTTP клиент"""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
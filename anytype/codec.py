@@ -0,0 +1,82 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+class JSONCodec:
+    """Кодек на стандартном json, работает без дополнительных зависимостей"""
+    
+    name = "json"
+    
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+class OrjsonCodec(JSONCodec):
+    """Кодек на orjson (pip install anytype-sdk[fast])"""
+    
+    name = "orjson"
+    
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed: pip install anytype-sdk[fast]")
+    
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+    
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+class MsgspecCodec(JSONCodec):
+    """Кодек на msgspec"""
+    
+    name = "msgspec"
+    
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("msgspec is not installed: pip install msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+    
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+    
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+_CODECS = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+def default_codec() -> JSONCodec:
+    """Самый быстрый из установленных кодеков: orjson, msgspec или json"""
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecCodec()
+    return JSONCodec()
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Кодек по имени ("json", "orjson", "msgspec"), готовый объект
+    с методами dumps/loads или None для default_codec()
+    """
+    if codec is None:
+        return default_codec()
+    if isinstance(codec, str):
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown codec {codec!r}, expected one of {tuple(_CODECS)}")
+        return _CODECS[codec]()
+    return codec
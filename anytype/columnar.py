@@ -0,0 +1,424 @@
+import math
+from array import array
+from datetime import date, datetime, timezone
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
+from . import models
+from .filtering import _parse_date
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+def _require(module: Any, name: str) -> Any:
+    if module is None:
+        raise ImportError(f"{name} is not installed: pip install anytype-sdk[columnar]")
+    return module
+
+def _copy(np: Any, data: array, dtype: Any) -> Any:
+    """Копия array в numpy (вид без копии запретил бы дописывать в колонку)"""
+    if not len(data):
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(data, dtype=dtype).copy()
+
+def _timestamp(value: Any) -> float:
+    """ISO дата -> unix time в секундах (NaN, если не разобрать)"""
+    parsed = _parse_date(value)
+    if isinstance(parsed, datetime):
+        return parsed.timestamp()
+    if isinstance(parsed, date):
+        return datetime(parsed.year, parsed.month, parsed.day, tzinfo=timezone.utc).timestamp()
+    return math.nan
+
+def _label(value: Any) -> Optional[str]:
+    """Подпись тега (модель или dict) или строка как есть"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return value.get("name") or value.get("key") or value.get("id")
+    return getattr(value, "name", None) or getattr(value, "key", None) or getattr(value, "id", None)
+
+class NumberColumn:
+    """
+    Числовая колонка на array('d'): number, а также date (unix time в
+    секундах). Пропуски - NaN.
+    """
+    
+    kind = "number"
+    
+    def __init__(self, fmt: str = "number"):
+        self.format = fmt
+        self.data = array("d")
+    
+    def append(self, value: Any):
+        if value is None:
+            self.data.append(math.nan)
+        elif self.format == "date":
+            self.data.append(_timestamp(value))
+        else:
+            self.data.append(float(value))
+    
+    def append_null(self, count: int = 1):
+        self.data.extend([math.nan] * count)
+    
+    def __len__(self) -> int:
+        return len(self.data)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.data.itemsize * len(self.data)
+    
+    def to_list(self) -> List[Any]:
+        if self.format == "date":
+            return [
+                None if math.isnan(v) else datetime.fromtimestamp(v, tz=timezone.utc) for v in self.data
+            ]
+        return [None if math.isnan(v) else v for v in self.data]
+    
+    def to_numpy(self) -> Any:
+        np = _require(numpy, "numpy")
+        values = _copy(np, self.data, np.float64)
+        if self.format == "date":
+            missing = np.isnan(values)
+            result = np.where(missing, 0, values * 1000).astype(np.int64).astype("datetime64[ms]")
+            result[missing] = np.datetime64("NaT")
+            return result
+        return values
+    
+    def to_arrow(self) -> Any:
+        pa = _require(pyarrow, "pyarrow")
+        if self.format == "date":
+            return pa.array(
+                [None if math.isnan(v) else int(v * 1000) for v in self.data],
+                type=pa.timestamp("ms", tz="UTC")
+            )
+        return pa.array([None if math.isnan(v) else v for v in self.data], type=pa.float64())
+    
+    def to_pandas(self) -> Any:
+        pd = _require(pandas, "pandas")
+        if self.format == "date":
+            return pd.Series(pd.to_datetime(self.to_numpy(), utc=True))
+        return pd.Series(self.to_numpy())
+
+class BoolColumn:
+    """Колонка checkbox на array('b'): 1, 0 или -1 для пропуска"""
+    
+    kind = "bool"
+    format = "checkbox"
+    
+    def __init__(self):
+        self.data = array("b")
+    
+    def append(self, value: Any):
+        self.data.append(-1 if value is None else int(bool(value)))
+    
+    def append_null(self, count: int = 1):
+        self.data.extend([-1] * count)
+    
+    def __len__(self) -> int:
+        return len(self.data)
+    
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+    
+    def to_list(self) -> List[Optional[bool]]:
+        return [None if v < 0 else bool(v) for v in self.data]
+    
+    def to_numpy(self) -> Any:
+        """int8: 1, 0, -1 (пропуск)"""
+        np = _require(numpy, "numpy")
+        return _copy(np, self.data, np.int8)
+    
+    def to_arrow(self) -> Any:
+        pa = _require(pyarrow, "pyarrow")
+        return pa.array(self.to_list(), type=pa.bool_())
+    
+    def to_pandas(self) -> Any:
+        return _require(pandas, "pandas").Series(self.to_list(), dtype="boolean")
+
+class CategoricalColumn:
+    """
+    Строки со словарным кодированием: коды array('i') и список категорий.
+    
+    Используется для select (подпись тега), текстовых свойств и типа
+    объекта; повторяющиеся значения хранятся один раз. Пропуск - код -1.
+    """
+    
+    kind = "categorical"
+    
+    def __init__(self, fmt: str = "text"):
+        self.format = fmt
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._lookup: Dict[str, int] = {}
+    
+    def _code(self, value: str) -> int:
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+    
+    def append(self, value: Any):
+        label = None if value is None else _label(value)
+        self.codes.append(-1 if label is None else self._code(label))
+    
+    def append_null(self, count: int = 1):
+        self.codes.extend([-1] * count)
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes) + sum(len(c) for c in self.categories)
+    
+    def to_list(self) -> List[Optional[str]]:
+        categories = self.categories
+        return [None if c < 0 else categories[c] for c in self.codes]
+    
+    def to_numpy(self) -> Any:
+        """Коды категорий (int32, -1 - пропуск); подписи в categories"""
+        np = _require(numpy, "numpy")
+        return _copy(np, self.codes, np.int32)
+    
+    def to_arrow(self) -> Any:
+        pa = _require(pyarrow, "pyarrow")
+        indices = pa.array([None if c < 0 else c for c in self.codes], type=pa.int32())
+        return pa.DictionaryArray.from_arrays(indices, pa.array(self.categories, type=pa.string()))
+    
+    def to_pandas(self) -> Any:
+        pd = _require(pandas, "pandas")
+        return pd.Series(pd.Categorical.from_codes(self.to_numpy(), categories=self.categories))
+
+class ListColumn(CategoricalColumn):
+    """
+    Списки строк (multi_select, objects, files): смещения array('i')
+    и коды элементов со словарным кодированием, как ListArray в Arrow.
+    Пропуск - пустой список.
+    """
+    
+    kind = "list"
+    
+    def __init__(self, fmt: str = "multi_select"):
+        super().__init__(fmt)
+        self.offsets = array("i", [0])
+    
+    def append(self, value: Any):
+        for item in value or ():
+            label = _label(item)
+            if label is not None:
+                self.codes.append(self._code(label))
+        self.offsets.append(len(self.codes))
+    
+    def append_null(self, count: int = 1):
+        self.offsets.extend([len(self.codes)] * count)
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    @property
+    def nbytes(self) -> int:
+        return super().nbytes + self.offsets.itemsize * len(self.offsets)
+    
+    def to_list(self) -> List[List[str]]:
+        categories, codes, offsets = self.categories, self.codes, self.offsets
+        return [
+            [categories[c] for c in codes[offsets[i]:offsets[i + 1]]] for i in range(len(self))
+        ]
+    
+    def to_numpy(self) -> Any:
+        """Массив списков кодов (dtype=object)"""
+        np = _require(numpy, "numpy")
+        codes = super().to_numpy()
+        result = np.empty(len(self), dtype=object)
+        for i in range(len(self)):
+            result[i] = codes[self.offsets[i]:self.offsets[i + 1]]
+        return result
+    
+    def to_arrow(self) -> Any:
+        pa = _require(pyarrow, "pyarrow")
+        values = pa.DictionaryArray.from_arrays(
+            pa.array(self.codes, type=pa.int32()), pa.array(self.categories, type=pa.string())
+        )
+        return pa.ListArray.from_arrays(pa.array(self.offsets, type=pa.int32()), values)
+    
+    def to_pandas(self) -> Any:
+        return _require(pandas, "pandas").Series(self.to_list(), dtype=object)
+
+Column = Union[NumberColumn, BoolColumn, CategoricalColumn, ListColumn]
+
+def _new_column(fmt: Optional[str]) -> Column:
+    if fmt in ("number", "date"):
+        return NumberColumn(fmt)
+    if fmt == "checkbox":
+        return BoolColumn()
+    if fmt in ("multi_select", "objects", "files"):
+        return ListColumn(fmt)
+    return CategoricalColumn(fmt or "text")
+
+def _accepts(column: Column, fmt: Optional[str]) -> bool:
+    """Можно ли записать значение формата fmt в колонку (текстовые форматы взаимозаменяемы)"""
+    if fmt == column.format:
+        return True
+    return column.kind == "categorical" and _new_column(fmt).kind == "categorical"
+
+def _property_items(obj: Any) -> Iterator[Tuple[str, Optional[str], Any]]:
+    """(ключ, формат, значение) свойств объекта: модель, LazyModel или dict"""
+    if isinstance(obj, dict):
+        for prop in obj.get("properties") or ():
+            fmt = prop.get("format")
+            yield prop["key"], fmt, prop.get(fmt) if fmt else None
+        return
+    value_attrs = models._PROPERTY_VALUE_CLASSES
+    for prop in obj.properties or ():
+        fmt = value_attrs.get(type(prop)) or getattr(prop, "format", None)
+        fmt = getattr(fmt, "value", fmt)
+        yield prop.key, fmt, getattr(prop, fmt, None) if fmt else None
+
+def _field(obj: Any, name: str) -> Any:
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+class ObjectTable:
+    """
+    Колоночное представление объектов.
+    
+    Вместо списка моделей хранит по колонке на свойство: number и date -
+    array('d'), checkbox - array('b'), select и текст - коды со словарем
+    значений, multi_select / objects / files - смещения и коды. Колонки
+    id, name и type есть всегда. Объекты добавляются потоком, модели
+    не сохраняются.
+    
+    numpy, pyarrow и pandas не обязательны (pip install anytype-sdk[columnar]),
+    без них доступны to_pydict и сами массивы колонок.
+    
+    Пример использования:
+    ```python
+    table = ObjectTable.from_objects(client.objects.iter_list(space_id, prefetch=True))
+    df = table.to_pandas()
+    df.groupby("status")["estimate"].sum()
+    ```
+    
+    Формат колонки определяется первым встреченным значением (или formats).
+    Значение другого формата у следующих объектов записывается пропуском,
+    кроме текстовых форматов (text, url, email, phone, select), которые
+    попадают в одну колонку; такие пропуски считаются в mismatches.
+    
+    Args:
+        keys: Собирать только эти свойства (None - все)
+        formats: Заранее известные колонки {ключ: формат} - одинаковый набор
+            и порядок колонок у таблиц разных страниц (по умолчанию и keys)
+    """
+    
+    def __init__(self, keys: Optional[Iterable[str]] = None, formats: Optional[Dict[str, str]] = None):
+        if keys is None and formats is not None:
+            keys = formats
+        self.keys = frozenset(keys) if keys is not None else None
+        self.num_rows = 0
+        self.ids: List[str] = []
+        # Ключ -> сколько значений пропущено из-за несовпадения формата
+        self.mismatches: Dict[str, int] = {}
+        self.columns: Dict[str, Column] = {
+            "name": CategoricalColumn("text"),
+            "type": CategoricalColumn("select"),
+        }
+        for key, fmt in (formats or {}).items():
+            self.columns.setdefault(key, _new_column(fmt))
+    
+    @classmethod
+    def from_objects(
+        cls,
+        objects: Iterable[Any],
+        keys: Optional[Iterable[str]] = None,
+        formats: Optional[Dict[str, str]] = None
+    ) -> 'ObjectTable':
+        """Таблица из объектов, страниц PaginatedResponse или их потока"""
+        table = cls(keys=keys, formats=formats)
+        table.extend(objects)
+        return table
+    
+    def extend(self, objects: Iterable[Any]):
+        if isinstance(objects, models.PaginatedResponse):
+            objects = objects.data
+        for obj in objects:
+            if isinstance(obj, models.PaginatedResponse):
+                self.extend(obj.data)
+            else:
+                self.append(obj)
+    
+    def append(self, obj: Any):
+        """Добавить строку для объекта (модель, LazyModel или dict из raw режима)"""
+        row = self.num_rows
+        self.ids.append(_field(obj, "id"))
+        obj_type = _field(obj, "type")
+        self.columns["type"].append(_field(obj_type, "key") if obj_type is not None else None)
+        self.columns["name"].append(_field(obj, "name"))
+        
+        filled = {"name", "type"}
+        for key, fmt, value in _property_items(obj):
+            if key in filled or (self.keys is not None and key not in self.keys):
+                continue
+            column = self.columns.get(key)
+            if column is None:
+                # Колонка появилась не с первой строки: добиваем пропусками
+                column = self.columns[key] = _new_column(fmt)
+                column.append_null(row)
+            if _accepts(column, fmt):
+                column.append(value)
+            else:
+                column.append_null()
+                self.mismatches[key] = self.mismatches.get(key, 0) + 1
+            filled.add(key)
+        
+        self.num_rows = row + 1
+        if len(filled) < len(self.columns):
+            for key, column in self.columns.items():
+                if key not in filled:
+                    column.append_null()
+    
+    def __len__(self) -> int:
+        return self.num_rows
+    
+    def column(self, key: str) -> Column:
+        return self.columns[key]
+    
+    __getitem__ = column
+    
+    @property
+    def column_names(self) -> List[str]:
+        return ["id", *self.columns]
+    
+    @property
+    def nbytes(self) -> int:
+        """Примерный объем данных колонок в байтах"""
+        return sum(len(i) for i in self.ids) + sum(c.nbytes for c in self.columns.values())
+    
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        """Колонки как списки Python значений"""
+        return {"id": list(self.ids), **{key: c.to_list() for key, c in self.columns.items()}}
+    
+    def to_arrow(self) -> Any:
+        """pyarrow.Table: date - timestamp[ms, UTC], select и текст - dictionary"""
+        pa = _require(pyarrow, "pyarrow")
+        arrays = [pa.array(self.ids, type=pa.string())]
+        arrays += [column.to_arrow() for column in self.columns.values()]
+        return pa.Table.from_arrays(arrays, names=self.column_names)
+    
+    def to_pandas(self) -> Any:
+        """pandas.DataFrame: select и текст - category, checkbox - boolean"""
+        pd = _require(pandas, "pandas")
+        data = {"id": pd.Series(self.ids, dtype=object)}
+        for key, column in self.columns.items():
+            data[key] = pd.Series(column.to_pandas()).reset_index(drop=True)
+        return pd.DataFrame(data)
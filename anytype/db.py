@@ -1,14 +1,34 @@
 from contextlib import contextmanager
-from typing import Optional, List, Dict, Any, Generator, Union
+from typing import Optional, List, Dict, Any, Generator, Union, TYPE_CHECKING
 from .client import AnytypeClient
+from .pool import ClientPool, default_pool
 from . import models
 
+if TYPE_CHECKING:
+    from .replica import Replica
+
 class AnytypeConnection:
-    """Класс, имитирующий подключение к базе данных"""
-    
-    def __init__(self, client: AnytypeClient, space_id: str):
+    """
+    Класс, имитирующий подключение к базе данных
+    
+    С replica поиск (ObjectsTable.find, QueryBuilder) выполняется по
+    локальной копии пространства, запись по-прежнему идет в API.
+    """
+    
+    def __init__(
+        self,
+        client: AnytypeClient,
+        space_id: str,
+        pool: Optional[ClientPool] = None,
+        replica: Optional['Replica'] = None
+    ):
+        if replica is not None and replica.space_id != space_id:
+            raise ValueError(f"Replica is for space {replica.space_id!r}, not {space_id!r}")
         self.client = client
         self.space_id = space_id
+        self.pool = pool
+        self.replica = replica
+        self._closed = False
         self._objects = None
         self._types = None
         self._properties = None
@@ -47,8 +67,15 @@ class AnytypeConnection:
         return QueryBuilder(self, type_key)
     
     def close(self):
-        """Закрыть соединение"""
-        self.client.close()
+        """Закрыть соединение (клиент из пула возвращается в пул)"""
+        # Повторный release уменьшил бы счетчик ссылок чужого соединения
+        if self._closed:
+            return
+        self._closed = True
+        if self.pool is not None:
+            self.pool.release(self.client)
+        else:
+            self.client.close()
 
 class ObjectsTable:
     """Таблица объектов - как таблица в БД"""
@@ -70,6 +97,20 @@ class ObjectsTable:
             object_id=object_id
         )
     
+    def get_many(
+        self,
+        object_ids,
+        format: Optional[str] = None,
+        concurrency: int = 8
+    ) -> models.ObjectsByIds:
+        """Получить много объектов по ID одним пакетом (found / missing)"""
+        return self.conn.client.objects.get_many(
+            space_id=self.conn.space_id,
+            object_ids=object_ids,
+            format=format,
+            concurrency=concurrency
+        )
+    
     def update(self, object_id: str, **kwargs) -> models.ObjectWithBody:
         """Обновить объект (UPDATE)"""
         return self.conn.client.objects.update(
@@ -85,11 +126,39 @@ class ObjectsTable:
             object_id=object_id
         )
     
+    def bulk_insert(self, items, concurrency: int = 8) -> models.BulkResponse:
+        """Вставить много объектов параллельно"""
+        return self.conn.client.objects.bulk_create(
+            space_id=self.conn.space_id,
+            items=items,
+            concurrency=concurrency
+        )
+    
+    def bulk_update(self, items, concurrency: int = 8) -> models.BulkResponse:
+        """Обновить много объектов параллельно"""
+        return self.conn.client.objects.bulk_update(
+            space_id=self.conn.space_id,
+            items=items,
+            concurrency=concurrency
+        )
+    
+    def bulk_delete(self, object_ids, concurrency: int = 8) -> models.BulkResponse:
+        """Удалить много объектов параллельно"""
+        return self.conn.client.objects.bulk_delete(
+            space_id=self.conn.space_id,
+            object_ids=object_ids,
+            concurrency=concurrency
+        )
+    
     def find(self, **filters) -> List[models.Object]:
         """Найти объекты по фильтрам (SELECT) - ИСПРАВЛЕНО"""
         # Извлекаем limit если есть
         limit = filters.pop('limit', 100)
         
+        if self.conn.replica is not None:
+            query = QueryBuilder(self.conn, None).filter(**filters)
+            return self.conn.replica.select(filters=query._filters, limit=limit)
+        
         # Конвертируем фильтры в правильный формат для API
         api_filters = {}
         for key, value in filters.items():
@@ -111,7 +180,7 @@ class ObjectsTable:
 class QueryBuilder:
     """Построитель запросов - исправленная версия"""
     
-    def __init__(self, conn: AnytypeConnection, type_key: str):
+    def __init__(self, conn: AnytypeConnection, type_key: Optional[str]):
         self.conn = conn
         self.type_key = type_key
         self._filters: List[Dict[str, Any]] = []
@@ -226,6 +295,16 @@ class QueryBuilder:
     
     def all(self) -> List[models.Object]:
         """Выполнить запрос и вернуть все результаты - ИСПРАВЛЕНО"""
+        if self.conn.replica is not None:
+            return self.conn.replica.select(
+                type_key=self.type_key,
+                filters=self._filters,
+                order_by=self._order_by,
+                direction=self._order_dir,
+                limit=self._limit,
+                offset=self._offset
+            )
+        
         filter_expr = self._build_filter_expression()
         
         # Создаем объект сортировки если нужно
@@ -254,6 +333,9 @@ class QueryBuilder:
     
     def count(self) -> int:
         """Вернуть количество результатов - ИСПРАВЛЕНО"""
+        if self.conn.replica is not None:
+            return self.conn.replica.count(type_key=self.type_key, filters=self._filters)
+        
         filter_expr = self._build_filter_expression()
         
         result = self.conn.client.search.search_in_space(
@@ -332,22 +414,38 @@ class TagsTable:
 
 # Фабрика подключений
 class AnytypeDatabase:
-    def __init__(self, api_key: str, base_url: str = "http://127.0.0.1:31009"):
+    """
+    Фабрика подключений к пространствам.
+    
+    Подключения берут клиент из пула (по умолчанию общего для процесса),
+    поэтому TCP соединения переживают отдельные connect().
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://127.0.0.1:31009",
+        pool: Optional[ClientPool] = None
+    ):
         self.api_key = api_key
         self.base_url = base_url
+        self.pool = pool if pool is not None else default_pool()
         self.client = None
     
     @contextmanager
-    def connect(self, space_id: str) -> Generator[AnytypeConnection, None, None]:
-        """Контекстный менеджер для подключения к пространству"""
-        client = AnytypeClient(api_key=self.api_key, base_url=self.base_url)
-        conn = AnytypeConnection(client, space_id)
+    def connect(
+        self,
+        space_id: str,
+        replica: Optional['Replica'] = None
+    ) -> Generator[AnytypeConnection, None, None]:
+        """Контекстный менеджер для подключения к пространству (поиск по replica, если задана)"""
+        conn = self.get_space(space_id, replica=replica)
         try:
             yield conn
         finally:
             conn.close()
     
-    def get_space(self, space_id: str) -> AnytypeConnection:
-        """Получить подключение к пространству (без контекстного менеджера)"""
-        client = AnytypeClient(api_key=self.api_key, base_url=self.base_url)
-        return AnytypeConnection(client, space_id)
\ No newline at end of file
+    def get_space(self, space_id: str, replica: Optional['Replica'] = None) -> AnytypeConnection:
+        """Получить подключение к пространству (без контекстного менеджера, закрыть через close)"""
+        client = self.pool.acquire(self.api_key, self.base_url)
+        return AnytypeConnection(client, space_id, pool=self.pool, replica=replica)
\ No newline at end of file
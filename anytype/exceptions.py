@@ -48,3 +48,10 @@ class ValidationError(AnytypeAPIError):
 class RateLimitError(AnytypeAPIError):
     """Превышен лимит запросов (429)"""
     pass
+
+class CommitError(AnytypeAPIError):
+    """Session.commit выполнен не полностью"""
+    
+    def __init__(self, message: str, report: Any = None):
+        super().__init__(message)
+        self.report = report
@@ -0,0 +1,311 @@
+import glob
+import gzip
+import json
+import os
+import time
+from functools import partial
+from typing import Optional, List, Dict, Any, Callable
+from pydantic import BaseModel
+from .client import AnytypeClient
+from .columnar import ObjectTable, _require
+from . import models
+from . import utils
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+EXPORT_FORMATS = ("ndjson", "ndjson.gz", "parquet")
+
+class ExportProgress(BaseModel):
+    """Состояние выгрузки; передается в progress после каждой страницы"""
+    
+    objects: int = 0
+    pages: int = 0
+    # Записано байт (для Parquet - в завершенных файлах)
+    bytes: int = 0
+    # Смещение следующей страницы ObjectsAPI.list
+    offset: int = 0
+    total: Optional[int] = None
+    elapsed: float = 0.0
+    # Объектов в секунду в текущем запуске (без учета выгруженного до возобновления)
+    rate: float = 0.0
+    resumed: bool = False
+
+def _detect_format(path: str) -> str:
+    if path.endswith(".gz"):
+        return "ndjson.gz"
+    if path.endswith(".parquet") or os.path.isdir(path):
+        return "parquet"
+    return "ndjson"
+
+def _object_id(obj: Any) -> str:
+    return obj["id"] if isinstance(obj, dict) else obj.id
+
+class _NDJSONWriter:
+    """NDJSON файл; в режиме gzip каждая страница - отдельный gzip member"""
+    
+    def __init__(self, path: str, compress: bool, size: int, dumps: Callable[[Any], bytes]):
+        self.compress = compress
+        self.dumps = dumps
+        if size and os.path.exists(path):
+            # Отбрасываем то, что записано после контрольной точки
+            self._file = open(path, "r+b")
+            self._file.truncate(size)
+            self._file.seek(size)
+        else:
+            self._file = open(path, "wb")
+        self.bytes = self._file.tell()
+    
+    def write(self, objects: List[Any]) -> bool:
+        lines = [
+            self.dumps(obj if isinstance(obj, dict) else obj.model_dump(mode="json", exclude_none=True))
+            for obj in objects
+        ]
+        data = b"\n".join(lines) + b"\n" if lines else b""
+        if self.compress and data:
+            data = gzip.compress(data, compresslevel=6)
+        self._file.write(data)
+        self._file.flush()
+        self.bytes += len(data)
+        return True
+    
+    def close(self):
+        self._file.close()
+
+class _ParquetWriter:
+    """
+    Каталог с файлами part-NNNNN.parquet: страница - row group, файл
+    закрывается каждые rows_per_file строк (это и есть контрольные точки)
+    """
+    
+    def __init__(
+        self,
+        directory: str,
+        part: int,
+        rows_per_file: int,
+        formats: Dict[str, str],
+        with_body: bool
+    ):
+        _require(pyarrow, "pyarrow")
+        self.directory = directory
+        self.part = part
+        self.rows_per_file = rows_per_file
+        self.formats = formats
+        self.with_body = with_body
+        os.makedirs(directory, exist_ok=True)
+        # Незавершенные файлы после контрольной точки пишутся заново
+        for name in glob.glob(os.path.join(directory, "part-*.parquet")):
+            if int(os.path.basename(name)[5:10]) >= part:
+                os.remove(name)
+        self.bytes = sum(os.path.getsize(name) for name in self._parts())
+        self._writer = None
+        self._rows = 0
+    
+    def _parts(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "part-*.parquet")))
+    
+    def write(self, objects: List[Any]) -> bool:
+        if not objects:
+            return False
+        table = ObjectTable.from_objects(objects, formats=self.formats).to_arrow()
+        if self.with_body:
+            bodies = [
+                obj.get("markdown") if isinstance(obj, dict) else getattr(obj, "markdown", None)
+                for obj in objects
+            ]
+            table = table.append_column("markdown", pyarrow.array(bodies, type=pyarrow.string()))
+        if self._writer is None:
+            self._path = os.path.join(self.directory, f"part-{self.part:05d}.parquet")
+            self._writer = pyarrow.parquet.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+        self._rows += len(objects)
+        if self._rows >= self.rows_per_file:
+            self._finish_part()
+            return True
+        return False
+    
+    def _finish_part(self):
+        self._writer.close()
+        self.bytes += os.path.getsize(self._path)
+        self._writer = None
+        self._rows = 0
+        self.part += 1
+    
+    def close(self):
+        if self._writer is not None:
+            self._finish_part()
+
+class SpaceExporter:
+    """
+    Потоковая выгрузка всех объектов пространства.
+    
+    Объекты читаются страницами ObjectsAPI.list и сразу пишутся на диск,
+    в памяти держится не больше двух страниц. После каждой записанной
+    страницы (для Parquet - после каждого файла) сохраняется контрольная
+    точка со смещением, и прерванную выгрузку можно продолжить.
+    
+    Форматы:
+        - ndjson: объект на строку
+        - ndjson.gz: то же в gzip (страница - отдельный gzip member)
+        - parquet: каталог part-NNNNN.parquet, страница - row group;
+          колонки по свойствам пространства (pip install anytype-sdk[columnar])
+    
+    Пример использования:
+    ```python
+    exporter = SpaceExporter(
+        client, space_id, "backup.ndjson.gz",
+        with_body=True,
+        progress=lambda p: print(f"{p.objects}/{p.total} {p.rate:.0f} obj/s")
+    )
+    exporter.run()   # после сбоя повторный run() продолжит с контрольной точки
+    ```
+    
+    Args:
+        client: Синхронный клиент
+        space_id: ID пространства
+        path: Файл (ndjson, ndjson.gz) или каталог (parquet)
+        format: Формат; по умолчанию по расширению path
+        with_body: Догружать markdown тела через ObjectsAPI.get (параллельно)
+        concurrency: Сколько тел загружать одновременно
+        page_size: Размер страницы ObjectsAPI.list
+        filters: Фильтры ObjectsAPI.list
+        checkpoint: Файл контрольной точки (по умолчанию path + ".checkpoint")
+        progress: Функция, вызываемая с ExportProgress после каждой страницы
+        rows_per_file: Строк в одном Parquet файле
+    """
+    
+    def __init__(
+        self,
+        client: AnytypeClient,
+        space_id: str,
+        path: str,
+        format: Optional[str] = None,
+        with_body: bool = False,
+        concurrency: int = 8,
+        page_size: int = utils.MAX_PAGE_SIZE,
+        filters: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[str] = None,
+        progress: Optional[Callable[[ExportProgress], None]] = None,
+        rows_per_file: int = 100_000
+    ):
+        self.client = client
+        self.space_id = space_id
+        self.path = path
+        self.format = format or _detect_format(path)
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format {self.format!r}, expected one of {EXPORT_FORMATS}")
+        self.with_body = with_body
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.filters = filters
+        self.checkpoint = checkpoint or f"{path.rstrip(os.sep)}.checkpoint"
+        self.progress = progress
+        self.rows_per_file = rows_per_file
+    
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.checkpoint, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("space_id") != self.space_id or state.get("format") != self.format:
+            return None
+        if self.format != "parquet" and (
+            not os.path.exists(self.path) or os.path.getsize(self.path) < state["bytes"]
+        ):
+            # Файл выгрузки пропал или обрезан - продолжать не с чего
+            return None
+        return state
+    
+    def _save_checkpoint(self, state: Dict[str, Any]):
+        tmp = f"{self.checkpoint}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.checkpoint)
+    
+    def _open_writer(self, state: Dict[str, Any]):
+        if self.format == "parquet":
+            formats = {
+                prop.key: prop.format.value
+                for prop in self.client.properties.iter_list(self.space_id)
+                if prop.key not in ("name", "type")
+            }
+            return _ParquetWriter(self.path, state["part"], self.rows_per_file, formats, self.with_body)
+        return _NDJSONWriter(
+            self.path, self.format == "ndjson.gz", state["bytes"], self.client.codec.dumps
+        )
+    
+    def _with_bodies(self, objects: List[models.Object]) -> List[Any]:
+        ids = [_object_id(obj) for obj in objects]
+        result = self.client.objects.get_many(self.space_id, ids, format="md", concurrency=self.concurrency)
+        if result.errors:
+            raise next(iter(result.errors.values()))
+        # Объект удален между list и get - пишем без тела
+        return [result.found.get(object_id, obj) for object_id, obj in zip(ids, objects)]
+    
+    def run(self, resume: bool = True) -> ExportProgress:
+        """
+        Выполнить выгрузку
+        
+        Args:
+            resume: Продолжить с контрольной точки, если она есть
+                (иначе выгрузка начинается заново)
+        """
+        started = time.monotonic()
+        state = self._load_checkpoint() if resume else None
+        progress = ExportProgress(resumed=state is not None)
+        if state is None:
+            state = {
+                "space_id": self.space_id,
+                "format": self.format,
+                "offset": 0,
+                "objects": 0,
+                "bytes": 0,
+                "part": 0,
+            }
+        progress.offset = state["offset"]
+        progress.objects = state["objects"]
+        exported = 0
+        
+        writer = self._open_writer(state)
+        try:
+            fetch = partial(self.client.objects.list, self.space_id, filters=self.filters)
+            for page in utils.iter_pages(fetch, page_size=self.page_size, offset=progress.offset, prefetch=True):
+                objects = utils._page_data(page)
+                if self.with_body and objects:
+                    objects = self._with_bodies(objects)
+                durable = writer.write(objects)
+                
+                exported += len(objects)
+                progress.objects += len(objects)
+                progress.pages += 1
+                progress.offset += len(utils._page_data(page))
+                progress.total = utils._page_total(page)
+                progress.bytes = writer.bytes
+                progress.elapsed = time.monotonic() - started
+                progress.rate = exported / progress.elapsed if progress.elapsed > 0 else 0.0
+                if durable:
+                    state.update(
+                        offset=progress.offset,
+                        objects=progress.objects,
+                        bytes=progress.bytes,
+                        part=getattr(writer, "part", 0)
+                    )
+                    self._save_checkpoint(state)
+                if self.progress is not None:
+                    self.progress(progress.model_copy())
+        finally:
+            writer.close()
+        
+        progress.bytes = writer.bytes
+        progress.elapsed = time.monotonic() - started
+        if os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        return progress
+
+def export_space(client: AnytypeClient, space_id: str, path: str, resume: bool = True, **options: Any) -> ExportProgress:
+    """Выгрузить пространство в path (параметры как у SpaceExporter)"""
+    return SpaceExporter(client, space_id, path, **options).run(resume=resume)
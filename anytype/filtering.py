@@ -0,0 +1,213 @@
+from datetime import date, datetime, timezone
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Union
+from . import models
+
+Predicate = Callable[[Any], bool]
+
+_MISSING = object()
+
+def _object_values(obj: Any) -> Dict[str, Any]:
+    """Значения свойств объекта {ключ: значение} (модель, LazyModel или dict)"""
+    if isinstance(obj, dict):
+        values = {}
+        for prop in obj.get("properties") or ():
+            fmt = prop.get("format")
+            values[prop["key"]] = prop.get(fmt) if fmt else None
+        values.setdefault("name", obj.get("name"))
+        obj_type = obj.get("type")
+        if obj_type:
+            values.setdefault("type", obj_type.get("key"))
+        return values
+    
+    values = {}
+    value_attrs = models._PROPERTY_VALUE_CLASSES
+    for prop in obj.properties or ():
+        attr = value_attrs.get(type(prop)) or getattr(prop, "format", None)
+        attr = getattr(attr, "value", attr)
+        values[prop.key] = getattr(prop, attr, None) if attr else None
+    # Заголовок и тип доступны как свойства name и type, как в фильтрах API
+    values.setdefault("name", obj.name)
+    if obj.type is not None:
+        values.setdefault("type", obj.type.key)
+    return values
+
+def _refs(value: Any) -> frozenset:
+    """Чем можно сослаться на значение: тег - по id, key и name, остальное - как есть"""
+    if isinstance(value, dict):
+        return frozenset(v for v in (value.get("id"), value.get("key"), value.get("name")) if v)
+    if hasattr(value, "id") and hasattr(value, "key"):
+        return frozenset(v for v in (value.id, value.key, getattr(value, "name", None)) if v)
+    return frozenset((value,))
+
+def _is_empty(value: Any) -> bool:
+    return value is _MISSING or value is None or value == "" or value == []
+
+def _parse_date(value: Any) -> Any:
+    """ISO строка -> datetime в UTC (строки без времени - date)"""
+    if isinstance(value, (datetime, date)) or not isinstance(value, str):
+        return value
+    text = value[:-1] + "+00:00" if value.endswith("Z") else value
+    try:
+        if len(text) == 10:
+            return date.fromisoformat(text)
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def _compare_dates(expected: Any) -> Callable[[Any], Any]:
+    """Приведение значения свойства к типу expected (date - сравнение по дням)"""
+    if isinstance(expected, datetime):
+        return _parse_date
+    
+    def to_date(value: Any) -> Any:
+        value = _parse_date(value)
+        return value.date() if isinstance(value, datetime) else value
+    
+    return to_date
+
+_ORDERING = {
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+}
+
+def _compile_condition(key: str, condition: str, fmt: Optional[str], expected: Any) -> Predicate:
+    """Условие над словарем значений объекта"""
+    if condition == "empty":
+        return lambda values: _is_empty(values.get(key, _MISSING))
+    if condition == "nempty":
+        return lambda values: not _is_empty(values.get(key, _MISSING))
+    
+    negate = condition in ("ne", "nin", "ncontains")
+    positive = {"ne": "eq", "nin": "in", "ncontains": "contains"}.get(condition, condition)
+    test = _compile_match(positive, fmt, expected)
+    
+    def check(values: Dict[str, Any]) -> bool:
+        value = values.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            # Отсутствующее значение не равно ничему
+            return negate
+        try:
+            return test(value) != negate
+        except TypeError:
+            # Несравнимые типы (число и строка) - условие не выполнено
+            return negate
+    
+    return check
+
+def _compile_match(condition: str, fmt: Optional[str], expected: Any) -> Callable[[Any], bool]:
+    """Проверка значения свойства (не None) без учета отрицания"""
+    if isinstance(expected, (list, tuple, set, frozenset)):
+        wanted = frozenset(expected)
+        
+        def refs(value: Any) -> List[frozenset]:
+            items = value if isinstance(value, list) else [value]
+            return [_refs(item) for item in items]
+        
+        if condition == "eq":
+            # Тот же набор значений, порядок не важен
+            def same(value: Any) -> bool:
+                items = refs(value)
+                return all(r & wanted for r in items) and all(any(w in r for r in items) for w in wanted)
+            
+            return same
+        if condition in ("all", "contains"):
+            return lambda value: all(any(w in r for r in refs(value)) for w in wanted)
+        # in: хотя бы одно совпадение
+        return lambda value: any(r & wanted for r in refs(value))
+    
+    if condition == "contains":
+        needle = str(expected).casefold()
+        
+        def contains(value: Any) -> bool:
+            if isinstance(value, list):
+                return any(expected in _refs(item) for item in value)
+            return needle in str(value).casefold()
+        
+        return contains
+    
+    if fmt == "date" or (fmt is None and isinstance(expected, str) and _parse_date(expected) != expected):
+        expected = _parse_date(expected)
+        convert = _compare_dates(expected)
+        if condition in _ORDERING:
+            order = _ORDERING[condition]
+            return lambda value: order(convert(value), expected)
+        return lambda value: convert(value) == expected
+    
+    if condition in _ORDERING:
+        order = _ORDERING[condition]
+        return lambda value: order(value, expected)
+    
+    # eq / in / all со скаляром: тег или элемент списка совпадает с expected
+    def equals(value: Any) -> bool:
+        if isinstance(value, list):
+            return any(expected in _refs(item) for item in value)
+        if isinstance(value, (str, int, float)):
+            return value == expected
+        # Тег (select) - модель или dict
+        return expected in _refs(value)
+    
+    return equals
+
+def _filter_parts(item: Any):
+    """(ключ, условие, формат, значение) для фильтра любой модели"""
+    key = item.property_key
+    condition = getattr(item.condition, "value", item.condition)
+    fmt = models._FILTER_CLASSES.get(type(item))
+    if fmt is not None and fmt != "empty":
+        return key, condition, fmt, getattr(item, fmt)
+    if isinstance(item, models.Filter):
+        item_fmt = getattr(item.format, "value", item.format)
+        return key, condition, item_fmt, item.value
+    return key, condition, None, None
+
+def _compile(expression: Any) -> Predicate:
+    """Предикат над словарем значений объекта"""
+    if isinstance(expression, models.FilterExpression):
+        parts = [_compile(item) for item in expression.conditions or ()]
+        parts += [_compile(sub) for sub in expression.filters or ()]
+        if not parts:
+            return lambda values: True
+        if len(parts) == 1:
+            return parts[0]
+        if expression.operator == models.FilterOperator.OR:
+            return lambda values: any(part(values) for part in parts)
+        return lambda values: all(part(values) for part in parts)
+    return _compile_condition(*_filter_parts(expression))
+
+FilterLike = Union[models.FilterExpression, models.FilterItem, models.Filter]
+
+def compile_filter(expression: Optional[FilterLike]) -> Predicate:
+    """
+    Скомпилировать FilterExpression (или отдельный фильтр) в предикат
+    над объектом.
+    
+    Семантика повторяет фильтры API: text contains - без учета регистра,
+    select/multi_select сравниваются по id, key или name тега, in -
+    хотя бы одно совпадение, all - все значения, даты без времени
+    сравниваются по дням. Отсутствующее свойство не выполняет
+    условий eq/gt/... и выполняет ne/nin/ncontains/empty.
+    
+    Пример использования:
+    ```python
+    expression = models.FilterExpression(
+        operator=models.FilterOperator.AND,
+        conditions=[models.NumberFilter(property_key="estimate", condition="gte", number=3)]
+    )
+    match = compile_filter(expression)
+    big = [obj for obj in replica.iter_objects("task") if match(obj)]
+    ```
+    """
+    if expression is None:
+        return lambda obj: True
+    test = _compile(expression)
+    return lambda obj: test(_object_values(obj))
+
+def filter_objects(objects: Iterable[Any], expression: Optional[FilterLike]) -> Iterator[Any]:
+    """Отфильтровать объекты локально, без запросов к API"""
+    match = compile_filter(expression)
+    return (obj for obj in objects if match(obj))
@@ -0,0 +1,198 @@
+import copy
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlencode
+import httpx
+
+class HTTPCacheEntry:
+    """Сохраненный ответ с валидаторами ETag / Last-Modified"""
+    
+    __slots__ = ("etag", "last_modified", "body")
+    
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+
+class MemoryHTTPCacheBackend:
+    """Бекенд HTTPCache в памяти процесса (LRU)"""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, HTTPCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[HTTPCacheEntry]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: HTTPCacheEntry):
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+class SQLiteHTTPCacheBackend:
+    """
+    Бекенд HTTPCache в SQLite файле, переживает перезапуск процесса.
+    
+    Args:
+        path: Путь к файлу базы (":memory:" для временной базы)
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                " key TEXT PRIMARY KEY,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " body BLOB NOT NULL,"
+                " stored_at REAL NOT NULL)"
+            )
+    
+    def get(self, key: str) -> Optional[HTTPCacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return HTTPCacheEntry(row[0], row[1], bytes(row[2]))
+    
+    def set(self, key: str, entry: HTTPCacheEntry):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?)",
+                (key, entry.etag, entry.last_modified, entry.body, time.time())
+            )
+    
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+    
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM http_cache")
+    
+    def close(self):
+        self._conn.close()
+
+class HTTPCache:
+    """
+    Ревалидирующий HTTP кеш для GET запросов.
+    
+    Для ответов с ETag или Last-Modified сохраняет тело и при следующем
+    запросе отправляет If-None-Match / If-Modified-Since. На 304 клиент
+    возвращает копию уже разобранного объекта из памяти, не скачивая тело
+    заново. Разобранные объекты держатся в памяти (parsed_size записей),
+    тела - в бекенде.
+    
+    Пример использования:
+    ```python
+    http_cache = HTTPCache(SQLiteHTTPCacheBackend("anytype-cache.sqlite"))
+    client = AnytypeClient(api_key="your-api-key", http_cache=http_cache)
+    page = client.objects.get(space_id, object_id, format="md")
+    ```
+    
+    Args:
+        backend: MemoryHTTPCacheBackend (по умолчанию) или SQLiteHTTPCacheBackend
+        parsed_size: Сколько разобранных ответов держать в памяти
+    """
+    
+    def __init__(self, backend: Optional[Any] = None, parsed_size: int = 256):
+        self.backend = backend if backend is not None else MemoryHTTPCacheBackend()
+        self.parsed_size = parsed_size
+        self._parsed: "OrderedDict[Tuple[str, Optional[str], Optional[str]], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def key(self, request: Dict[str, Any], api_key: Optional[str], unwrap: Optional[str]) -> str:
+        """Ключ записи; API ключ хранится только в виде хеша"""
+        key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+        params = urlencode(sorted((request.get("params") or {}).items()), doseq=True)
+        return f"{key_hash}|{request['url']}?{params}|{unwrap or ''}"
+    
+    def prepare(
+        self,
+        request: Dict[str, Any],
+        api_key: Optional[str],
+        unwrap: Optional[str]
+    ) -> Tuple[Optional[str], Optional[HTTPCacheEntry]]:
+        """Найти запись и добавить в запрос условные заголовки"""
+        if request["method"] != "GET":
+            return None, None
+        key = self.key(request, api_key, unwrap)
+        entry = self.backend.get(key)
+        if entry is not None:
+            headers = dict(request.get("headers") or {})
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            request["headers"] = headers
+        return key, entry
+    
+    def revalidated(self, key: str, entry: HTTPCacheEntry, parse) -> Any:
+        """Сервер ответил 304: вернуть разобранный объект из кеша"""
+        parsed_key = (key, entry.etag, entry.last_modified)
+        with self._lock:
+            self.hits += 1
+            cached = self._parsed.get(parsed_key)
+            if cached is not None:
+                self._parsed.move_to_end(parsed_key)
+        if cached is not None:
+            # Копия: изменения результата не должны попасть в кеш и к другим вызовам
+            return copy.deepcopy(cached)
+        result = parse(entry.body)
+        self._remember(parsed_key, result)
+        return result
+    
+    def store(self, key: str, response: httpx.Response, result: Any):
+        """Сохранить ответ 200 с валидаторами"""
+        with self._lock:
+            self.misses += 1
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+        entry = HTTPCacheEntry(etag, last_modified, response.content)
+        self.backend.set(key, entry)
+        self._remember((key, etag, last_modified), result)
+    
+    def _remember(self, parsed_key, result: Any):
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._parsed[parsed_key] = result
+            self._parsed.move_to_end(parsed_key)
+            while len(self._parsed) > self.parsed_size:
+                self._parsed.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._parsed.clear()
+        self.backend.clear()
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,202 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timezone
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Set, Tuple
+from . import models
+from .filtering import _object_values, _parse_date, _refs
+
+# Форматы с сортированным индексом (запросы по диапазону)
+_ORDERED_FORMATS = ("number", "date")
+
+# Больше любого ID объекта: граница для bisect по (значение, ID)
+_MAX_ID = "\uffff"
+
+def _sort_value(fmt: str, value: Any) -> Optional[float]:
+    """Число для сортированного индекса: number как есть, date - unix time"""
+    if fmt == "number":
+        return float(value)
+    parsed = _parse_date(value)
+    if isinstance(parsed, datetime):
+        return parsed.timestamp()
+    if isinstance(parsed, date):
+        return datetime(parsed.year, parsed.month, parsed.day, tzinfo=timezone.utc).timestamp()
+    return None
+
+def _property_formats(obj: models.Object) -> Dict[str, str]:
+    formats = {}
+    for prop in obj.properties or ():
+        fmt = models._PROPERTY_VALUE_CLASSES.get(type(prop)) or getattr(prop, "format", None)
+        fmt = getattr(fmt, "value", fmt)
+        if fmt is not None:
+            formats[prop.key] = fmt
+    return formats
+
+class ObjectIndex:
+    """
+    Вторичные индексы над загруженными объектами.
+    
+    - хеш индекс по каждому свойству: значение, тег (id, key или name),
+      элемент multi_select / objects -> объекты; тип объекта - свойство type
+    - сортированный индекс по number и date свойствам для запросов по диапазону
+    - обратные связи: кто ссылается на объект через свойства формата objects
+    
+    Объекты можно добавлять, обновлять и удалять по одному, индексы
+    меняются только для затронутого объекта. Индекс не потокобезопасен.
+    
+    Пример использования:
+    ```python
+    index = ObjectIndex(client.objects.iter_list(space_id))
+    tasks = index.by_type("task")
+    urgent = index.find("labels", "urgent")
+    soon = index.range("due_date", "2024-05-01", "2024-05-31")
+    blockers = index.referrers(task_id, key="blocked_by")
+    ```
+    
+    Args:
+        objects: Объекты для начальной загрузки
+        keys: Индексировать только эти свойства (None - все)
+    """
+    
+    def __init__(self, objects: Optional[Iterable[models.Object]] = None, keys: Optional[Iterable[str]] = None):
+        self.keys = frozenset(keys) if keys is not None else None
+        self._objects: Dict[str, models.Object] = {}
+        self._hash: Dict[str, Dict[Any, Set[str]]] = {}
+        self._sorted: Dict[str, List[Tuple[float, str]]] = {}
+        # ID цели -> ключ свойства -> ID ссылающихся объектов
+        self._reverse: Dict[str, Dict[str, Set[str]]] = {}
+        # Что добавлено в индексы для объекта, чтобы удалить без полного прохода
+        self._entries: Dict[str, List[Tuple[str, str, Any]]] = {}
+        if objects is not None:
+            self.add_many(objects)
+    
+    def add(self, obj: models.Object):
+        """Добавить объект или заменить ранее добавленный с тем же ID"""
+        if obj.id in self._objects:
+            self.remove(obj.id)
+        entries = []
+        formats = _property_formats(obj)
+        for key, value in _object_values(obj).items():
+            if value is None or (self.keys is not None and key not in self.keys):
+                continue
+            fmt = formats.get(key)
+            items = value if isinstance(value, list) else [value]
+            for item in items:
+                for ref in _refs(item):
+                    self._hash.setdefault(key, {}).setdefault(ref, set()).add(obj.id)
+                    entries.append(("hash", key, ref))
+            if fmt == "objects":
+                for target in value:
+                    self._reverse.setdefault(target, {}).setdefault(key, set()).add(obj.id)
+                    entries.append(("reverse", key, target))
+            elif fmt in _ORDERED_FORMATS:
+                sort_value = _sort_value(fmt, value)
+                if sort_value is not None:
+                    insort(self._sorted.setdefault(key, []), (sort_value, obj.id))
+                    entries.append(("sorted", key, sort_value))
+        self._objects[obj.id] = obj
+        # Повторы в objects / multi_select дают одинаковые записи - remove удаляет каждую один раз
+        self._entries[obj.id] = list(dict.fromkeys(entries))
+    
+    # Обновление - та же замена объекта
+    update = add
+    
+    def add_many(self, objects: Iterable[models.Object]):
+        for obj in objects:
+            self.add(obj)
+    
+    def remove(self, object_id: str) -> Optional[models.Object]:
+        """Удалить объект из индексов; возвращает удаленный объект или None"""
+        obj = self._objects.pop(object_id, None)
+        if obj is None:
+            return None
+        for kind, key, value in self._entries.pop(object_id):
+            if kind == "hash":
+                _discard(self._hash[key], value, object_id)
+                if not self._hash[key]:
+                    del self._hash[key]
+            elif kind == "reverse":
+                _discard(self._reverse[value], key, object_id)
+                if not self._reverse[value]:
+                    del self._reverse[value]
+            else:
+                entries = self._sorted[key]
+                i = bisect_left(entries, (value, object_id))
+                if i < len(entries) and entries[i] == (value, object_id):
+                    del entries[i]
+        return obj
+    
+    def get(self, object_id: str) -> Optional[models.Object]:
+        return self._objects.get(object_id)
+    
+    def find_ids(self, key: str, value: Any) -> Set[str]:
+        """ID объектов, у которых свойство key равно value (или содержит его)"""
+        return set(self._hash.get(key, {}).get(value, ()))
+    
+    def find(self, key: str, value: Any) -> List[models.Object]:
+        """Объекты по значению свойства, тегу (id, key или name) или ID связанного объекта"""
+        return self._resolve(self._hash.get(key, {}).get(value, ()))
+    
+    def by_type(self, type_key: str) -> List[models.Object]:
+        return self.find("type", type_key)
+    
+    def values(self, key: str) -> List[Any]:
+        """Все проиндексированные значения свойства key"""
+        return list(self._hash.get(key, {}))
+    
+    def range(
+        self,
+        key: str,
+        low: Any = None,
+        high: Any = None,
+        inclusive: Tuple[bool, bool] = (True, True)
+    ) -> List[models.Object]:
+        """
+        Объекты со значением number / date свойства в диапазоне [low, high],
+        в порядке возрастания значения
+        
+        Args:
+            low, high: Границы (число, ISO строка, date или datetime; None - без границы)
+            inclusive: Включать ли границы
+        """
+        entries = self._sorted.get(key, [])
+        start, end = 0, len(entries)
+        if low is not None:
+            bound = _bound(low)
+            start = bisect_left(entries, (bound,)) if inclusive[0] else bisect_right(entries, (bound, _MAX_ID))
+        if high is not None:
+            bound = _bound(high)
+            end = bisect_right(entries, (bound, _MAX_ID)) if inclusive[1] else bisect_left(entries, (bound,))
+        return [self._objects[object_id] for _, object_id in entries[start:end]]
+    
+    def referrers(self, object_id: str, key: Optional[str] = None) -> List[models.Object]:
+        """Объекты, которые ссылаются на object_id (через свойство key или любое)"""
+        by_key = self._reverse.get(object_id, {})
+        if key is not None:
+            return self._resolve(by_key.get(key, ()))
+        return self._resolve(set().union(*by_key.values()))
+    
+    def _resolve(self, ids: Iterable[str]) -> List[models.Object]:
+        return [self._objects[object_id] for object_id in sorted(ids)]
+    
+    def __len__(self) -> int:
+        return len(self._objects)
+    
+    def __contains__(self, object_id: object) -> bool:
+        return object_id in self._objects
+    
+    def __iter__(self) -> Iterator[models.Object]:
+        return iter(self._objects.values())
+
+def _bound(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    bound = _sort_value("date", value)
+    if bound is None:
+        raise ValueError(f"Unsupported range bound: {value!r}")
+    return bound
+
+def _discard(index: Dict[Any, Set[str]], value: Any, object_id: str):
+    ids = index.get(value)
+    if ids is not None:
+        ids.discard(object_id)
+        if not ids:
+            del index[value]
@@ -0,0 +1,132 @@
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Type, Union, Tuple
+from typing_extensions import get_args, get_origin
+from pydantic import BaseModel, TypeAdapter
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+else:  # pragma: no cover
+    UnionType = Union
+
+# Режимы разбора ответов
+RESPONSE_MODES = ("model", "lazy", "trusted", "raw")
+
+_adapters: Dict[Any, TypeAdapter] = {}
+_adapters_lock = threading.Lock()
+
+def _adapter(annotation: Any) -> TypeAdapter:
+    adapter = _adapters.get(annotation)
+    if adapter is None:
+        with _adapters_lock:
+            adapter = _adapters.get(annotation)
+            if adapter is None:
+                adapter = _adapters[annotation] = TypeAdapter(annotation)
+    return adapter
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+def _strip_optional(annotation: Any) -> Any:
+    """Optional[X] -> X, остальные аннотации без изменений"""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+@lru_cache(maxsize=None)
+def _field_kind(annotation: Any) -> Tuple[str, Any]:
+    """
+    Как обращаться с полем: ("model", cls), ("list", cls) для списков
+    моделей или ("value", annotation) для всего остального
+    """
+    annotation = _strip_optional(annotation)
+    if _is_model(annotation):
+        return "model", annotation
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        if args and _is_model(_strip_optional(args[0])):
+            return "list", _strip_optional(args[0])
+    return "value", annotation
+
+class LazyModel:
+    """
+    Ленивое представление ответа поверх сырого JSON.
+    
+    Поле валидируется по аннотации модели только при первом обращении,
+    вложенные модели и списки моделей тоже становятся ленивыми. Методы
+    модели (например Object.get_display_name) доступны как обычно.
+    
+    Attributes:
+        raw: Исходный словарь
+    """
+    
+    __slots__ = ("_model", "raw", "_values")
+    
+    def __init__(self, model: Type[BaseModel], raw: Dict[str, Any]):
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "raw", raw)
+        object.__setattr__(self, "_values", {})
+    
+    def __getattr__(self, name: str) -> Any:
+        values = self._values
+        if name in values:
+            return values[name]
+        field = self._model.model_fields.get(name)
+        if field is None:
+            attr = getattr(self._model, name)
+            if callable(attr):
+                return attr.__get__(self)
+            return attr
+        if name not in self.raw:
+            if field.is_required():
+                raise AttributeError(f"{self._model.__name__}.{name} отсутствует в ответе")
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = self._load(field.annotation, self.raw[name])
+        values[name] = value
+        return value
+    
+    def _load(self, annotation: Any, value: Any) -> Any:
+        if value is None:
+            return None
+        kind, target = _field_kind(annotation)
+        if kind == "model":
+            return LazyModel(target, value)
+        if kind == "list":
+            return [LazyModel(target, item) for item in value]
+        return _adapter(annotation).validate_python(value)
+    
+    def __setattr__(self, name: str, value: Any):
+        self._values[name] = value
+    
+    def to_model(self) -> BaseModel:
+        """Полностью провалидировать и вернуть обычную модель"""
+        return self._model.model_validate(self.raw)
+    
+    def __repr__(self) -> str:
+        return f"Lazy{self._model.__name__}({self.raw!r})"
+
+def construct(model: Type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """
+    Модель без валидации через model_construct (режим trusted).
+    
+    Собирается верхний уровень и поля-модели / списки моделей на один
+    уровень ниже (объект ответа, элементы data). Значения глубже
+    (свойства, иконки, enum, даты) остаются как в JSON.
+    """
+    values = {}
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+        if key not in data:
+            continue
+        value = data[key]
+        kind, target = _field_kind(field.annotation)
+        if kind == "model" and isinstance(value, dict):
+            value = target.model_construct(**value)
+        elif kind == "list" and isinstance(value, list):
+            value = [target.model_construct(**item) if isinstance(item, dict) else item for item in value]
+        values[name] = value
+    return model.model_construct(**values)
@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional, List, Union, Any, Literal, Generic, TypeVar, Dict
+from pydantic import BaseModel, Field, ConfigDict, field_validator, field_serializer, Discriminator
+from pydantic import Tag as UnionTag
+from typing import Optional, List, Union, Any, Literal, Generic, TypeVar, Dict, Tuple, Type
+from typing_extensions import Annotated
 from datetime import datetime
 from enum import Enum
 
@@ -121,7 +123,47 @@ class NamedIcon(BaseModel):
     name: str
     color: Optional[Color] = None
 
-Icon = Union[EmojiIcon, FileIcon, NamedIcon]
+def _union_tag(
+    value: Any,
+    formats: Tuple[str, ...],
+    value_fields: Dict[str, str],
+    classes: Dict[Type[BaseModel], str],
+    default: str
+) -> str:
+    """
+    Тег члена Union для Discriminator.
+    
+    Берется поле format, а если его нет или значение незнакомое - по
+    первому присутствующему полю со значением. Так pydantic валидирует
+    только один вариант вместо перебора всех членов Union.
+    """
+    if isinstance(value, dict):
+        fmt = value.get("format")
+        if isinstance(fmt, Enum):
+            fmt = fmt.value
+        if fmt in formats:
+            return fmt
+        for field, tag in value_fields.items():
+            if field in value:
+                return tag
+        return default
+    return classes.get(type(value), default)
+
+_ICON_FORMATS = tuple(f.value for f in IconFormat)
+_ICON_FIELDS = {"emoji": "emoji", "file": "file", "name": "icon"}
+_ICON_CLASSES = {EmojiIcon: "emoji", FileIcon: "file", NamedIcon: "icon"}
+
+def _icon_tag(value: Any) -> str:
+    return _union_tag(value, _ICON_FORMATS, _ICON_FIELDS, _ICON_CLASSES, "icon")
+
+Icon = Annotated[
+    Union[
+        Annotated[EmojiIcon, UnionTag("emoji")],
+        Annotated[FileIcon, UnionTag("file")],
+        Annotated[NamedIcon, UnionTag("icon")]
+    ],
+    Discriminator(_icon_tag)
+]
 
 # Property value models
 class TextPropertyValue(BaseModel):
@@ -219,18 +261,33 @@ class ObjectsPropertyValue(BaseModel):
     name: Optional[str] = None
     object: Optional[str] = None
 
-PropertyWithValue = Union[
-    TextPropertyValue,
-    NumberPropertyValue,
-    SelectPropertyValue,
-    MultiSelectPropertyValue,
-    DatePropertyValue,
-    FilesPropertyValue,
-    CheckboxPropertyValue,
-    UrlPropertyValue,
-    EmailPropertyValue,
-    PhonePropertyValue,
-    ObjectsPropertyValue
+_PROPERTY_VALUE_CLASSES = {
+    TextPropertyValue: "text",
+    NumberPropertyValue: "number",
+    SelectPropertyValue: "select",
+    MultiSelectPropertyValue: "multi_select",
+    DatePropertyValue: "date",
+    FilesPropertyValue: "files",
+    CheckboxPropertyValue: "checkbox",
+    UrlPropertyValue: "url",
+    EmailPropertyValue: "email",
+    PhonePropertyValue: "phone",
+    ObjectsPropertyValue: "objects",
+}
+_PROPERTY_FORMATS = tuple(f.value for f in PropertyFormat)
+# Поле со значением совпадает с названием формата
+_PROPERTY_VALUE_FIELDS = {fmt: fmt for fmt in _PROPERTY_FORMATS}
+
+def _property_value_tag(value: Any) -> str:
+    return _union_tag(
+        value, _PROPERTY_FORMATS, _PROPERTY_VALUE_FIELDS, _PROPERTY_VALUE_CLASSES, "text"
+    )
+
+PropertyWithValue = Annotated[
+    Union[tuple(
+        Annotated[cls, UnionTag(tag)] for cls, tag in _PROPERTY_VALUE_CLASSES.items()
+    )],
+    Discriminator(_property_value_tag)
 ]
 
 # Property link models for updates
@@ -292,6 +349,21 @@ PropertyLink = Union[
     ObjectsPropertyLink
 ]
 
+# Класс ссылки на свойство по формату (поле значения совпадает с форматом)
+_PROPERTY_LINK_CLASSES = {
+    "text": TextPropertyLink,
+    "number": NumberPropertyLink,
+    "select": SelectPropertyLink,
+    "multi_select": MultiSelectPropertyLink,
+    "date": DatePropertyLink,
+    "files": FilesPropertyLink,
+    "checkbox": CheckboxPropertyLink,
+    "url": UrlPropertyLink,
+    "email": EmailPropertyLink,
+    "phone": PhonePropertyLink,
+    "objects": ObjectsPropertyLink,
+}
+
 # Type model
 class Type(BaseModel):
     id: str
@@ -478,19 +550,31 @@ class EmptyFilter(BaseModel):
     property_key: str
     condition: FilterCondition
 
-FilterItem = Union[
-    TextFilter,
-    NumberFilter,
-    SelectFilter,
-    MultiSelectFilter,
-    DateFilter,
-    CheckboxFilter,
-    FilesFilter,
-    UrlFilter,
-    EmailFilter,
-    PhoneFilter,
-    ObjectsFilter,
-    EmptyFilter
+_FILTER_CLASSES = {
+    TextFilter: "text",
+    NumberFilter: "number",
+    SelectFilter: "select",
+    MultiSelectFilter: "multi_select",
+    DateFilter: "date",
+    CheckboxFilter: "checkbox",
+    FilesFilter: "files",
+    UrlFilter: "url",
+    EmailFilter: "email",
+    PhoneFilter: "phone",
+    ObjectsFilter: "objects",
+    EmptyFilter: "empty",
+}
+# У фильтров нет поля format, вариант определяется по полю со значением
+_FILTER_FIELDS = {tag: tag for tag in _FILTER_CLASSES.values() if tag != "empty"}
+
+def _filter_item_tag(value: Any) -> str:
+    return _union_tag(value, (), _FILTER_FIELDS, _FILTER_CLASSES, "empty")
+
+FilterItem = Annotated[
+    Union[tuple(
+        Annotated[cls, UnionTag(tag)] for cls, tag in _FILTER_CLASSES.items()
+    )],
+    Discriminator(_filter_item_tag)
 ]
 
 class FilterExpression(BaseModel):
@@ -513,6 +597,36 @@ class PaginatedResponse(BaseModel, Generic[T]):
     data: List[T]
     pagination: PaginationMeta
 
+class BulkResult(BaseModel):
+    """Результат одного элемента пакетной операции"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    index: int
+    ok: bool
+    result: Optional[Any] = None
+    error: Optional[Exception] = None
+
+class BulkResponse(BaseModel):
+    """Результаты пакетной операции в порядке входных элементов"""
+    
+    results: List[BulkResult]
+    
+    @property
+    def succeeded(self) -> List[BulkResult]:
+        return [r for r in self.results if r.ok]
+    
+    @property
+    def failed(self) -> List[BulkResult]:
+        return [r for r in self.results if not r.ok]
+
+class ObjectsByIds(BaseModel):
+    """Результат objects.get_many"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    found: Dict[str, Any]
+    missing: List[str]
+    errors: Dict[str, Exception] = {}
+
 class SearchRequest(BaseModel):
     query: Optional[str] = None
     types: Optional[List[str]] = None
@@ -541,6 +655,14 @@ class UpdateObjectRequest(BaseModel):
     icon: Optional[Icon] = None
     type_key: Optional[str] = None
     properties: Optional[List[PropertyLink]] = None
+    
+    @field_serializer("properties")
+    def _serialize_properties(self, properties: Optional[List[PropertyLink]]):
+        # Явно заданный None очищает свойство, поэтому null в ссылках сохраняется
+        # (запрос отправляется с exclude_none)
+        if properties is None:
+            return None
+        return [link.model_dump(mode="json", exclude_unset=True) for link in properties]
 
 class CreateSpaceRequest(BaseModel):
     name: str
@@ -1,21 +1,49 @@
+import time
 from contextlib import contextmanager
-from typing import Optional, List, Dict, Any, Type, TypeVar, Generic, Generator
-from datetime import datetime
-from pydantic import BaseModel
+from functools import partial
+from typing import Optional, List, Dict, Any, Type, TypeVar, Generic, Generator, Callable, Iterable
+from datetime import date, datetime
+from typing_extensions import get_args, get_origin
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from . import models
 from .db import AnytypeDatabase, AnytypeConnection
+from .pool import ClientPool
+from .exceptions import CommitError
 
 T = TypeVar('T', bound='Model')
 
+# Модели ORM по ключу типа, для загрузки связанных объектов
+_MODELS: Dict[str, Type['Model']] = {}
+
+# Кодеки по классу модели, строятся при первом использовании
+_CODECS: Dict[type, 'ModelCodec'] = {}
+
 class Model(BaseModel):
     """Базовый класс для всех моделей ORM"""
     
     id: Optional[str] = None
     space_id: Optional[str] = None
     
+    # ID связанных объектов (свойства формата objects) и загруженные связи
+    _relation_ids: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    _related: Dict[str, List['Model']] = PrivateAttr(default_factory=dict)
+    # Значения полей на момент загрузки или последнего commit (None - новый объект)
+    _snapshot: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
     class Meta:
         type_key: str = ""
         title_field: str = "name"  # Какое поле использовать как заголовок
+        # Форматы свойств {"поле": "select"}, если по аннотации их не определить
+        property_formats: Dict[str, str] = {}
+        # Ключи свойств {"поле": "ключ"}, если ключ не совпадает с именем поля
+        property_keys: Dict[str, str] = {}
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        type_key = getattr(cls.Meta, 'type_key', "")
+        if type_key:
+            _MODELS[type_key] = cls
     
     @classmethod
     def get_type_key(cls) -> str:
@@ -26,66 +54,110 @@ class Model(BaseModel):
         """Возвращает название поля для заголовка объекта"""
         return getattr(cls.Meta, 'title_field', 'name')
     
+    @classmethod
+    def codec(cls) -> 'ModelCodec':
+        """Кодек полей модели в свойства Anytype (кешируется на класс)"""
+        codec = _CODECS.get(cls)
+        if codec is None:
+            codec = _CODECS[cls] = ModelCodec(cls)
+        return codec
+    
     @classmethod
     def from_anytype_object(cls, obj: models.Object) -> 'Model':
         """Создать модель из Anytype объекта"""
-        data = {"id": obj.id, "space_id": obj.space_id}
-        
-        # Маппинг свойств Anytype на атрибуты модели
-        if obj.properties:
-            for prop in obj.properties:
-                if hasattr(prop, 'text') and prop.text is not None:
-                    data[prop.key] = prop.text
-                elif hasattr(prop, 'number') and prop.number is not None:
-                    data[prop.key] = prop.number
-                elif hasattr(prop, 'checkbox') and prop.checkbox is not None:
-                    data[prop.key] = prop.checkbox
-                elif hasattr(prop, 'date') and prop.date is not None:
-                    data[prop.key] = prop.date
-                elif hasattr(prop, 'select') and prop.select is not None:
-                    data[prop.key] = prop.select
-                elif hasattr(prop, 'multi_select') and prop.multi_select is not None:
-                    data[prop.key] = prop.multi_select
-                elif hasattr(prop, 'url') and prop.url is not None:
-                    data[prop.key] = prop.url
-                elif hasattr(prop, 'email') and prop.email is not None:
-                    data[prop.key] = prop.email
-                elif hasattr(prop, 'phone') and prop.phone is not None:
-                    data[prop.key] = prop.phone
-                elif hasattr(prop, 'files') and prop.files is not None:
-                    data[prop.key] = prop.files
-                elif hasattr(prop, 'objects') and prop.objects is not None:
-                    data[prop.key] = prop.objects
+        data, relation_ids = cls.codec().decode(obj)
+        instance = cls(**data)
+        instance._relation_ids = relation_ids
+        instance.mark_clean()
+        return instance
+    
+    def mark_clean(self):
+        """Запомнить текущие значения полей как сохраненные"""
+        self._snapshot = self.model_dump(exclude={'id', 'space_id'})
+    
+    def changed_fields(self) -> Dict[str, Any]:
+        """Поля, измененные после загрузки или последнего commit"""
+        if self._snapshot is None:
+            return {}
+        current = self.model_dump(exclude={'id', 'space_id'})
+        return {
+            key: value for key, value in current.items()
+            if key not in self._snapshot or self._snapshot[key] != value
+        }
+    
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self.changed_fields())
+    
+    def to_update_request(self, fields: Optional[Dict[str, Any]] = None) -> models.UpdateObjectRequest:
+        """
+        Запрос на обновление только измененных полей
         
-        # Название объекта может быть в разных полях
-        if hasattr(obj, 'name') and obj.name:
-            data['name'] = obj.name
-        elif hasattr(obj, 'title') and obj.title:
-            data['title'] = obj.title
-        elif hasattr(obj, 'display_name') and obj.display_name:
-            data['display_name'] = obj.display_name
+        Поле заголовка уходит в name запроса, остальные - свойствами.
+        Очищенные (None) поля отправляются пустым значением свойства.
         
-        return cls(**data)
+        Raises:
+            ValueError: Формат очищенного поля неизвестен (нет аннотации)
+        """
+        fields = self.changed_fields() if fields is None else fields
+        title_field = self.get_title_field()
+        request = {}
+        properties = []
+        for key in fields:
+            # Связи берем из атрибута: в model_dump модели превращаются в словари
+            value = getattr(self, key, fields[key])
+            if key == title_field:
+                request["name"] = value if value is not None else ""
+            elif value is not None:
+                link = self.codec().link(key, value, key in self._relation_ids)
+                if link is not None:
+                    properties.append(link)
+            else:
+                properties.append(self.codec().clear(key, key in self._relation_ids))
+        if properties:
+            request["properties"] = properties
+        return models.UpdateObjectRequest(**request)
+    
+    def to_create_request(self) -> models.CreateObjectRequest:
+        """Запрос на создание без связей (связи отправляются после создания)"""
+        properties = self.to_properties(exclude=self.relation_fields())
+        return models.CreateObjectRequest(
+            type_key=self.get_type_key(),
+            name=getattr(self, self.get_title_field(), None),
+            properties=properties or None
+        )
+    
+    def relation_fields(self) -> Dict[str, List['Model']]:
+        """Поля, значения которых - модели ORM (связи с другими объектами)"""
+        relations = {}
+        for key in type(self).model_fields:
+            value = getattr(self, key, None)
+            if isinstance(value, Model):
+                relations[key] = [value]
+            elif isinstance(value, list) and value and all(isinstance(v, Model) for v in value):
+                relations[key] = list(value)
+        return relations
+    
+    def relation_ids(self, key: str) -> List[str]:
+        """ID объектов в связи key"""
+        if key in self._relation_ids:
+            return self._relation_ids[key]
+        value = getattr(self, key, None)
+        if isinstance(value, str):
+            return [value]
+        if isinstance(value, list):
+            return [v for v in value if isinstance(v, str)]
+        return []
     
-    def to_properties(self) -> List[models.PropertyLink]:
+    def related(self, key: str) -> List['Model']:
+        """Связанные объекты, загруженные через Query.prefetch"""
+        if key not in self._related:
+            raise KeyError(f"Relation {key!r} was not prefetched")
+        return self._related[key]
+    
+    def to_properties(self, exclude: Iterable[str] = ()) -> List[models.PropertyLink]:
         """Преобразовать модель в список свойств для Anytype"""
-        properties = []
-        
-        for key, value in self.model_dump(exclude={'id', 'space_id'}).items():
-            if value is not None and key != self.get_title_field():
-                if isinstance(value, str):
-                    properties.append(models.TextPropertyLink(key=key, text=value))
-                elif isinstance(value, (int, float)):
-                    properties.append(models.NumberPropertyLink(key=key, number=value))
-                elif isinstance(value, bool):
-                    properties.append(models.CheckboxPropertyLink(key=key, checkbox=value))
-                elif isinstance(value, datetime):
-                    properties.append(models.DatePropertyLink(key=key, date=value.isoformat()))
-                elif isinstance(value, list):
-                    # Предполагаем, что это multi_select
-                    properties.append(models.MultiSelectPropertyLink(key=key, multi_select=value))
-        
-        return properties
+        return self.codec().encode(self, exclude)
     
     def to_create_payload(self) -> Dict[str, Any]:
         """Создает payload для создания объекта в API"""
@@ -102,24 +174,225 @@ class Model(BaseModel):
         # Добавляем свойства
         properties = self.to_properties()
         if properties:
-            # Преобразуем список свойств в нужный формат
             payload["properties"] = [
-                {"key": p.key, "value": p.text if hasattr(p, 'text') else 
-                                  p.number if hasattr(p, 'number') else
-                                  p.checkbox if hasattr(p, 'checkbox') else
-                                  p.date if hasattr(p, 'date') else
-                                  p.multi_select if hasattr(p, 'multi_select') else
-                                  p.select if hasattr(p, 'select') else
-                                  p.url if hasattr(p, 'url') else
-                                  p.email if hasattr(p, 'email') else
-                                  p.phone if hasattr(p, 'phone') else
-                                  p.files if hasattr(p, 'files') else
-                                  p.objects if hasattr(p, 'objects') else None}
-                for p in properties
+                {"key": link.key, "value": getattr(link, _link_format(link))}
+                for link in properties
             ]
         
         return payload
 
+def _link_format(link: BaseModel) -> str:
+    return next(name for name in type(link).model_fields if name != "key")
+
+def _strip_optional(annotation: Any) -> Any:
+    args = get_args(annotation)
+    if args and type(None) in args:
+        rest = [a for a in args if a is not type(None)]
+        if len(rest) == 1:
+            return rest[0]
+    return annotation
+
+def _is_model_class(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, Model)
+
+def _annotation_format(annotation: Any) -> Optional[str]:
+    """Формат свойства по аннотации поля или None, если нужно смотреть на значение"""
+    annotation = _strip_optional(annotation)
+    if annotation is bool:
+        return "checkbox"
+    if annotation in (int, float):
+        return "number"
+    if annotation is str:
+        return "text"
+    if annotation in (datetime, date):
+        return "date"
+    if _is_model_class(annotation):
+        return "objects"
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        item = _strip_optional(args[0]) if args else None
+        if _is_model_class(item):
+            return "objects"
+        if item is str:
+            return "multi_select"
+    return None
+
+def _decode_kind(annotation: Any) -> Optional[str]:
+    """
+    Как записывать значение свойства в поле при загрузке:
+    "relation" - поле-связь с моделями (заполняется только ID в _relation_ids),
+    "ref" - str / List[str] (теги превращаются в ID), None - как есть
+    """
+    annotation = _strip_optional(annotation)
+    if _is_model_class(annotation):
+        return "relation"
+    item = annotation
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        item = _strip_optional(args[0]) if args else None
+        if _is_model_class(item):
+            return "relation"
+    return "ref" if item is str else None
+
+def _value_format(value: Any) -> Optional[str]:
+    """Формат свойства по значению (для полей без точной аннотации)"""
+    # bool - подкласс int, поэтому проверяется первым
+    if isinstance(value, bool):
+        return "checkbox"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "text"
+    if isinstance(value, (datetime, date)):
+        return "date"
+    if isinstance(value, Model):
+        return "objects"
+    if isinstance(value, list):
+        if value and all(isinstance(v, Model) for v in value):
+            return "objects"
+        # Предполагаем, что это multi_select
+        return "multi_select"
+    return None
+
+def _ref(value: Any) -> Any:
+    """ID модели или тега, строки как есть"""
+    return getattr(value, "id", value)
+
+# Форматы, значения которых нужно приводить перед отправкой
+_ENCODED_FORMATS = frozenset({"date", "objects", "multi_select", "files", "select"})
+
+_LINK_VALIDATORS = {
+    fmt: cls.__pydantic_validator__ for fmt, cls in models._PROPERTY_LINK_CLASSES.items()
+}
+
+def _encode_value(fmt: str, value: Any) -> Any:
+    if fmt == "date":
+        return value.isoformat() if isinstance(value, (datetime, date)) else value
+    if fmt in ("objects", "multi_select", "files"):
+        values = value if isinstance(value, list) else [value]
+        return [_ref(v) for v in values]
+    if fmt == "select":
+        return _ref(value)
+    return value
+
+class ModelCodec:
+    """
+    Преобразование полей модели в свойства Anytype и обратно.
+    
+    Формат каждого поля определяется один раз по Meta.property_formats
+    или аннотации; значение на каждом объекте проверяется только для
+    полей без точной аннотации (Any, Union).
+    """
+    
+    def __init__(self, model_class: Type[Model]):
+        self.model_class = model_class
+        self.title_field = model_class.get_title_field()
+        overrides = getattr(model_class.Meta, 'property_formats', {}) or {}
+        keys = getattr(model_class.Meta, 'property_keys', {}) or {}
+        self.formats: Dict[str, Optional[str]] = {}
+        self.keys: Dict[str, str] = {}
+        self.decode_kinds: Dict[str, Optional[str]] = {}
+        for name, field in model_class.model_fields.items():
+            if name in ('id', 'space_id'):
+                continue
+            self.formats[name] = overrides.get(name) or _annotation_format(field.annotation)
+            self.keys[name] = keys.get(name, name)
+            self.decode_kinds[name] = _decode_kind(field.annotation)
+        # Поле модели по ключу свойства
+        self.fields = {key: name for name, key in self.keys.items()}
+        self.accepts_extra = model_class.model_config.get("extra") == "allow"
+        self.value_attrs = models._PROPERTY_VALUE_CLASSES
+        # Поля для encode без заголовка: (поле, ключ, формат или None)
+        self._encoded = [
+            (name, self.keys[name], fmt)
+            for name, fmt in self.formats.items() if name != self.title_field
+        ]
+    
+    def decode(self, obj: models.Object):
+        """
+        Данные для модели и ID связей из объекта API
+        
+        Поля-связи с моделями (Project, List[Project]) не заполняются:
+        ID связанных объектов доступны через relation_ids, объекты - через
+        Query.prefetch. Теги в полях str / List[str] становятся ID тегов,
+        которые encode отправляет обратно без изменений.
+        """
+        data = {"id": obj.id, "space_id": obj.space_id}
+        relation_ids = {}
+        fields, accepts_extra, value_attrs = self.fields, self.accepts_extra, self.value_attrs
+        kinds = self.decode_kinds
+        
+        for prop in obj.properties or ():
+            attr = value_attrs.get(type(prop))
+            if attr is None:
+                continue
+            value = getattr(prop, attr)
+            if value is None:
+                continue
+            name = fields.get(prop.key)
+            if attr == "objects" and value:
+                relation_ids[name or prop.key] = list(value)
+            if name is not None:
+                kind = kinds.get(name)
+                if kind == "relation":
+                    continue
+                if kind == "ref" and attr in ("select", "multi_select"):
+                    value = [_ref(v) for v in value] if isinstance(value, list) else _ref(value)
+                data[name] = value
+            elif accepts_extra:
+                data[prop.key] = value
+        
+        # Название объекта может быть в разных полях
+        if obj.name:
+            data['name'] = obj.name
+        elif obj.title:
+            data['title'] = obj.title
+        elif obj.display_name:
+            data['display_name'] = obj.display_name
+        return data, relation_ids
+    
+    def link(self, name: str, value: Any, relation: bool = False) -> Optional[models.PropertyLink]:
+        """Свойство для значения поля name (relation - поле загружено из связи)"""
+        key = self.keys.get(name, name)
+        fmt = self.formats.get(name) or ("objects" if relation else _value_format(value))
+        if fmt is None:
+            return None
+        if fmt in _ENCODED_FORMATS:
+            value = _encode_value(fmt, value)
+        # Валидатор напрямую, без накладных расходов BaseModel.__init__
+        return _LINK_VALIDATORS[fmt].validate_python({"key": key, fmt: value})
+    
+    def clear(self, name: str, relation: bool = False) -> models.PropertyLink:
+        """Свойство, очищающее значение поля name (списки - [], остальное - null)"""
+        fmt = self.formats.get(name) or ("objects" if relation else None)
+        if fmt is None:
+            raise ValueError(
+                f"Cannot clear {self.model_class.__name__}.{name}: property format is unknown, "
+                f"set Meta.property_formats"
+            )
+        value = [] if fmt in ("objects", "multi_select", "files") else None
+        return _LINK_VALIDATORS[fmt].validate_python({"key": self.keys.get(name, name), fmt: value})
+    
+    def encode(self, model: Model, exclude: Iterable[str] = ()) -> List[models.PropertyLink]:
+        """Свойства для всех заполненных полей, кроме заголовка и exclude"""
+        values = model.__dict__
+        relations = model._relation_ids
+        link = self.link
+        properties = []
+        for name, key, fmt in self._encoded:
+            value = values.get(name)
+            if value is None or (exclude and name in exclude):
+                continue
+            if fmt is None:
+                prop = link(name, value, name in relations)
+                if prop is not None:
+                    properties.append(prop)
+            else:
+                if fmt in _ENCODED_FORMATS:
+                    value = _encode_value(fmt, value)
+                properties.append(_LINK_VALIDATORS[fmt].validate_python({"key": key, fmt: value}))
+        return properties
+
 class Page(Model):
     """Модель для страницы"""
     
@@ -148,63 +421,318 @@ class Task(Model):
         type_key = "task"
         title_field = "name"  # Пробуем name сначала
 
+class RelatedObject(Model):
+    """Связанный объект типа, для которого нет своей модели"""
+    model_config = ConfigDict(extra="allow")
+    
+    name: Optional[str] = None
+    type_key: Optional[str] = None
+
+def _hydrate(obj: models.Object) -> Model:
+    """Модель ORM для объекта по его типу"""
+    type_key = obj.type.key if obj.type else None
+    model_class = _MODELS.get(type_key)
+    if model_class is None:
+        instance = RelatedObject.from_anytype_object(obj)
+        instance.type_key = type_key
+        # type_key известен из объекта, а не изменен: иначе commit отправит его свойством
+        instance.mark_clean()
+        return instance
+    return model_class.from_anytype_object(obj)
+
+class CommitEntry(BaseModel):
+    """Результат одной операции commit"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    operation: str
+    object_id: Optional[str] = None
+    model: Any = None
+    ok: bool
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+class CommitReport(BaseModel):
+    """Отчет Session.commit: операции по шагам и время выполнения"""
+    
+    entries: List[CommitEntry] = []
+    rolled_back: List[str] = []
+    elapsed: float = 0.0
+    
+    def _ids(self, operation: str) -> List[str]:
+        return [e.object_id for e in self.entries if e.operation == operation and e.ok]
+    
+    @property
+    def created(self) -> List[str]:
+        return self._ids("create")
+    
+    @property
+    def updated(self) -> List[str]:
+        return self._ids("update")
+    
+    @property
+    def deleted(self) -> List[str]:
+        return self._ids("delete")
+    
+    @property
+    def failed(self) -> List[CommitEntry]:
+        return [e for e in self.entries if not e.ok]
+
 class Session:
-    """Сессия для работы с Anytype как с ORM"""
+    """
+    Сессия для работы с Anytype как с ORM
+    
+    Загруженные объекты хранятся в карте идентичности: повторный get
+    того же ID отдается из памяти, а запросы возвращают те же экземпляры.
+    commit() отправляет по одному PATCH на каждый измененный объект
+    только с измененными полями, запросы выполняются параллельно.
+    """
     
-    def __init__(self, conn: AnytypeConnection):
+    def __init__(self, conn: AnytypeConnection, concurrency: int = 8):
         self.conn = conn
+        self.concurrency = concurrency
         self._new_objects = []
-        self._dirty_objects = []
+        self._deleted = []
+        self._identity: Dict[str, Model] = {}
     
     def add(self, model: Model):
-        """Добавить объект для создания"""
-        self._new_objects.append(model)
+        """Добавить объект: новый - для создания, загруженный - для отслеживания"""
+        if model.id is None:
+            self._new_objects.append(model)
+        else:
+            self._track(model)
+    
+    def _track(self, model: Model) -> Model:
+        """Зарегистрировать объект в карте идентичности, вернуть экземпляр сессии"""
+        if model.id is None:
+            return model
+        return self._identity.setdefault(model.id, model)
     
     def get(self, model_class: Type[T], id: str) -> Optional[T]:
-        """Получить объект по ID"""
+        """Получить объект по ID (из карты идентичности, если уже загружен)"""
+        known = self._identity.get(id)
+        if known is not None:
+            return known if isinstance(known, model_class) else None
         obj = self.conn.objects.get(id)
         if obj and obj.type and obj.type.key == model_class.get_type_key():
-            return model_class.from_anytype_object(obj)
+            return self._track(model_class.from_anytype_object(obj))
         return None
     
+    def get_many(self, model_class: Type[T], ids: List[str]) -> Dict[str, T]:
+        """
+        Получить объекты по списку ID одним пакетом
+        
+        Уже загруженные объекты берутся из карты идентичности. Отсутствующие
+        объекты и объекты другого типа в результат не попадают.
+        """
+        found = {}
+        to_fetch = []
+        for object_id in ids:
+            known = self._identity.get(object_id)
+            if known is None:
+                to_fetch.append(object_id)
+            elif isinstance(known, model_class):
+                found[object_id] = known
+        if not to_fetch:
+            return found
+        
+        result = self.conn.objects.get_many(to_fetch)
+        if result.errors:
+            raise next(iter(result.errors.values()))
+        type_key = model_class.get_type_key()
+        for object_id, obj in result.found.items():
+            if obj.type and obj.type.key == type_key:
+                found[object_id] = self._track(model_class.from_anytype_object(obj))
+        return found
+    
+    @property
+    def dirty(self) -> List[Model]:
+        """Загруженные объекты с несохраненными изменениями"""
+        return [model for model in self._identity.values() if model.is_dirty]
+    
     def query(self, model_class: Type[T]) -> 'Query[T]':
         """Создать запрос для модели"""
-        return Query(self.conn, model_class)
+        return Query(self.conn, model_class, track=self._track)
+    
+    def delete(self, model: Model):
+        """Удалить (архивировать) объект при следующем commit"""
+        if model.id is None:
+            if model in self._new_objects:
+                self._new_objects.remove(model)
+            return
+        self._deleted.append(model)
     
-    def commit(self):
-        """Сохранить все изменения"""
+    def commit(self, rollback: bool = True) -> 'CommitReport':
+        """
+        Сохранить все изменения
+        
+        Сначала все запросы собираются и валидируются, до первого обращения
+        к API. Затем по шагам, внутри шага параллельно:
+            1. создание новых объектов (без связей);
+            2. PATCH измененных объектов и связей новых объектов, когда
+               у всех участников связи уже есть ID;
+            3. удаление.
+        
+        Если шаг завершился с ошибками (или commit прерван любым исключением)
+        и rollback=True, созданные в этом commit объекты архивируются, а у
+        моделей сбрасывается ID.
+        
+        Returns:
+            CommitReport с результатом и временем каждой операции
+        
+        Raises:
+            ValueError: Связь указывает на несохраненный объект вне сессии
+            CommitError: Часть операций не выполнена (отчет в error.report)
+        """
+        started = time.perf_counter()
+        report = CommitReport()
+        creates, updates, deletes = self._plan_commit()
+        created: List[Model] = []
+        
+        try:
+            self._run_step(report, "create", creates, self._send_create)
+            created = [model for model, _ in creates if model.id is not None]
+            for model in created:
+                self._track(model)
+            self._raise_failed(report, "create")
+            
+            # Связи новых объектов и изменения загруженных - после создания
+            patches = [
+                (model, model.to_update_request(fields))
+                for model, fields in updates + [
+                    (model, {key: None for key in model.relation_fields()})
+                    for model, _ in creates
+                ]
+                if fields
+            ]
+            self._run_step(report, "update", patches, self._send_update)
+            self._raise_failed(report, "update")
+            
+            self._run_step(report, "delete", [(model, None) for model in deletes], self._send_delete)
+            self._raise_failed(report, "delete")
+        except Exception:
+            if rollback and created:
+                self._rollback(report, created)
+            raise
+        finally:
+            report.elapsed = time.perf_counter() - started
+            self._finish_commit(report)
+        return report
+    
+    def _plan_commit(self):
+        """Собрать и провалидировать запросы до отправки"""
+        pending = {id(model) for model in self._new_objects}
+        
+        def check_relations(model: Model):
+            for key, targets in model.relation_fields().items():
+                for target in targets:
+                    if target.id is None and id(target) not in pending:
+                        raise ValueError(
+                            f"{type(model).__name__}.{key} refers to an unsaved object "
+                            f"that was not added to the session"
+                        )
+        
+        creates = []
         for model in self._new_objects:
-            # Используем прямой API клиент для создания
-            # с правильным форматом данных
+            check_relations(model)
+            creates.append((model, model.to_create_request()))
+        
+        deletes = [model for model in self._deleted if model.id is not None]
+        deleting = {id(model) for model in deletes}
+        
+        updates = []
+        for model in self._identity.values():
+            fields = model.changed_fields()
+            if fields and id(model) not in deleting:
+                check_relations(model)
+                # ID новых связанных объектов появятся позже, проверяем остальное
+                relations = model.relation_fields()
+                model.to_update_request({k: v for k, v in fields.items() if k not in relations})
+                updates.append((model, fields))
+        return creates, updates, deletes
+    
+    def _run_step(self, report: 'CommitReport', operation: str, items, send):
+        """Выполнить операции шага параллельно, записав время каждой"""
+        entries: List[Optional[CommitEntry]] = [None] * len(items)
+        
+        def run(index: int, model: Model, request: Any):
+            started = time.perf_counter()
             try:
-                # Пробуем создать через objects.insert
-                result = self.conn.objects.insert(
-                    type_key=model.get_type_key(),
-                    **{model.get_title_field(): getattr(model, model.get_title_field(), None)}
-                )
-                
-                # Если объект создан, обновляем его ID
-                if hasattr(result, 'id'):
-                    model.id = result.id
-                    
+                send(model, request)
             except Exception as e:
-                # Если не получилось, пробуем через прямой API
-                import httpx
-                headers = {"Authorization": f"Bearer {self.conn.client.api_key}"}
-                
-                payload = model.to_create_payload()
-                
-                with httpx.Client(base_url=self.conn.client.base_url, headers=headers) as client:
-                    response = client.post(f"/v1/spaces/{self.conn.space_id}/objects", json=payload)
-                    if response.status_code in [200, 201]:
-                        data = response.json()
-                        if 'object' in data and 'id' in data['object']:
-                            model.id = data['object']['id']
-                    else:
-                        raise Exception(f"Failed to create object: {response.text}")
+                error = e
+            else:
+                error = None
+            entries[index] = CommitEntry(
+                operation=operation,
+                object_id=model.id,
+                model=model,
+                ok=error is None,
+                error=error,
+                elapsed=time.perf_counter() - started
+            )
         
-        self._new_objects.clear()
-        self._dirty_objects.clear()
+        self.conn.client._run_concurrent(
+            (partial(run, index, model, request) for index, (model, request) in enumerate(items)),
+            concurrency=self.concurrency
+        )
+        report.entries.extend(entries)
+    
+    def _send_create(self, model: Model, request: models.CreateObjectRequest):
+        result = self.conn.objects.insert(
+            type_key=request.type_key,
+            name=request.name,
+            properties=request.properties
+        )
+        model.id = result.id
+        model.space_id = result.space_id
+    
+    def _send_update(self, model: Model, request: models.UpdateObjectRequest):
+        self.conn.objects.update(model.id, name=request.name, properties=request.properties)
+    
+    def _send_delete(self, model: Model, request: None):
+        self.conn.objects.delete(model.id)
+    
+    def _raise_failed(self, report: 'CommitReport', operation: str):
+        failed = [entry for entry in report.failed if entry.operation == operation]
+        if failed:
+            raise CommitError(
+                f"{len(failed)} {operation} operation(s) failed: {failed[0].error}",
+                report=report
+            )
+    
+    def _rollback(self, report: 'CommitReport', created: List[Model]):
+        """Архивировать объекты, созданные в этом commit"""
+        self._run_step(report, "rollback", [(model, None) for model in created], self._send_delete)
+        for entry in report.entries:
+            if entry.operation == "rollback" and entry.ok:
+                report.rolled_back.append(entry.object_id)
+                self._identity.pop(entry.object_id, None)
+                entry.model.id = None
+                entry.model.space_id = None
+    
+    def _finish_commit(self, report: 'CommitReport'):
+        """Отметить сохраненные объекты и убрать их из очередей"""
+        def models_with(operation: str, ok: bool):
+            return {
+                id(entry.model): entry.model for entry in report.entries
+                if entry.operation == operation and entry.ok is ok
+            }
+        
+        failed_updates = models_with("update", False)
+        for key, model in {**models_with("create", True), **models_with("update", True)}.items():
+            if model.id is None:
+                continue
+            model.mark_clean()
+            if key in failed_updates:
+                # Связи не сохранены - оставляем их измененными для следующего commit
+                for relation in model.relation_fields():
+                    model._snapshot.pop(relation, None)
+        
+        deleted = models_with("delete", True)
+        for model in deleted.values():
+            self._identity.pop(model.id, None)
+        self._deleted = [model for model in self._deleted if id(model) not in deleted]
+        self._new_objects = [model for model in self._new_objects if model.id is None]
     
     def close(self):
         """Закрыть сессию"""
@@ -213,10 +741,57 @@ class Session:
 class Query(Generic[T]):
     """Построитель запросов для ORM"""
     
-    def __init__(self, conn: AnytypeConnection, model_class: Type[T]):
+    def __init__(
+        self,
+        conn: AnytypeConnection,
+        model_class: Type[T],
+        track: Optional[Callable[[Model], Model]] = None
+    ):
         self.conn = conn
         self.model_class = model_class
         self._builder = conn.query(model_class.get_type_key())
+        self._prefetch: Dict[str, Any] = {}
+        # Карта идентичности сессии: одинаковые ID дают один экземпляр
+        self._track = track or (lambda model: model)
+    
+    def prefetch(self, *relation_keys: str) -> 'Query[T]':
+        """
+        Загрузить связанные объекты вместе с результатом
+        
+        Все ID из связей собираются по всему результату и загружаются одним
+        параллельным пакетом на каждый уровень вложенности. Вложенные связи
+        задаются через точку: "project.owner".
+        
+        Пример:
+        ```python
+        tasks = session.query(Task).prefetch("assignee", "project.owner").all()
+        tasks[0].related("project")[0].related("owner")
+        ```
+        """
+        for path in relation_keys:
+            node = self._prefetch
+            for key in path.split("."):
+                node = node.setdefault(key, {})
+        return self
+    
+    def _load_related(self, items: List[Model], tree: Dict[str, Any]):
+        if not items or not tree:
+            return
+        ids = [object_id for item in items for key in tree for object_id in item.relation_ids(key)]
+        result = self.conn.objects.get_many(ids)
+        if result.errors:
+            raise next(iter(result.errors.values()))
+        hydrated = {
+            object_id: self._track(_hydrate(obj)) for object_id, obj in result.found.items()
+        }
+        
+        for key, subtree in tree.items():
+            children = {}
+            for item in items:
+                related = [hydrated[i] for i in item.relation_ids(key) if i in hydrated]
+                item._related[key] = related
+                children.update((id(model), model) for model in related)
+            self._load_related(list(children.values()), subtree)
     
     def filter(self, **kwargs) -> 'Query[T]':
         self._builder.filter(**kwargs)
@@ -224,11 +799,17 @@ class Query(Generic[T]):
     
     def all(self) -> List[T]:
         objects = self._builder.all()
-        return [self.model_class.from_anytype_object(obj) for obj in objects]
+        results = [self._track(self.model_class.from_anytype_object(obj)) for obj in objects]
+        self._load_related(results, self._prefetch)
+        return results
     
     def first(self) -> Optional[T]:
         obj = self._builder.first()
-        return self.model_class.from_anytype_object(obj) if obj else None
+        if not obj:
+            return None
+        result = self._track(self.model_class.from_anytype_object(obj))
+        self._load_related([result], self._prefetch)
+        return result
     
     def count(self) -> int:
         return self._builder.count()
@@ -243,10 +824,15 @@ class Query(Generic[T]):
 
 # Фабрика для создания подключений
 class Anytype:
-    def __init__(self, api_key: str, base_url: str = "http://127.0.0.1:31009"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://127.0.0.1:31009",
+        pool: Optional[ClientPool] = None
+    ):
         self.api_key = api_key
         self.base_url = base_url
-        self._db = AnytypeDatabase(api_key, base_url)
+        self._db = AnytypeDatabase(api_key, base_url, pool=pool)
     
     @contextmanager
     def connect(self, space_id: str) -> Generator[Session, None, None]:
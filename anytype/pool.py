@@ -0,0 +1,154 @@
+import atexit
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Tuple, Generator
+import httpx
+from .client import AnytypeClient
+
+PoolKey = Tuple[str, Optional[str]]
+
+class ClientPool:
+    """
+    Потокобезопасный реестр клиентов с общими TCP соединениями.
+    
+    Клиенты выдаются по ключу (base_url, api_key) со счетчиком ссылок.
+    После release клиент не закрывается, а остается в пуле (до max_idle
+    свободных клиентов), поэтому короткие подключения к пространствам
+    переиспользуют уже открытые keep-alive соединения. Ключ общего
+    клиента менять нельзя (set_api_key поднимает RuntimeError): для
+    другого ключа берется другой клиент из пула.
+    
+    Пример использования:
+    ```python
+    pool = ClientPool(max_connections=50, keepalive_expiry=30)
+    db = AnytypeDatabase(api_key="your-api-key", pool=pool)
+    
+    with db.connect(space_id) as conn:   # клиент из пула
+        conn.objects.all()
+    ```
+    
+    Args:
+        max_connections: Максимум соединений одного клиента
+        max_keepalive_connections: Сколько простаивающих соединений держать открытыми
+        keepalive_expiry: Через сколько секунд закрывать простаивающее соединение
+        max_idle: Сколько неиспользуемых клиентов держать в пуле (0 - закрывать сразу)
+        **client_options: Остальные параметры AnytypeClient (timeout, transport, retry, cache, ...);
+            лимиты соединений пула перекрывают лимиты из transport
+    """
+    
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        max_idle: int = 16,
+        **client_options: Any
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.max_idle = max_idle
+        self.client_options = client_options
+        self._clients: Dict[PoolKey, AnytypeClient] = {}
+        self._refs: Dict[PoolKey, int] = {}
+        self._keys: Dict[int, PoolKey] = {}
+        self._idle: "OrderedDict[PoolKey, None]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _key(self, api_key: Optional[str], base_url: str) -> PoolKey:
+        return base_url.rstrip("/"), api_key
+    
+    def acquire(self, api_key: Optional[str], base_url: str = "http://127.0.0.1:31009") -> AnytypeClient:
+        """Взять клиент из пула (создается при первом обращении)"""
+        key = self._key(api_key, base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = AnytypeClient(
+                    api_key=api_key,
+                    base_url=base_url,
+                    limits=self.limits,
+                    **self.client_options
+                )
+                client._pooled = True
+                self._clients[key] = client
+                self._refs[key] = 0
+                self._keys[id(client)] = key
+            self._refs[key] += 1
+            self._idle.pop(key, None)
+            return client
+    
+    def release(self, client: AnytypeClient):
+        """Вернуть клиент в пул; лишние свободные клиенты закрываются"""
+        to_close = []
+        with self._lock:
+            key = self._keys.get(id(client))
+            if key is None or self._clients.get(key) is not client:
+                # Клиент не из пула
+                to_close.append(client)
+            elif self._refs[key] <= 0:
+                # Лишний release: клиент уже свободен
+                return
+            else:
+                self._refs[key] -= 1
+                if self._refs[key] == 0:
+                    self._idle[key] = None
+                while len(self._idle) > self.max_idle:
+                    idle_key, _ = self._idle.popitem(last=False)
+                    to_close.append(self._evict(idle_key))
+        for stale in to_close:
+            stale.close()
+    
+    def _evict(self, key: PoolKey) -> AnytypeClient:
+        client = self._clients.pop(key)
+        del self._refs[key]
+        del self._keys[id(client)]
+        return client
+    
+    @contextmanager
+    def client(
+        self,
+        api_key: Optional[str],
+        base_url: str = "http://127.0.0.1:31009"
+    ) -> Generator[AnytypeClient, None, None]:
+        """Клиент из пула на время блока with"""
+        client = self.acquire(api_key, base_url)
+        try:
+            yield client
+        finally:
+            self.release(client)
+    
+    def close(self):
+        """Закрыть все клиенты пула, в том числе занятые"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._refs.clear()
+            self._keys.clear()
+            self._idle.clear()
+        for client in clients:
+            client.close()
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "in_use": sum(1 for refs in self._refs.values() if refs > 0),
+                "idle": len(self._idle),
+            }
+
+_default_pool: Optional[ClientPool] = None
+_default_pool_lock = threading.Lock()
+
+def default_pool() -> ClientPool:
+    """Общий пул процесса, закрывается при выходе из интерпретатора"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ClientPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
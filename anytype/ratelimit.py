@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import Optional, Dict, Union, Tuple, Callable
+
+class TokenBucket:
+    """
+    Token bucket с резервированием.
+    
+    reserve() сразу списывает токен и возвращает, сколько нужно подождать.
+    Блокировка держится только на время расчета, поэтому один bucket
+    можно делить между потоками, корутинами и несколькими клиентами.
+    
+    Args:
+        rate: Запросов в секунду
+        burst: Максимум запросов подряд без ожидания
+        adaptive: Снижать rate после 429 и постепенно возвращать обратно
+        min_rate: Нижняя граница rate в адаптивном режиме
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        adaptive: bool = False,
+        min_rate: float = 0.5
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.adaptive = adaptive
+        self.min_rate = min(min_rate, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def reserve(self) -> float:
+        """Занять токен, вернуть время ожидания в секундах"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def on_throttled(self):
+        """Сервер ответил 429: вдвое снизить скорость"""
+        if not self.adaptive:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+    
+    def on_success(self):
+        """Успешный ответ: понемногу вернуть скорость к исходной"""
+        if not self.adaptive or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.02)
+
+BucketSpec = Union[TokenBucket, float, Tuple[float, float]]
+
+def default_group(method: str, url: str) -> str:
+    """Группа эндпоинтов: search, write или read"""
+    if url.endswith("/search"):
+        return "search"
+    if method.upper() not in ("GET", "HEAD", "OPTIONS"):
+        return "write"
+    return "read"
+
+class RateLimiter:
+    """
+    Клиентский ограничитель частоты запросов.
+    
+    Пример использования:
+    ```python
+    limiter = RateLimiter(
+        rate=20, burst=40,
+        groups={"search": (5, 10), "write": (10, 10)},
+        adaptive=True
+    )
+    client = AnytypeClient(api_key="your-api-key", rate_limiter=limiter)
+    async_client = AsyncAnytypeClient(api_key="your-api-key", rate_limiter=limiter)
+    ```
+    
+    Args:
+        rate: Общий лимит для запросов вне groups (None - без ограничений)
+        burst: Размер пачки для общего лимита
+        groups: Лимиты по группам: TokenBucket, rate или (rate, burst)
+        adaptive: Адаптивный режим для bucket'ов, созданных из чисел
+        classify: Функция (method, url) -> группа, по умолчанию default_group
+    """
+    
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        groups: Optional[Dict[str, BucketSpec]] = None,
+        adaptive: bool = False,
+        classify: Callable[[str, str], str] = default_group
+    ):
+        self.adaptive = adaptive
+        self.classify = classify
+        self.default = TokenBucket(rate, burst, adaptive=adaptive) if rate else None
+        self.groups = {
+            name: self._make_bucket(spec) for name, spec in (groups or {}).items()
+        }
+    
+    def _make_bucket(self, spec: BucketSpec) -> TokenBucket:
+        if isinstance(spec, TokenBucket):
+            return spec
+        if isinstance(spec, tuple):
+            rate, burst = spec
+            return TokenBucket(rate, burst, adaptive=self.adaptive)
+        return TokenBucket(spec, adaptive=self.adaptive)
+    
+    def bucket_for(self, method: str, url: str) -> Optional[TokenBucket]:
+        return self.groups.get(self.classify(method, url), self.default)
+    
+    def reserve(self, method: str, url: str) -> float:
+        """Занять место для запроса, вернуть время ожидания в секундах"""
+        bucket = self.bucket_for(method, url)
+        return bucket.reserve() if bucket else 0.0
+    
+    def record(self, method: str, url: str, status_code: int):
+        """Учесть ответ сервера для адаптивного режима"""
+        bucket = self.bucket_for(method, url)
+        if bucket is None:
+            return
+        if status_code == 429:
+            bucket.on_throttled()
+        elif status_code < 400:
+            bucket.on_success()
@@ -0,0 +1,418 @@
+import sqlite3
+import threading
+import time
+from functools import partial
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
+from pydantic import BaseModel
+from .client import AnytypeClient
+from . import models
+from . import utils
+from .filtering import FilterLike, filter_objects
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS objects ("
+    " id TEXT PRIMARY KEY,"
+    " type_key TEXT,"
+    " last_modified TEXT,"
+    " generation INTEGER NOT NULL,"
+    " data TEXT NOT NULL)",
+    # Значения свойств: одна строка на значение (у multi_select и objects - несколько)
+    "CREATE TABLE IF NOT EXISTS object_values ("
+    " object_id TEXT NOT NULL,"
+    " key TEXT NOT NULL,"
+    " value_text TEXT,"
+    " value_number REAL,"
+    " value_ref TEXT)",
+    "CREATE TABLE IF NOT EXISTS types (id TEXT PRIMARY KEY, key TEXT, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS properties ("
+    " id TEXT PRIMARY KEY, key TEXT, format TEXT, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS tags ("
+    " id TEXT PRIMARY KEY, property_key TEXT, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+    "CREATE INDEX IF NOT EXISTS objects_type ON objects (type_key)",
+    "CREATE INDEX IF NOT EXISTS objects_modified ON objects (last_modified)",
+    "CREATE INDEX IF NOT EXISTS values_object ON object_values (object_id, key)",
+    "CREATE INDEX IF NOT EXISTS values_text ON object_values (key, value_text)",
+    "CREATE INDEX IF NOT EXISTS values_number ON object_values (key, value_number)",
+    "CREATE INDEX IF NOT EXISTS values_ref ON object_values (key, value_ref)",
+)
+
+_MODIFIED_KEY = models.SortProperty.LAST_MODIFIED_DATE.value
+
+class SyncResult(BaseModel):
+    """Итог синхронизации реплики"""
+    
+    full: bool
+    upserted: int = 0
+    removed: int = 0
+    # Самая поздняя last_modified_date среди синхронизированных объектов
+    watermark: Optional[str] = None
+    elapsed: float = 0.0
+
+def _values(obj: models.Object) -> Iterator[Tuple[str, Optional[str], Optional[float], Optional[str]]]:
+    """Строки object_values: (ключ, текст, число, ID тега)"""
+    keys = set()
+    for prop in obj.properties or ():
+        fmt = models._PROPERTY_VALUE_CLASSES.get(type(prop))
+        value = getattr(prop, fmt) if fmt else None
+        if value is None:
+            continue
+        keys.add(prop.key)
+        if fmt == "number":
+            yield prop.key, None, value, None
+        elif fmt == "checkbox":
+            yield prop.key, None, float(value), None
+        elif fmt == "select":
+            yield prop.key, value.name, None, value.id
+        elif fmt == "multi_select":
+            for tag in value:
+                yield prop.key, tag.name, None, tag.id
+        elif fmt in ("objects", "files"):
+            for ref in value:
+                yield prop.key, ref, None, ref
+        else:
+            yield prop.key, value, None, None
+    # Заголовок и тип, чтобы фильтровать по ним как по свойствам
+    if "name" not in keys and obj.name is not None:
+        yield "name", obj.name, None, None
+    if obj.type is not None:
+        yield "type", obj.type.key, None, obj.type.id
+
+def _modified(obj: models.Object) -> Optional[str]:
+    for prop in obj.properties or ():
+        if prop.key == _MODIFIED_KEY:
+            return getattr(prop, "date", None)
+    return None
+
+class Replica:
+    """
+    Локальная копия пространства в SQLite.
+    
+    Первая синхронизация загружает все объекты потоком по страницам,
+    следующие забирают только объекты, измененные после предыдущей
+    синхронизации (поиск с сортировкой по last_modified_date). Удаленные
+    объекты инкрементальная синхронизация не видит, их убирает
+    sync(full=True). Типы, свойства и теги перечитываются целиком.
+    
+    Подключение с репликой выполняет ObjectsTable.find и QueryBuilder
+    локальными запросами по индексам:
+    ```python
+    replica = Replica("space.sqlite", space_id)
+    replica.sync(client)
+    
+    with db.connect(space_id, replica=replica) as conn:
+        tasks = conn.query("task").filter(status="done").order_by("name").all()
+    ```
+    
+    Args:
+        path: Путь к файлу базы (":memory:" для временной базы)
+        space_id: ID пространства
+    """
+    
+    def __init__(self, path: str, space_id: str):
+        self.path = path
+        self.space_id = space_id
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            stored = self._meta("space_id")
+            if stored is None:
+                self._set_meta("space_id", space_id)
+            elif stored != space_id:
+                raise ValueError(f"Replica {path!r} belongs to space {stored!r}, not {space_id!r}")
+    
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def _set_meta(self, key: str, value: Optional[str]):
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+    
+    @property
+    def watermark(self) -> Optional[str]:
+        """last_modified_date последнего синхронизированного изменения"""
+        with self._lock:
+            return self._meta("watermark")
+    
+    @property
+    def synced_at(self) -> Optional[float]:
+        with self._lock:
+            value = self._meta("synced_at")
+        return float(value) if value is not None else None
+    
+    def sync(
+        self,
+        client: AnytypeClient,
+        full: Optional[bool] = None,
+        page_size: int = utils.MAX_PAGE_SIZE
+    ) -> SyncResult:
+        """
+        Синхронизировать реплику с пространством
+        
+        Args:
+            client: Синхронный клиент
+            full: Полная перезагрузка с удалением исчезнувших объектов
+                (по умолчанию - только при первой синхронизации)
+            page_size: Размер страницы поиска
+        """
+        started = time.monotonic()
+        watermark = self.watermark
+        if full is None:
+            full = watermark is None
+        result = SyncResult(full=full)
+        
+        self._sync_metadata(client)
+        with self._lock:
+            generation = int(self._meta("generation") or 0) + 1
+        
+        if full:
+            # Порядок создания не меняется при правке объектов во время синхронизации,
+            # поэтому смещения страниц не сдвигаются
+            sort = models.SortOptions(
+                property_key=models.SortProperty.CREATED_DATE, direction=models.SortDirection.ASC
+            )
+        else:
+            sort = models.SortOptions(
+                property_key=models.SortProperty.LAST_MODIFIED_DATE, direction=models.SortDirection.DESC
+            )
+        fetch = partial(client.search.search_in_space, self.space_id, sort=sort)
+        latest = watermark
+        for page in utils.iter_pages(fetch, page_size=page_size, prefetch=full):
+            batch = page.data
+            if not full:
+                # Страницы идут от новых к старым: дальше только уже синхронизированное
+                batch = [obj for obj in batch if (_modified(obj) or "") >= (watermark or "")]
+            self._upsert(batch, generation)
+            result.upserted += len(batch)
+            for obj in batch:
+                modified = _modified(obj)
+                if modified is not None and (latest is None or modified > latest):
+                    latest = modified
+            if len(batch) < len(page.data):
+                break
+        
+        removed = []
+        if full:
+            refreshed, removed = self._check_unseen(client, generation)
+            self._upsert(refreshed, generation)
+            result.upserted += len(refreshed)
+        
+        with self._lock, self._conn:
+            if removed:
+                self._conn.executemany("DELETE FROM objects WHERE id = ?", [(i,) for i in removed])
+                self._conn.executemany("DELETE FROM object_values WHERE object_id = ?", [(i,) for i in removed])
+            result.removed = len(removed)
+            self._set_meta("generation", str(generation))
+            self._set_meta("watermark", latest)
+            self._set_meta("synced_at", str(time.time()))
+        result.watermark = latest
+        result.elapsed = time.monotonic() - started
+        return result
+    
+    def _check_unseen(self, client: AnytypeClient, generation: int):
+        """
+        Проверить объекты, которые полная синхронизация не встретила
+        
+        Объект мог быть удален, а мог быть пропущен, если во время
+        синхронизации удалили другой объект и страницы сдвинулись.
+        Удаляются только объекты, которых нет (404/410) или которые
+        в архиве; при других ошибках объект остается в реплике.
+        
+        Returns:
+            (найденные объекты для обновления, ID для удаления)
+        """
+        with self._lock:
+            unseen = [row[0] for row in self._conn.execute(
+                "SELECT id FROM objects WHERE generation != ?", (generation,)
+            )]
+        if not unseen:
+            return [], []
+        checked = client.objects.get_many(self.space_id, unseen)
+        refreshed = [obj for obj in checked.found.values() if not obj.archived]
+        removed = checked.missing + [obj.id for obj in checked.found.values() if obj.archived]
+        return refreshed, removed
+    
+    def _sync_metadata(self, client: AnytypeClient):
+        types = list(client.types.iter_list(self.space_id))
+        properties = list(client.properties.iter_list(self.space_id))
+        tags = [
+            (prop.key, tag)
+            for prop in properties
+            if prop.format in (models.PropertyFormat.SELECT, models.PropertyFormat.MULTI_SELECT)
+            for tag in client.tags.iter_list(self.space_id, prop.id)
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM types")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO types VALUES (?, ?, ?)",
+                [(t.id, t.key, t.model_dump_json()) for t in types]
+            )
+            self._conn.execute("DELETE FROM properties")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO properties VALUES (?, ?, ?, ?)",
+                [(p.id, p.key, p.format.value, p.model_dump_json()) for p in properties]
+            )
+            self._conn.execute("DELETE FROM tags")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tags VALUES (?, ?, ?)",
+                [(tag.id, key, tag.model_dump_json()) for key, tag in tags]
+            )
+    
+    def _upsert(self, objects: List[models.Object], generation: int):
+        if not objects:
+            return
+        rows = [
+            (obj.id, obj.type.key if obj.type else None, _modified(obj), generation, obj.model_dump_json())
+            for obj in objects
+        ]
+        values = [(obj.id, *value) for obj in objects for value in _values(obj)]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM object_values WHERE object_id = ?", [(obj.id,) for obj in objects]
+            )
+            self._conn.executemany("INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.executemany("INSERT INTO object_values VALUES (?, ?, ?, ?, ?)", values)
+    
+    def get(self, object_id: str) -> Optional[models.Object]:
+        """Объект по ID или None"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM objects WHERE id = ?", (object_id,)).fetchone()
+        return models.Object.model_validate_json(row[0]) if row else None
+    
+    def iter_objects(self, type_key: Optional[str] = None) -> Iterator[models.Object]:
+        """Перебрать все объекты реплики (или объекты одного типа)"""
+        sql, params = "SELECT data FROM objects", []
+        if type_key is not None:
+            sql, params = sql + " WHERE type_key = ?", [type_key]
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY rowid", params).fetchall()
+        for (data,) in rows:
+            yield models.Object.model_validate_json(data)
+    
+    def filter(self, expression: Optional[FilterLike], type_key: Optional[str] = None) -> List[models.Object]:
+        """Объекты, подходящие под FilterExpression (вычисляется локально)"""
+        return list(filter_objects(self.iter_objects(type_key), expression))
+    
+    def types(self) -> List[models.Type]:
+        return self._load(models.Type, "SELECT data FROM types ORDER BY key")
+    
+    def properties(self) -> List[models.Property]:
+        return self._load(models.Property, "SELECT data FROM properties ORDER BY key")
+    
+    def tags(self, property_key: Optional[str] = None) -> List[models.Tag]:
+        if property_key is None:
+            return self._load(models.Tag, "SELECT data FROM tags ORDER BY rowid")
+        return self._load(
+            models.Tag, "SELECT data FROM tags WHERE property_key = ? ORDER BY rowid", (property_key,)
+        )
+    
+    def _load(self, model, sql: str, params: Iterable[Any] = ()) -> List[Any]:
+        with self._lock:
+            rows = self._conn.execute(sql, tuple(params)).fetchall()
+        return [model.model_validate_json(data) for (data,) in rows]
+    
+    def select(
+        self,
+        type_key: Optional[str] = None,
+        filters: Iterable[Dict[str, Any]] = (),
+        order_by: Optional[str] = None,
+        direction: str = "asc",
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[models.Object]:
+        """
+        Объекты по фильтрам в формате QueryBuilder
+        ({"property_key": ..., "condition": ..., "text"/"number"/...: значение})
+        """
+        where, params = self._where(type_key, filters)
+        sql = f"SELECT o.data FROM objects o WHERE {where}"
+        if order_by is not None:
+            sql += (
+                " ORDER BY (SELECT COALESCE(v.value_number, v.value_text) FROM object_values v"
+                " WHERE v.object_id = o.id AND v.key = ? LIMIT 1)"
+                f" {'DESC' if direction == 'desc' else 'ASC'}, o.rowid"
+            )
+            params.append(order_by)
+        else:
+            sql += " ORDER BY o.rowid"
+        sql += " LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [models.Object.model_validate_json(data) for (data,) in rows]
+    
+    def count(self, type_key: Optional[str] = None, filters: Iterable[Dict[str, Any]] = ()) -> int:
+        """Количество объектов по фильтрам в формате QueryBuilder"""
+        where, params = self._where(type_key, filters)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM objects o WHERE {where}", params).fetchone()[0]
+    
+    def _where(self, type_key: Optional[str], filters: Iterable[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        clauses, params = ["1"], []
+        if type_key is not None:
+            clauses.append("o.type_key = ?")
+            params.append(type_key)
+        for f in filters:
+            clause, clause_params = _condition(f)
+            clauses.append(clause)
+            params += clause_params
+        return " AND ".join(clauses), params
+    
+    def close(self):
+        self._conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+_OPERATORS = {"eq": "=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+# Условия, которые выполняются, если ни одно значение не подходит под обратное
+_NEGATED = {"ne": "eq", "ncontains": "contains", "nin": "in"}
+
+def _filter_value(f: Dict[str, Any]) -> Any:
+    for name in ("text", "number", "checkbox", "multi_select", "objects", "value"):
+        if name in f:
+            return f[name]
+    return None
+
+def _match(condition: str, value: Any) -> Tuple[str, List[Any]]:
+    """Условие на одну строку object_values v"""
+    if condition == "contains":
+        return "v.value_text LIKE ? ESCAPE '\\'", [f"%{_escape_like(str(value))}%"]
+    if isinstance(value, list):
+        marks = ", ".join("?" * len(value))
+        return f"(v.value_text IN ({marks}) OR v.value_ref IN ({marks}))", [*value, *value]
+    if isinstance(value, (bool, int, float)):
+        return f"v.value_number {_OPERATORS.get(condition, '=')} ?", [float(value)]
+    if condition == "eq":
+        return "(v.value_text = ? OR v.value_ref = ?)", [value, value]
+    return f"v.value_text {_OPERATORS.get(condition, '=')} ?", [value]
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _condition(f: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """SQL условие для объекта o по фильтру QueryBuilder"""
+    key = f["property_key"]
+    condition = f.get("condition", "eq")
+    condition = getattr(condition, "value", condition)
+    exists = "EXISTS (SELECT 1 FROM object_values v WHERE v.object_id = o.id AND v.key = ?"
+    if condition in ("empty", "nempty"):
+        return ("NOT " if condition == "empty" else "") + exists + ")", [key]
+    
+    value = _filter_value(f)
+    negate = condition in _NEGATED
+    condition = _NEGATED.get(condition, condition)
+    if condition == "all" and isinstance(value, list):
+        parts, params = [], []
+        for item in value:
+            match, match_params = _match("eq", item)
+            parts.append(f"{exists} AND {match})")
+            params += [key, *match_params]
+        return "(" + " AND ".join(parts or ["1"]) + ")", params
+    match, params = _match(condition, value)
+    return ("NOT " if negate else "") + f"{exists} AND {match})", [key, *params]
@@ -0,0 +1,146 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Iterable
+import httpx
+
+# Методы, повтор которых не меняет результат
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+class RetryBudget:
+    """
+    Бюджет повторов клиента.
+    
+    Каждый исходный запрос пополняет бюджет на ratio, каждый повтор
+    списывает единицу. Так при неработающем сервере число повторов
+    остается в пределах доли от обычного трафика и не растет лавиной.
+    """
+    
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+    
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+    
+    def deposit(self):
+        """Учесть исходный запрос"""
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+    
+    def withdraw(self) -> bool:
+        """Списать один повтор, False если бюджет исчерпан"""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+class RetryPolicy:
+    """
+    Политика повторов запросов.
+    
+    Пример использования:
+    ```python
+    client = AnytypeClient(
+        api_key="your-api-key",
+        retry=RetryPolicy(max_attempts=5, backoff_base=0.5)
+    )
+    ```
+    
+    Args:
+        max_attempts: Максимум попыток, включая первую
+        backoff_base: Задержка перед первым повтором, дальше удваивается
+        backoff_max: Верхняя граница задержки
+        jitter: Случайная задержка в [0, backoff] (full jitter)
+        retry_statuses: Коды ответа, после которых запрос повторяется
+        retry_methods: Методы, которые можно повторять при ошибках сети
+            и ответах из retry_statuses
+        retry_rejected: Повторять 429 для любого метода. Сервер отклонил
+            такой запрос целиком, поэтому повтор безопасен и для POST/PATCH.
+        respect_retry_after: Ждать столько, сколько просит заголовок Retry-After
+        max_retry_after: Верхняя граница ожидания по Retry-After
+        budget_ratio: Доля повторов от числа запросов (см. RetryBudget)
+        budget_min_tokens: Запас повторов при создании клиента
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (429, 502, 503, 504),
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        retry_rejected: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        budget_ratio: float = 0.2,
+        budget_min_tokens: float = 10.0
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.retry_rejected = retry_rejected
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_min_tokens = budget_min_tokens
+    
+    def create_budget(self) -> RetryBudget:
+        """Создать бюджет повторов для одного клиента"""
+        return RetryBudget(ratio=self.budget_ratio, min_tokens=self.budget_min_tokens)
+    
+    def is_retryable(
+        self,
+        method: str,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None
+    ) -> bool:
+        """Можно ли повторить запрос после такого ответа или ошибки"""
+        method = method.upper()
+        if error is not None:
+            # До сервера запрос не дошел, его можно повторить любым методом
+            if isinstance(error, httpx.ConnectError):
+                return True
+            return isinstance(error, httpx.TransportError) and method in self.retry_methods
+        if response is None or response.status_code not in self.retry_statuses:
+            return False
+        if response.status_code == 429 and self.retry_rejected:
+            return True
+        return method in self.retry_methods
+    
+    def get_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Задержка перед повтором номер attempt (начиная с 1)"""
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        
+        backoff = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Разобрать Retry-After: число секунд или HTTP дата"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
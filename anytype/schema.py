@@ -0,0 +1,327 @@
+import hashlib
+import json
+import keyword
+import os
+import re
+import time
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Type, Union
+from pydantic import BaseModel
+from . import models
+from .client import AnytypeClient
+from .orm import Model, _MODELS
+
+# Версия формата файла со снимком схемы
+SNAPSHOT_FORMAT = 1
+
+# Аннотации полей сгенерированных моделей по формату свойства
+_ANNOTATIONS = {
+    "text": (Optional[str], "Optional[str]"),
+    "url": (Optional[str], "Optional[str]"),
+    "email": (Optional[str], "Optional[str]"),
+    "phone": (Optional[str], "Optional[str]"),
+    "number": (Optional[float], "Optional[float]"),
+    "checkbox": (Optional[bool], "Optional[bool]"),
+    "date": (Optional[datetime], "Optional[datetime]"),
+    "select": (Optional[Union[models.Tag, str]], "Optional[Union[models.Tag, str]]"),
+    "multi_select": (
+        Optional[List[Union[models.Tag, str]]], "Optional[List[Union[models.Tag, str]]]"
+    ),
+    "files": (Optional[List[str]], "Optional[List[str]]"),
+    "objects": (Optional[List[Any]], "Optional[List[Any]]"),
+}
+
+class PropertySchema(BaseModel):
+    id: Optional[str] = None
+    key: str
+    name: str
+    format: str
+
+class TypeSchema(BaseModel):
+    id: str
+    key: str
+    name: str
+    # Ключи свойств типа в порядке API
+    properties: List[str] = []
+
+class SpaceSchema(BaseModel):
+    """
+    Снимок схемы пространства: типы и форматы их свойств.
+    
+    Attributes:
+        version: Хеш содержимого схемы, меняется при любом изменении типов или свойств
+        fetched_at: Когда схема загружена из API (unix time)
+    """
+    
+    space_id: str
+    types: Dict[str, TypeSchema]
+    properties: Dict[str, PropertySchema]
+    version: str = ""
+    fetched_at: float = 0.0
+    
+    def model_post_init(self, __context: Any):
+        if not self.version:
+            self.version = self.compute_version()
+    
+    def compute_version(self) -> str:
+        content = self.model_dump(include={"types", "properties"})
+        data = json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return hashlib.sha256(data).hexdigest()[:16]
+    
+    def formats(self, type_key: str) -> Dict[str, str]:
+        """Форматы свойств типа {ключ: формат}"""
+        return {
+            key: self.properties[key].format
+            for key in self.types[type_key].properties
+            if key in self.properties
+        }
+    
+    def save(self, path: str):
+        """Записать снимок в JSON файл (атомарно, через временный файл)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        data = {"format": SNAPSHOT_FORMAT, **self.model_dump()}
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+    
+    @classmethod
+    def load(cls, path: str) -> Optional['SpaceSchema']:
+        """Прочитать снимок; None, если файла нет или он поврежден"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.pop("format", None) != SNAPSHOT_FORMAT:
+            return None
+        try:
+            schema = cls.model_validate(data)
+        except ValueError:
+            return None
+        if schema.version != schema.compute_version():
+            return None
+        return schema
+
+def fetch_schema(client: AnytypeClient, space_id: str) -> SpaceSchema:
+    """
+    Загрузить типы и свойства пространства из API.
+    
+    Свойства берутся из PropertiesAPI.list, состав типов - из TypesAPI.list;
+    типы без списка свойств догружаются через TypesAPI.get параллельно.
+    """
+    properties = {
+        prop.key: PropertySchema(id=prop.id, key=prop.key, name=prop.name, format=prop.format.value)
+        for prop in client.properties.iter_list(space_id)
+    }
+    types = list(client.types.iter_list(space_id))
+    
+    missing = [i for i, t in enumerate(types) if t.properties is None]
+    if missing:
+        results = client._run_concurrent(
+            lambda t=types[i]: client.types.get(space_id, t.id) for i in missing
+        )
+        for i, result in zip(missing, results.results):
+            if not result.ok:
+                raise result.error
+            types[i] = result.result
+    
+    type_schemas = {}
+    for t in types:
+        keys = []
+        for prop in t.properties or ():
+            keys.append(prop.key)
+            # Свойство типа, которого нет в списке свойств пространства
+            if prop.key not in properties and prop.format is not None:
+                properties[prop.key] = PropertySchema(
+                    id=prop.id, key=prop.key, name=prop.name or prop.key, format=prop.format.value
+                )
+        type_schemas[t.key] = TypeSchema(id=t.id, key=t.key, name=t.name, properties=keys)
+    
+    return SpaceSchema(
+        space_id=space_id,
+        types=type_schemas,
+        properties=properties,
+        fetched_at=time.time()
+    )
+
+def load_schema(
+    client: AnytypeClient,
+    space_id: str,
+    path: Optional[str] = None,
+    max_age: Optional[float] = None,
+    refresh: bool = False
+) -> SpaceSchema:
+    """
+    Схема пространства из локального снимка или из API.
+    
+    Снимок в path используется, пока он не старше max_age секунд
+    (None - без ограничения); иначе схема загружается заново и
+    сохраняется в path.
+    
+    Пример использования:
+    ```python
+    schema = load_schema(client, space_id, path=".anytype/schema.json", max_age=3600)
+    Task = build_models(schema)["task"]
+    ```
+    
+    Args:
+        path: JSON файл снимка (None - не кешировать)
+        max_age: Максимальный возраст снимка в секундах
+        refresh: Загрузить схему из API, даже если снимок свежий
+    """
+    if path is not None and not refresh:
+        schema = SpaceSchema.load(path)
+        if (
+            schema is not None
+            and schema.space_id == space_id
+            and (max_age is None or time.time() - schema.fetched_at <= max_age)
+        ):
+            return schema
+    schema = fetch_schema(client, space_id)
+    if path is not None:
+        schema.save(path)
+    return schema
+
+def _identifier(text: str, prefix: str) -> str:
+    name = re.sub(r"\W+", "_", text).strip("_")
+    if not name or name[0].isdigit():
+        name = f"{prefix}_{name}"
+    return name
+
+def _field_name(key: str, taken: set) -> str:
+    """Имя поля модели для ключа свойства"""
+    name = _identifier(key.lower(), "p")
+    # Имена, занятые Python или методами Model
+    if keyword.iskeyword(name) or hasattr(Model, name):
+        name += "_"
+    base, n = name, 2
+    while name in taken:
+        name, n = f"{base}_{n}", n + 1
+    taken.add(name)
+    return name
+
+def _class_name(key: str, taken: set) -> str:
+    """Имя класса модели для ключа типа: task -> Task, my_type -> MyType"""
+    name = "".join(part[:1].upper() + part[1:] for part in re.split(r"[\W_]+", key) if part)
+    name = _identifier(name, "Type")
+    base, n = name, 2
+    while name in taken or keyword.iskeyword(name):
+        name, n = f"{base}{n}", n + 1
+    taken.add(name)
+    return name
+
+def _model_specs(schema: SpaceSchema) -> List[Dict[str, Any]]:
+    """Имена классов, поля и Meta для всех типов схемы"""
+    specs = []
+    class_names: set = set()
+    for type_key, type_schema in sorted(schema.types.items()):
+        # name, id и space_id есть у всех моделей
+        taken = {"name", "id", "space_id"}
+        fields = []
+        for key, fmt in schema.formats(type_key).items():
+            if key == "name" or fmt not in _ANNOTATIONS:
+                continue
+            fields.append((_field_name(key, taken), key, fmt))
+        specs.append({
+            "class_name": _class_name(type_key, class_names),
+            "type_key": type_key,
+            "doc": type_schema.name,
+            "fields": fields,
+        })
+    return specs
+
+def build_models(schema: SpaceSchema, register: bool = True) -> Dict[str, Type[Model]]:
+    """
+    Классы моделей ORM для всех типов схемы.
+    
+    Форматы и ключи свойств записываются в Meta, поэтому кодек не
+    угадывает формат по значению.
+    
+    Args:
+        register: Использовать эти модели при загрузке связей (Query.prefetch)
+            вместо ранее объявленных моделей с тем же ключом типа
+    
+    Returns:
+        Словарь {ключ типа: класс модели}
+    """
+    previous = dict(_MODELS)
+    result = {}
+    for spec in _model_specs(schema):
+        annotations: Dict[str, Any] = {"name": Optional[str]}
+        class_name = spec["class_name"]
+        namespace: Dict[str, Any] = {
+            "__doc__": spec["doc"],
+            "__module__": __name__,
+            "__qualname__": class_name,
+            "name": None,
+        }
+        for name, key, fmt in spec["fields"]:
+            annotations[name] = _ANNOTATIONS[fmt][0]
+            namespace[name] = None
+        namespace["__annotations__"] = annotations
+        # Вложенный класс, как в объявленных вручную моделях (pydantic его пропускает)
+        namespace["Meta"] = type("Meta", (), {
+            "__module__": __name__,
+            "__qualname__": f"{class_name}.Meta",
+            "type_key": spec["type_key"],
+            "title_field": "name",
+            "property_formats": {name: fmt for name, key, fmt in spec["fields"]},
+            "property_keys": {name: key for name, key, fmt in spec["fields"] if name != key},
+        })
+        result[spec["type_key"]] = type(class_name, (Model,), namespace)
+    if not register:
+        _MODELS.clear()
+        _MODELS.update(previous)
+    return result
+
+def _docstring(text: str) -> str:
+    return " ".join(text.replace("\\", "\\\\").replace('"', "'").split())
+
+def _literal(value: str) -> str:
+    """Строка в коде модуля (JSON строка - корректный литерал Python)"""
+    return json.dumps(value, ensure_ascii=False)
+
+def render_module(schema: SpaceSchema) -> str:
+    """Исходный код модуля с моделями всех типов схемы"""
+    lines = [
+        f'"""Модели пространства {schema.space_id}, сгенерировано anytype.schema"""',
+        "",
+        "from datetime import datetime",
+        "from typing import Any, List, Optional, Union",
+        "from anytype import models",
+        "from anytype.orm import Model",
+        "",
+        f"SCHEMA_VERSION = {_literal(schema.version)}",
+    ]
+    for spec in _model_specs(schema):
+        fields = spec["fields"]
+        lines += [
+            "",
+            f"class {spec['class_name']}(Model):",
+            f'    """{_docstring(spec["doc"])}"""',
+            "    ",
+            "    name: Optional[str] = None",
+        ]
+        lines += [f"    {name}: {_ANNOTATIONS[fmt][1]} = None" for name, key, fmt in fields]
+        lines += [
+            "    ",
+            "    class Meta:",
+            f"        type_key = {_literal(spec['type_key'])}",
+            '        title_field = "name"',
+            "        property_formats = {",
+        ]
+        lines += [f"            {_literal(name)}: {_literal(fmt)}," for name, key, fmt in fields]
+        lines.append("        }")
+        keys = [(name, key) for name, key, fmt in fields if name != key]
+        if keys:
+            lines.append("        property_keys = {")
+            lines += [f"            {_literal(name)}: {_literal(key)}," for name, key in keys]
+            lines.append("        }")
+    return "\n".join(lines) + "\n"
+
+def write_module(schema: SpaceSchema, path: str):
+    """Сгенерировать модуль с моделями в файл path"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render_module(schema))
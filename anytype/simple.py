@@ -1,19 +1,26 @@
 from contextlib import contextmanager
 from typing import Optional, List, Any, Generator
 from .client import AnytypeClient
+from .pool import ClientPool, default_pool
 
 class AnytypeDB:
     """Простой интерфейс как у базы данных"""
     
-    def __init__(self, api_key: str, base_url: str = "http://127.0.0.1:31009"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://127.0.0.1:31009",
+        pool: Optional[ClientPool] = None
+    ):
         self.api_key = api_key
         self.base_url = base_url
+        self.pool = pool if pool is not None else default_pool()
     
     @contextmanager
     def connect(self, space_id: str) -> Generator['Connection', None, None]:
-        """Подключиться к пространству"""
-        client = AnytypeClient(api_key=self.api_key, base_url=self.base_url)
-        conn = Connection(client, space_id)
+        """Подключиться к пространству (клиент берется из пула)"""
+        client = self.pool.acquire(self.api_key, self.base_url)
+        conn = Connection(client, space_id, pool=self.pool)
         try:
             yield conn
         finally:
@@ -22,16 +29,24 @@ class AnytypeDB:
 class Connection:
     """Подключение к пространству"""
     
-    def __init__(self, client: AnytypeClient, space_id: str):
+    def __init__(self, client: AnytypeClient, space_id: str, pool: Optional[ClientPool] = None):
         self.client = client
         self.space_id = space_id
+        self.pool = pool
+        self._closed = False
     
     def table(self, name: str) -> 'Table':
         """Получить таблицу по имени типа"""
         return Table(self, name)
     
     def close(self):
-        self.client.close()
+        if self._closed:
+            return
+        self._closed = True
+        if self.pool is not None:
+            self.pool.release(self.client)
+        else:
+            self.client.close()
 
 class Table:
     """Таблица (тип объектов)"""
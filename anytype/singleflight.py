@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """
+    Объединение одинаковых одновременных вызовов (single-flight).
+    
+    Пока вызов с ключом key выполняется, остальные потоки с тем же
+    ключом не запускают fn, а ждут и получают тот же результат или
+    то же исключение.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+class AsyncSingleFlight:
+    """
+    Single-flight для корутин: одинаковые запросы ждут общую задачу.
+    
+    fn выполняется отдельной задачей, а не в корутине первого вызвавшего,
+    поэтому отмена любого из ожидающих (в том числе первого) не отменяет
+    запрос для остальных.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.shared = 0
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Задача привязана к циклу событий, поэтому ключ включает цикл
+        key = (id(asyncio.get_running_loop()), key)
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(partial(self._finish, key))
+        # shield: отмена ожидающего не должна отменять общий запрос
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Помечаем исключение полученным, иначе asyncio предупредит, если все ждущие отменены
+            task.exception()
@@ -0,0 +1,107 @@
+from typing import Optional, Dict, Any, Union
+import httpx
+
+class TransportConfig:
+    """
+    Настройки HTTP транспорта клиента.
+    
+    Пример использования:
+    ```python
+    config = TransportConfig(
+        http2=True,                 # pip install anytype-sdk[http2]
+        max_connections=20,
+        keepalive_expiry=60,
+        connect_timeout=2,
+        read_timeout=30
+    )
+    client = AnytypeClient(api_key="your-api-key", transport=config)
+    ```
+    
+    Args:
+        http2: Включить HTTP/2, параллельные запросы идут по одному соединению
+        limits: Готовый httpx.Limits (перекрывает три параметра ниже)
+        max_connections: Максимум одновременных соединений
+        max_keepalive_connections: Сколько простаивающих соединений держать открытыми
+        keepalive_expiry: Через сколько секунд закрывать простаивающее соединение
+        connect_timeout: Таймаут установки соединения
+        read_timeout: Таймаут чтения ответа
+        write_timeout: Таймаут отправки запроса
+        pool_timeout: Сколько ждать свободного соединения из пула
+        transport: Свой httpx транспорт (httpx.HTTPTransport, MockTransport и т.п.);
+            для AsyncAnytypeClient - асинхронный. Лимиты и http2 в этом случае
+            настраиваются на самом транспорте.
+        verify: Проверка TLS сертификата (bool, путь к CA или ssl.SSLContext)
+    """
+    
+    def __init__(
+        self,
+        http2: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+        verify: Any = True
+    ):
+        self.http2 = http2
+        self.limits = limits if limits is not None else httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.pool_timeout = pool_timeout
+        self.transport = transport
+        self.verify = verify
+        if http2 and transport is None:
+            _require_h2()
+    
+    def timeout(self, default: float) -> httpx.Timeout:
+        """Таймауты по фазам, незаданные берутся из default"""
+        return httpx.Timeout(
+            default,
+            connect=default if self.connect_timeout is None else self.connect_timeout,
+            read=default if self.read_timeout is None else self.read_timeout,
+            write=default if self.write_timeout is None else self.write_timeout,
+            pool=default if self.pool_timeout is None else self.pool_timeout
+        )
+    
+    def client_kwargs(
+        self,
+        timeout: float,
+        limits: Optional[httpx.Limits] = None
+    ) -> Dict[str, Any]:
+        """Аргументы для httpx.Client / httpx.AsyncClient"""
+        kwargs: Dict[str, Any] = {
+            "timeout": self.timeout(timeout),
+            "limits": limits if limits is not None else self.limits,
+            "http2": self.http2,
+            "verify": self.verify,
+        }
+        if self.transport is not None:
+            kwargs["transport"] = self.transport
+        return kwargs
+
+def _require_h2():
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "HTTP/2 support requires the h2 package: pip install anytype-sdk[http2]"
+        ) from None
+
+def as_transport_config(
+    transport: Optional[Union[TransportConfig, httpx.BaseTransport, httpx.AsyncBaseTransport]]
+) -> TransportConfig:
+    """TransportConfig из конфигурации, готового httpx транспорта или None"""
+    if transport is None:
+        return TransportConfig()
+    if isinstance(transport, TransportConfig):
+        return transport
+    return TransportConfig(transport=transport)
@@ -1,7 +1,14 @@
-from typing import Optional, Dict, Any, List, Generator
+from typing import Optional, Dict, Any, List, Generator, AsyncGenerator, Callable, Iterator, Iterable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
+import asyncio
+import contextvars
 import re
 
+# Максимальный размер страницы, который принимает API
+MAX_PAGE_SIZE = 1000
+
 class FilterBuilder:
     """Утилита для построения сложных фильтров"""
     
@@ -87,24 +94,367 @@ class PaginationHelper:
         response = self.method(*self.args, **self.kwargs)
         
         if self.total is None:
-            self.total = response.pagination.total
+            self.total = _page_total(response)
         
-        self.items = response.data
+        self.items = _page_data(response)
         self.offset += len(self.items)
         
         return self.items
     
-    def all(self):
-        """Получить все элементы сразу"""
+    def all(self, concurrency: int = 1):
+        """
+        Получить все элементы сразу
+        
+        Args:
+            concurrency: Сколько страниц запрашивать одновременно. После первой
+                страницы остальные смещения известны из pagination.total.
+        """
+        if concurrency > 1:
+            return list(self.iter_items(concurrency=concurrency))
+        
         results = []
         for page in self:
             results.extend(page)
         return results
+    
+    def iter_items(
+        self,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True
+    ) -> Generator[Any, None, None]:
+        """Перебрать элементы по одному, не накапливая их в памяти"""
+        kwargs = {k: v for k, v in self.kwargs.items() if k not in ('offset', 'limit')}
+        
+        def fetch(offset: int, limit: int):
+            return self.method(*self.args, offset=offset, limit=limit, **kwargs)
+        
+        return iter_items(
+            fetch,
+            page_size=self.page_size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered
+        )
 
 def paginate(method, *args, **kwargs):
     """Хелпер для пагинации"""
     return PaginationHelper(None, method, *args, **kwargs)
 
+def _page_data(page: Any) -> List[Any]:
+    """Элементы страницы: PaginatedResponse, LazyModel или dict в режиме raw"""
+    if isinstance(page, dict):
+        return page.get("data") or []
+    return page.data or []
+
+def _page_pagination(page: Any) -> Any:
+    if isinstance(page, dict):
+        return page.get("pagination") or {}
+    return page.pagination
+
+def _page_has_more(page: Any) -> bool:
+    pagination = _page_pagination(page)
+    if isinstance(pagination, dict):
+        return bool(pagination.get("has_more"))
+    return bool(pagination is not None and pagination.has_more)
+
+def _page_total(page: Any) -> Optional[int]:
+    pagination = _page_pagination(page)
+    if isinstance(pagination, dict):
+        return pagination.get("total")
+    return pagination.total if pagination is not None else None
+
+def _submit(executor: ThreadPoolExecutor, fn: Callable[..., Any], *args, **kwargs):
+    """submit с копией contextvars, чтобы потоки видели настройки вызывающего кода"""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+def _remaining_offsets(first_page, offset: int) -> Iterator[int]:
+    """Смещения оставшихся страниц по первой странице и pagination.total"""
+    # Сервер может урезать limit, поэтому шаг берем по фактическому размеру страницы
+    step = len(_page_data(first_page))
+    return iter(range(offset + step, _page_total(first_page), step))
+
+def iter_pages(
+    fetch: Callable[..., Any],
+    page_size: int = MAX_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = False,
+    concurrency: int = 1,
+    ordered: bool = True
+) -> Generator[Any, None, None]:
+    """
+    Перебрать страницы ответа, пока pagination.has_more
+    
+    Args:
+        fetch: Функция fetch(offset=..., limit=...) -> PaginatedResponse
+        page_size: Размер страницы (макс 1000)
+        offset: Начальное смещение
+        prefetch: Загружать следующую страницу в фоне, пока
+            обрабатывается текущая. В памяти держится не больше двух страниц.
+        concurrency: Если больше 1, после первой страницы все оставшиеся
+            запрашиваются параллельно в пуле потоков, не больше concurrency
+            запросов одновременно.
+        ordered: При concurrency > 1 отдавать страницы по порядку смещений.
+            С ordered=False страницы отдаются по мере готовности.
+    """
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    
+    if concurrency > 1:
+        yield from _iter_pages_parallel(fetch, page_size, offset, concurrency, ordered)
+        return
+    
+    if not prefetch:
+        while True:
+            page = fetch(offset=offset, limit=page_size)
+            yield page
+            if not _page_has_more(page) or not _page_data(page):
+                return
+            offset += len(_page_data(page))
+    
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = _submit(executor, fetch, offset=offset, limit=page_size)
+        while future is not None:
+            page = future.result()
+            future = None
+            if _page_has_more(page) and _page_data(page):
+                offset += len(_page_data(page))
+                future = _submit(executor, fetch, offset=offset, limit=page_size)
+            yield page
+    finally:
+        executor.shutdown(wait=False)
+
+def _iter_pages_parallel(
+    fetch: Callable[..., Any],
+    page_size: int,
+    offset: int,
+    concurrency: int,
+    ordered: bool
+) -> Generator[Any, None, None]:
+    first = fetch(offset=offset, limit=page_size)
+    yield first
+    if not _page_has_more(first) or not _page_data(first):
+        return
+    
+    limit = len(_page_data(first))
+    offsets = _remaining_offsets(first, offset)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    
+    def submit_next(pending):
+        next_offset = next(offsets, None)
+        if next_offset is not None:
+            future = _submit(executor, fetch, offset=next_offset, limit=limit)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+    
+    pending: Any = deque() if ordered else set()
+    try:
+        for _ in range(concurrency):
+            submit_next(pending)
+        
+        if ordered:
+            while pending:
+                page = pending.popleft().result()
+                submit_next(pending)
+                yield page
+        else:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    submit_next(pending)
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+def iter_items(
+    fetch: Callable[..., Any],
+    page_size: int = MAX_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = False,
+    concurrency: int = 1,
+    ordered: bool = True
+) -> Generator[Any, None, None]:
+    """Перебрать элементы всех страниц по одному"""
+    for page in iter_pages(
+        fetch,
+        page_size=page_size,
+        offset=offset,
+        prefetch=prefetch,
+        concurrency=concurrency,
+        ordered=ordered
+    ):
+        yield from _page_data(page)
+
+async def aiter_pages(
+    fetch: Callable[..., Any],
+    page_size: int = MAX_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = False,
+    concurrency: int = 1,
+    ordered: bool = True
+) -> AsyncGenerator[Any, None]:
+    """Асинхронный вариант iter_pages, fetch возвращает корутину"""
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    
+    if concurrency > 1:
+        async for page in _aiter_pages_parallel(fetch, page_size, offset, concurrency, ordered):
+            yield page
+        return
+    
+    if not prefetch:
+        while True:
+            page = await fetch(offset=offset, limit=page_size)
+            yield page
+            if not _page_has_more(page) or not _page_data(page):
+                return
+            offset += len(_page_data(page))
+    
+    task = asyncio.ensure_future(fetch(offset=offset, limit=page_size))
+    try:
+        while task is not None:
+            page = await task
+            task = None
+            if _page_has_more(page) and _page_data(page):
+                offset += len(_page_data(page))
+                task = asyncio.ensure_future(fetch(offset=offset, limit=page_size))
+            yield page
+    finally:
+        if task is not None:
+            task.cancel()
+
+async def _aiter_pages_parallel(
+    fetch: Callable[..., Any],
+    page_size: int,
+    offset: int,
+    concurrency: int,
+    ordered: bool
+) -> AsyncGenerator[Any, None]:
+    first = await fetch(offset=offset, limit=page_size)
+    yield first
+    if not _page_has_more(first) or not _page_data(first):
+        return
+    
+    limit = len(_page_data(first))
+    offsets = _remaining_offsets(first, offset)
+    
+    def submit_next(pending):
+        next_offset = next(offsets, None)
+        if next_offset is not None:
+            task = asyncio.ensure_future(fetch(offset=next_offset, limit=limit))
+            if ordered:
+                pending.append(task)
+            else:
+                pending.add(task)
+    
+    pending: Any = deque() if ordered else set()
+    try:
+        for _ in range(concurrency):
+            submit_next(pending)
+        
+        if ordered:
+            while pending:
+                page = await pending.popleft()
+                submit_next(pending)
+                yield page
+        else:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    submit_next(pending)
+                for task in done:
+                    yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def aiter_items(
+    fetch: Callable[..., Any],
+    page_size: int = MAX_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = False,
+    concurrency: int = 1,
+    ordered: bool = True
+) -> AsyncGenerator[Any, None]:
+    """Асинхронный вариант iter_items"""
+    async for page in aiter_pages(
+        fetch,
+        page_size=page_size,
+        offset=offset,
+        prefetch=prefetch,
+        concurrency=concurrency,
+        ordered=ordered
+    ):
+        for item in _page_data(page):
+            yield item
+
+def run_concurrent(
+    calls: Iterable[Callable[[], Any]],
+    concurrency: int = 8
+) -> Any:
+    """
+    Выполнить вызовы в пуле потоков, не останавливаясь на ошибках
+    
+    Одновременно выполняется не больше concurrency вызовов, входной
+    итератор читается по мере освобождения слотов.
+    
+    Returns:
+        models.BulkResponse с результатом или исключением для каждого вызова
+    """
+    from . import models
+    
+    results: Dict[int, models.BulkResult] = {}
+    
+    def run(index: int, call: Callable[[], Any]) -> models.BulkResult:
+        try:
+            return models.BulkResult(index=index, ok=True, result=call())
+        except Exception as e:
+            return models.BulkResult(index=index, ok=False, error=e)
+    
+    calls = enumerate(calls)
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        pending = set()
+        for index, call in calls:
+            pending.add(_submit(executor, run, index, call))
+            if len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[result.index] = result
+        for future in pending:
+            result = future.result()
+            results[result.index] = result
+    
+    return models.BulkResponse(results=[results[i] for i in sorted(results)])
+
+async def arun_concurrent(
+    calls: Iterable[Callable[[], Any]],
+    concurrency: int = 8
+) -> Any:
+    """Асинхронный вариант run_concurrent, вызовы возвращают корутины"""
+    from . import models
+    
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    
+    async def run(index: int, call: Callable[[], Any]) -> models.BulkResult:
+        try:
+            return models.BulkResult(index=index, ok=True, result=await call())
+        except Exception as e:
+            return models.BulkResult(index=index, ok=False, error=e)
+        finally:
+            semaphore.release()
+    
+    tasks = []
+    for index, call in enumerate(calls):
+        await semaphore.acquire()
+        tasks.append(asyncio.ensure_future(run(index, call)))
+    
+    return models.BulkResponse(results=list(await asyncio.gather(*tasks)))
+
 def to_snake_case(name: str) -> str:
     """Преобразовать строку в snake_case"""
     name = re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк разбора страниц объектов.
+
+Сравнивает разбор свойств объектов через обычный Union (pydantic перебирает
+все 11 вариантов PropertyWithValue) и через Discriminator по полю format,
+разбор через промежуточный dict (json.loads + model_validate) и сразу из байтов,
+а также режимы клиента lazy и trusted при чтении id и name.
+
+Запуск (после pip install -e .):
+    python benchmarks/bench_models.py [--items 1000] [--properties 12] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from typing import List, Optional, Union
+from pydantic import BaseModel, TypeAdapter
+from anytype import models
+from anytype.codec import default_codec
+from anytype.lazy import LazyModel, construct
+
+PLAIN_PROPERTY_UNION = Union[tuple(models._PROPERTY_VALUE_CLASSES)]
+PLAIN_ICON_UNION = Union[models.EmojiIcon, models.FileIcon, models.NamedIcon]
+
+class PlainObject(BaseModel):
+    """Object со старыми недискриминированными Union"""
+    
+    id: str
+    name: Optional[str] = None
+    icon: Optional[PLAIN_ICON_UNION] = None
+    space_id: str
+    archived: bool = False
+    properties: Optional[List[PLAIN_PROPERTY_UNION]] = None
+
+class DiscriminatedObject(BaseModel):
+    """Те же поля с дискриминированными Union из models"""
+    
+    id: str
+    name: Optional[str] = None
+    icon: Optional[models.Icon] = None
+    space_id: str
+    archived: bool = False
+    properties: Optional[List[models.PropertyWithValue]] = None
+
+TAG = {"id": "tag", "key": "urgent", "name": "Urgent", "color": "red"}
+
+SAMPLE_VALUES = [
+    ("text", "Описание задачи"),
+    ("number", 42.5),
+    ("select", TAG),
+    ("multi_select", [TAG, TAG]),
+    ("date", "2025-01-01T00:00:00Z"),
+    ("files", ["file-1"]),
+    ("checkbox", True),
+    ("url", "https://anytype.io"),
+    ("email", "user@example.com"),
+    ("phone", "+10000000000"),
+    ("objects", ["obj-1", "obj-2"]),
+]
+
+def make_page(items: int, properties: int) -> bytes:
+    """Синтетическая страница PaginatedResponse[Object] в JSON"""
+    data = []
+    for i in range(items):
+        props = []
+        for j in range(properties):
+            fmt, value = SAMPLE_VALUES[j % len(SAMPLE_VALUES)]
+            props.append({"key": f"{fmt}_{j}", "format": fmt, fmt: value, "object": "property"})
+        data.append({
+            "id": f"obj-{i}",
+            "name": f"Object {i}",
+            "icon": {"format": "emoji", "emoji": "📄"},
+            "space_id": "space",
+            "object": "object",
+            "properties": props,
+        })
+    return json.dumps({
+        "data": data,
+        "pagination": {"offset": 0, "limit": items, "total": items, "has_more": False},
+    }).encode()
+
+def measure(adapter: TypeAdapter, payload: bytes, repeat: int) -> float:
+    """Лучшее время разбора из repeat попыток, в секундах"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        adapter.validate_json(payload)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def measure_dict(adapter: TypeAdapter, payload: bytes, repeat: int) -> float:
+    """Разбор в два прохода: json.loads, затем validate_python"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        adapter.validate_python(json.loads(payload))
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def measure_mode(mode: str, payload: bytes, repeat: int) -> float:
+    """Разбор страницы в режиме клиента и чтение id/name всех объектов"""
+    response_model = models.PaginatedResponse[models.Object]
+    codec = default_codec()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = codec.loads(payload)
+        if mode == "lazy":
+            page = LazyModel(response_model, data)
+        else:
+            page = construct(response_model, data)
+        for obj in page.data:
+            obj.id, obj.name
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--properties", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    payload = make_page(args.items, args.properties)
+    print(f"Страница: {args.items} объектов x {args.properties} свойств, {len(payload) / 1e6:.1f} MB")
+    
+    plain = measure(
+        TypeAdapter(models.PaginatedResponse[PlainObject]), payload, args.repeat
+    )
+    discriminated = measure(
+        TypeAdapter(models.PaginatedResponse[DiscriminatedObject]), payload, args.repeat
+    )
+    full_adapter = TypeAdapter(models.PaginatedResponse[models.Object])
+    full = measure(full_adapter, payload, args.repeat)
+    two_pass = measure_dict(full_adapter, payload, args.repeat)
+    
+    print(f"Union:                   {plain * 1000:8.1f} ms")
+    print(f"Discriminator:           {discriminated * 1000:8.1f} ms  (x{plain / discriminated:.1f})")
+    print(f"PaginatedResponse[Object]: {full * 1000:6.1f} ms")
+    print(f"  через dict:            {two_pass * 1000:8.1f} ms  (байты x{two_pass / full:.1f})")
+    
+    for mode in ("lazy", "trusted"):
+        elapsed = measure_mode(mode, payload, args.repeat)
+        print(f"Режим {mode:<8} (id, name):  {elapsed * 1000:6.1f} ms  (x{full / elapsed:.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк преобразований моделей ORM.
+
+Измеряет Model.from_anytype_object и Model.to_properties на объектах
+с задачами (текст, число, дата, флажок).
+
+Запуск (после pip install -e .):
+    python benchmarks/bench_orm.py [--items 100000] [--repeat 3]
+"""
+
+import argparse
+import time
+from anytype import models
+from anytype.orm import Task
+
+def make_objects(items: int):
+    """Синтетические объекты типа task"""
+    task_type = {"id": "task", "key": "task", "name": "Task", "plural_name": "Tasks", "layout": "action"}
+    return [
+        models.Object.model_validate({
+            "id": f"obj-{i}",
+            "space_id": "space",
+            "name": f"Task {i}",
+            "type": task_type,
+            "properties": [
+                {"key": "description", "format": "text", "text": "Описание"},
+                {"key": "priority", "format": "text", "text": "high"},
+                {"key": "due_date", "format": "date", "date": "2025-01-01T00:00:00Z"},
+                {"key": "completed", "format": "checkbox", "checkbox": i % 2 == 0},
+                {"key": "estimate", "format": "number", "number": 3},
+            ],
+        })
+        for i in range(items)
+    ]
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    objects = make_objects(args.items)
+    tasks = [Task.from_anytype_object(obj) for obj in objects]
+    
+    decode = best_of(args.repeat, lambda: [Task.from_anytype_object(obj) for obj in objects])
+    encode = best_of(args.repeat, lambda: [task.to_properties() for task in tasks])
+    
+    print(f"Объектов: {args.items}")
+    print(f"from_anytype_object: {decode * 1000:8.1f} ms  ({args.items / decode:,.0f} объектов/с)")
+    print(f"to_properties:       {encode * 1000:8.1f} ms  ({args.items / encode:,.0f} объектов/с)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Тесты пакетных операций"""
+
+import asyncio
+import json
+import httpx
+from anytype import AnytypeClient, AsyncAnytypeClient
+from anytype.exceptions import ValidationError
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.method == "POST":
+        body = json.loads(request.content)
+        if body.get("name") == "bad":
+            return httpx.Response(400, json={"message": "bad name", "code": "bad_request"})
+        return httpx.Response(200, json={
+            "object": {"id": body["name"], "space_id": "space", "name": body["name"]}
+        })
+    object_id = request.url.path.rsplit("/", 1)[-1]
+    return httpx.Response(200, json={"object": {"id": object_id, "space_id": "space"}})
+
+def test_bulk_create_reports_per_item_results():
+    """Тест пакетного создания с ошибкой в одном элементе"""
+    client = AnytypeClient(api_key="test-key")
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(_handler))
+    items = [{"type_key": "page", "name": f"n{i}"} for i in range(20)]
+    items[5] = {"type_key": "page", "name": "bad"}
+    items[7] = {"name": "no type key"}
+    response = client.objects.bulk_create("space", items, concurrency=4)
+    
+    assert [r.index for r in response.results] == list(range(20))
+    assert [r.index for r in response.failed] == [5, 7]
+    assert isinstance(response.results[5].error, ValidationError)
+    assert response.results[0].result.id == "n0"
+    assert len(response.succeeded) == 18
+    client.close()
+
+def test_async_bulk_update_and_delete():
+    """Тест пакетного обновления и удаления в асинхронном клиенте"""
+    async def run():
+        client = AsyncAnytypeClient(api_key="test-key")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(_handler)
+        )
+        updated = await client.objects.bulk_update(
+            "space", [("a", {"name": "A"}), {"id": "b", "name": "B"}], concurrency=2
+        )
+        deleted = await client.objects.bulk_delete("space", ["c", "d"])
+        await client.close()
+        return updated, deleted
+    
+    updated, deleted = asyncio.run(run())
+    assert [r.result.id for r in updated.results] == ["a", "b"]
+    assert [r.result.id for r in deleted.results] == ["c", "d"]
+
+def test_get_many_dedupes_and_reports_missing():
+    """Тест получения объектов по списку ID"""
+    seen = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        object_id = request.url.path.rsplit("/", 1)[-1]
+        if object_id == "gone":
+            return httpx.Response(404, json={"message": "not found", "code": "not_found"})
+        return httpx.Response(200, json={"object": {"id": object_id, "space_id": "space"}})
+    
+    client = AnytypeClient(api_key="test-key", transport=httpx.MockTransport(handler))
+    result = client.objects.get_many("space", ["a", "b", "a", "gone"], concurrency=2)
+    
+    assert sorted(result.found) == ["a", "b"]
+    assert result.found["a"].id == "a"
+    assert result.missing == ["gone"]
+    assert len(seen) == 3
+    assert all("format" not in url.params for url in seen)
+    
+    async def run():
+        async with AsyncAnytypeClient(api_key="test-key", transport=httpx.MockTransport(handler)) as client:
+            return await client.objects.get_many("space", ["c", "gone"], format="md")
+    
+    result = asyncio.run(run())
+    assert list(result.found) == ["c"] and result.missing == ["gone"]
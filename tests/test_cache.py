@@ -0,0 +1,63 @@
+"""Тесты кеша метаданных"""
+
+import time
+import httpx
+from anytype import AnytypeClient, ResponseCache
+from anytype.cache import MemoryCache, MISSING, classify_path
+
+TYPE = {"id": "t", "key": "task", "name": "Task", "plural_name": "Tasks", "layout": "action"}
+
+def _client(cache):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.url.path.endswith("/types"):
+            return httpx.Response(200, json={
+                "data": [TYPE],
+                "pagination": {"offset": 0, "limit": 100, "total": 1, "has_more": False},
+            })
+        return httpx.Response(200, json={"type": TYPE})
+    
+    client = AnytypeClient(api_key="test-key", cache=cache)
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client, calls
+
+def test_types_served_from_cache_until_write():
+    """Тест кеширования типов и сброса после изменения"""
+    cache = ResponseCache()
+    client, calls = _client(cache)
+    client.types.list("space").data[0].name = "Изменено вызывающим"
+    assert client.types.list("space").data[0].name == "Task"
+    client.types.get("space", "t")
+    client.types.get("space", "t")
+    assert len(calls) == 2
+    assert cache.stats["hits"] == 2
+    
+    client.types.update("space", "t", name="Задача")
+    client.types.list("space")
+    assert len(calls) == 4
+
+def test_memory_cache_lru_and_ttl():
+    """Тест вытеснения и истечения TTL"""
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats["evictions"] == 1
+    
+    cache.set("d", 4, ttl=0)
+    time.sleep(0.01)
+    assert cache.get("d") is MISSING
+
+def test_classify_path():
+    """Тест определения ресурса по пути"""
+    assert classify_path("/v1/spaces") == ("spaces", None)
+    assert classify_path("/v1/spaces/s") == ("spaces", "s")
+    assert classify_path("/v1/spaces/s/types/t") == ("types", "s")
+    assert classify_path("/v1/spaces/s/properties/p/tags") == ("tags", "s")
+    assert classify_path("/v1/spaces/s/objects") == (None, "s")
+    assert classify_path("/v1/spaces/s/types/t/templates") == (None, "s")
@@ -1,7 +1,10 @@
 """Тесты для Anytype SDK"""
 
+import asyncio
+import httpx
 import pytest
-from anytype import AnytypeClient
+from anytype import AnytypeClient, AsyncAnytypeClient
+from anytype.exceptions import NotFoundError
 from anytype.models import EmojiIcon
 
 def test_client_initialization():
@@ -17,3 +20,39 @@ def test_emoji_icon():
     assert icon.format == "emoji"
     assert icon.emoji == "📄"
     assert icon.model_dump() == {"format": "emoji", "emoji": "📄"}
+
+def _mock_transport():
+    """Транспорт, отвечающий как API на запрос объекта"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/spaces/space/objects/obj":
+            return httpx.Response(200, json={
+                "object": {"id": "obj", "space_id": "space", "name": "Страница"}
+            })
+        return httpx.Response(404, json={"message": "not found", "code": "not_found"})
+    return httpx.MockTransport(handler)
+
+def test_sync_request_unwraps_response():
+    """Тест разворачивания ответа-обертки в синхронном клиенте"""
+    client = AnytypeClient(api_key="test-key")
+    client.client = httpx.Client(base_url=client.base_url, transport=_mock_transport())
+    obj = client.objects.get("space", "obj")
+    assert obj.id == "obj"
+    assert obj.name == "Страница"
+    with pytest.raises(NotFoundError):
+        client.objects.get("space", "missing")
+    client.close()
+
+def test_async_client_shares_api_modules():
+    """Тест асинхронного клиента"""
+    async def run():
+        async with AsyncAnytypeClient(api_key="test-key") as client:
+            assert client.api_key == "test-key"
+            client.client = httpx.AsyncClient(
+                base_url=client.base_url, transport=_mock_transport()
+            )
+            obj = await client.objects.get("space", "obj")
+            assert obj.name == "Страница"
+            with pytest.raises(NotFoundError):
+                await client.objects.get("space", "missing")
+    
+    asyncio.run(run())
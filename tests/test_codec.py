@@ -0,0 +1,37 @@
+"""Тесты JSON кодеков"""
+
+import json
+import httpx
+import pytest
+from anytype import AnytypeClient
+from anytype.codec import JSONCodec, default_codec, get_codec
+
+def test_codecs_round_trip():
+    """Тест выбора кодека и кодирования туда-обратно"""
+    payload = {"name": "Задача", "tags": [1, 2.5, None, True]}
+    assert get_codec("json").loads(get_codec("json").dumps(payload)) == payload
+    assert default_codec().loads(default_codec().dumps(payload)) == payload
+    
+    codec = JSONCodec()
+    assert get_codec(codec) is codec
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+def test_request_body_sent_as_bytes():
+    """Тест отправки тела запроса байтами и разбора ответа из байтов"""
+    seen = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.content:
+            seen.append(json.loads(request.content))
+        return httpx.Response(200, json={"object": {"id": "o1", "space_id": "s", "name": "Задача"}})
+    
+    client = AnytypeClient(api_key="test-key", codec="json")
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    
+    obj = client.objects.create("s", type_key="task", name="Задача")
+    assert obj.name == "Задача"
+    assert seen == [{"type_key": "task", "name": "Задача"}]
+    
+    with client.with_response_mode("raw"):
+        assert client.objects.get("s", "o1")["id"] == "o1"
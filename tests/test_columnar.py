@@ -0,0 +1,86 @@
+"""Тесты колоночного представления объектов"""
+
+import pytest
+from anytype import models
+from anytype.columnar import ObjectTable
+
+def _obj(object_id, **props):
+    formats = {"estimate": "number", "done": "checkbox", "due": "date",
+               "status": "select", "labels": "multi_select", "note": "text"}
+    tag = lambda name: {"id": f"tag-{name}", "key": name, "name": name, "color": "grey"}
+    properties = []
+    for key, value in props.items():
+        fmt = formats[key]
+        if fmt == "select":
+            value = tag(value)
+        elif fmt == "multi_select":
+            value = [tag(v) for v in value]
+        properties.append({"key": key, "format": fmt, fmt: value})
+    return {
+        "id": object_id,
+        "space_id": "s",
+        "name": object_id.upper(),
+        "type": {"id": "t1", "key": "task", "name": "Task", "plural_name": "Tasks", "layout": "action"},
+        "properties": properties,
+    }
+
+RAW = [
+    _obj("a", estimate=3, done=True, due="2024-05-01T00:00:00Z", status="open", labels=["x", "y"]),
+    _obj("b", estimate=1, status="closed"),
+    _obj("c", status="open", labels=["y"], note="late column"),
+]
+
+def _page():
+    return models.PaginatedResponse[models.Object].model_validate({
+        "data": RAW, "pagination": {"offset": 0, "limit": 100, "total": 3, "has_more": False}
+    })
+
+def test_object_table_columns():
+    """Тест колонок без numpy/pandas: типизированные массивы и словари"""
+    table = ObjectTable.from_objects([_page()])
+    assert len(table) == 3
+    assert table.column_names == ["id", "name", "type", "estimate", "done", "due", "status", "labels", "note"]
+    
+    assert table["estimate"].data.typecode == "d"
+    assert table["done"].to_list() == [True, None, None]
+    assert table["due"].to_list()[0].isoformat() == "2024-05-01T00:00:00+00:00"
+    status = table["status"]
+    assert list(status.codes) == [0, 1, 0] and status.categories == ["open", "closed"]
+    assert table["labels"].to_list() == [["x", "y"], [], ["y"]]
+    # Колонка, появившаяся на третьей строке, дополнена пропусками
+    assert table["note"].to_list() == [None, None, "late column"]
+    
+    # Сырые dict (response_mode="raw") дают ту же таблицу
+    assert ObjectTable.from_objects(RAW).to_pydict() == table.to_pydict()
+    assert ObjectTable.from_objects(RAW, keys=["estimate"]).column_names == ["id", "name", "type", "estimate"]
+
+def test_object_table_to_pandas_and_arrow():
+    """Тест выгрузки в pandas и Arrow"""
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+    table = ObjectTable.from_objects(RAW)
+    
+    df = table.to_pandas()
+    assert df["estimate"].sum() == 4
+    assert df.groupby("status", observed=True)["estimate"].sum().to_dict() == {"open": 3.0, "closed": 1.0}
+    assert str(df["due"].dtype) == "datetime64[ms, UTC]"
+    assert pd.isna(df["due"][1]) and df["done"].isna().sum() == 2
+    
+    arrow = table.to_arrow()
+    assert arrow.num_rows == 3
+    assert pa.types.is_dictionary(arrow.schema.field("status").type)
+    assert arrow.column("labels").to_pylist() == [["x", "y"], [], ["y"]]
+    assert arrow.column("estimate").to_pylist() == [3.0, 1.0, None]
+
+def test_object_table_format_mismatch():
+    """Тест значения другого формата в уже созданной колонке"""
+    conflicting = _obj("d")
+    conflicting["properties"] = [
+        {"key": "estimate", "format": "text", "text": "about three"},
+        {"key": "status", "format": "text", "text": "blocked"},
+    ]
+    table = ObjectTable.from_objects(RAW[:2] + [conflicting])
+    assert table["estimate"].to_list() == [3.0, 1.0, None]
+    # Текстовые форматы попадают в одну колонку
+    assert table["status"].to_list() == ["open", "closed", "blocked"]
+    assert table.mismatches == {"estimate": 1}
@@ -0,0 +1,93 @@
+"""Тесты потоковой выгрузки пространства"""
+
+import gzip
+import json
+import httpx
+import pytest
+from anytype import AnytypeClient
+from anytype.export import SpaceExporter, export_space
+
+def _object(i):
+    return {
+        "id": f"o{i}",
+        "space_id": "s",
+        "name": f"Task {i}",
+        "type": {"id": "t1", "key": "task", "name": "Task", "plural_name": "Tasks", "layout": "action"},
+        "properties": [{"key": "estimate", "format": "number", "number": i}],
+    }
+
+def _client(count, requests):
+    objects = [_object(i) for i in range(count)]
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requests.append(path)
+        if path.endswith("/properties"):
+            return httpx.Response(200, json={
+                "data": [{"id": "p1", "key": "estimate", "name": "Estimate", "format": "number"}],
+                "pagination": {"offset": 0, "limit": 100, "total": 1, "has_more": False},
+            })
+        if path.endswith("/objects"):
+            offset = int(request.url.params.get("offset", 0))
+            limit = int(request.url.params.get("limit", 100))
+            page = objects[offset:offset + limit]
+            return httpx.Response(200, json={"data": page, "pagination": {
+                "offset": offset, "limit": limit, "total": count, "has_more": offset + limit < count
+            }})
+        object_id = path.rsplit("/", 1)[-1]
+        obj = dict(objects[int(object_id[1:])], markdown=f"# {object_id}")
+        return httpx.Response(200, json={"object": obj})
+    
+    return AnytypeClient(api_key="test-key", transport=httpx.MockTransport(handler))
+
+def test_export_ndjson_gz_resumes_from_checkpoint(tmp_path):
+    """Тест выгрузки в ndjson.gz с телами и продолжения после сбоя"""
+    requests = []
+    client = _client(7, requests)
+    path = str(tmp_path / "space.ndjson.gz")
+    
+    def fail(progress):
+        raise RuntimeError("interrupted")
+    
+    exporter = SpaceExporter(client, "s", path, with_body=True, page_size=3, progress=fail)
+    with pytest.raises(RuntimeError):
+        exporter.run()
+    assert json.loads((tmp_path / "space.ndjson.gz.checkpoint").read_text())["offset"] == 3
+    
+    seen = []
+    requests.clear()
+    result = export_space(client, "s", path, with_body=True, page_size=3, progress=seen.append)
+    assert result.resumed and result.objects == 7 and result.total == 7
+    assert [p.offset for p in seen] == [6, 7]
+    # Первая страница повторно не запрашивается
+    assert "/v1/spaces/s/objects/o0" not in requests
+    assert not (tmp_path / "space.ndjson.gz.checkpoint").exists()
+    
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["id"] for row in rows] == [f"o{i}" for i in range(7)]
+    assert rows[4]["markdown"] == "# o4"
+
+def test_export_parquet_parts(tmp_path):
+    """Тест выгрузки в каталог Parquet файлов"""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "space.parquet")
+    result = export_space(_client(5, []), "s", path, page_size=2, rows_per_file=4)
+    
+    assert result.objects == 5 and result.pages == 3
+    assert sorted(p.name for p in (tmp_path / "space.parquet").iterdir()) == [
+        "part-00000.parquet", "part-00001.parquet"
+    ]
+    table = parquet.read_table(path)
+    assert table.column("id").to_pylist() == [f"o{i}" for i in range(5)]
+    assert table.column("estimate").to_pylist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+def test_export_raw_mode(tmp_path):
+    """Тест выгрузки клиентом в режиме raw"""
+    client = _client(4, [])
+    path = str(tmp_path / "space.ndjson")
+    with client.with_response_mode("raw"):
+        result = export_space(client, "s", path, with_body=True, page_size=3)
+    assert result.objects == 4
+    rows = [json.loads(line) for line in open(path, encoding="utf-8")]
+    assert [row["markdown"] for row in rows] == [f"# o{i}" for i in range(4)]
@@ -0,0 +1,74 @@
+"""Тесты локального вычисления FilterExpression"""
+
+from anytype import models
+from anytype.filtering import compile_filter, filter_objects
+
+def _obj(object_id, **props):
+    formats = {"title": "text", "estimate": "number", "done": "checkbox", "due": "date",
+               "status": "select", "labels": "multi_select", "blocks": "objects"}
+    tag = lambda name: {"id": f"tag-{name}", "key": name, "name": name.title(), "color": "grey"}
+    properties = []
+    for key, value in props.items():
+        fmt = formats[key]
+        if fmt == "select":
+            value = tag(value)
+        elif fmt == "multi_select":
+            value = [tag(v) for v in value]
+        properties.append({"key": key, "format": fmt, fmt: value})
+    return models.Object.model_validate({
+        "id": object_id,
+        "space_id": "s",
+        "name": object_id.upper(),
+        "type": {"id": "t1", "key": "task", "name": "Task", "plural_name": "Tasks", "layout": "action"},
+        "properties": properties,
+    })
+
+OBJECTS = [
+    _obj("a", title="Fix Login bug", estimate=3, done=True, due="2024-05-01T10:00:00Z",
+         status="open", labels=["backend", "urgent"], blocks=["b"]),
+    _obj("b", title="Write docs", estimate=1, done=False, due="2024-05-03T00:00:00Z",
+         status="closed", labels=["docs"]),
+    _obj("c", estimate=8),
+]
+
+def _ids(expression):
+    return [obj.id for obj in filter_objects(OBJECTS, expression)]
+
+def _and(*conditions, filters=None):
+    return models.FilterExpression(operator="and", conditions=list(conditions), filters=filters)
+
+def test_typed_filters():
+    """Тест условий для всех основных форматов"""
+    assert _ids(_and(models.TextFilter(property_key="title", condition="contains", text="login"))) == ["a"]
+    assert _ids(_and(models.TextFilter(property_key="title", condition="ncontains", text="login"))) == ["b", "c"]
+    assert _ids(_and(models.NumberFilter(property_key="estimate", condition="gte", number=3))) == ["a", "c"]
+    assert _ids(_and(models.CheckboxFilter(property_key="done", condition="eq", checkbox=False))) == ["b"]
+    assert _ids(_and(models.DateFilter(property_key="due", condition="eq", date="2024-05-01"))) == ["a"]
+    assert _ids(_and(models.DateFilter(property_key="due", condition="gt", date="2024-05-02T00:00:00Z"))) == ["b"]
+    # select: по id, key или name тега
+    assert _ids(_and(models.SelectFilter(property_key="status", condition="eq", select="tag-open"))) == ["a"]
+    assert _ids(_and(models.SelectFilter(property_key="status", condition="ne", select="Open"))) == ["b", "c"]
+    assert _ids(_and(models.MultiSelectFilter(
+        property_key="labels", condition="in", multi_select=["docs", "urgent"]))) == ["a", "b"]
+    assert _ids(_and(models.MultiSelectFilter(
+        property_key="labels", condition="all", multi_select=["backend", "urgent"]))) == ["a"]
+    assert _ids(_and(models.ObjectsFilter(property_key="blocks", condition="in", objects=["b"]))) == ["a"]
+    assert _ids(_and(models.EmptyFilter(property_key="status", condition="empty"))) == ["c"]
+    assert _ids(_and(models.TextFilter(property_key="name", condition="eq", text="B"))) == ["b"]
+
+def test_nested_expression_and_view_filter():
+    """Тест вложенных AND/OR и фильтра представления"""
+    expression = _and(
+        models.NumberFilter(property_key="estimate", condition="lt", number=5),
+        filters=[models.FilterExpression(operator="or", conditions=[
+            models.CheckboxFilter(property_key="done", condition="eq", checkbox=True),
+            models.SelectFilter(property_key="status", condition="eq", select="closed"),
+        ])]
+    )
+    assert _ids(expression) == ["a", "b"]
+    
+    match = compile_filter(models.Filter(property_key="estimate", condition="gt", value=2))
+    assert [obj.id for obj in OBJECTS if match(obj)] == ["a", "c"]
+    # Сырые ответы (response_mode="raw") тоже подходят
+    assert match(OBJECTS[2].model_dump(mode="json"))
+    assert compile_filter(None)(OBJECTS[0])
@@ -0,0 +1,52 @@
+"""Тесты ревалидирующего HTTP кеша"""
+
+import httpx
+import pytest
+from anytype import AnytypeClient, HTTPCache, MemoryHTTPCacheBackend, SQLiteHTTPCacheBackend
+
+BODY = {"object": {"id": "o", "space_id": "s", "name": "Doc", "markdown": "# Большой документ"}}
+
+def _client(http_cache):
+    seen = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=BODY, headers={"ETag": '"v1"'})
+    
+    client = AnytypeClient(api_key="test-key", http_cache=http_cache)
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client, seen
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_not_modified_serves_parsed_object(backend, tmp_path):
+    """Тест ответа 304 из кеша"""
+    if backend == "memory":
+        storage = MemoryHTTPCacheBackend()
+    else:
+        storage = SQLiteHTTPCacheBackend(str(tmp_path / "cache.sqlite"))
+    http_cache = HTTPCache(storage)
+    client, seen = _client(http_cache)
+    
+    first = client.objects.get("s", "o")
+    first.name = "Изменено вызывающим"
+    second = client.objects.get("s", "o")
+    assert seen == [None, '"v1"']
+    # Каждый вызов получает свою копию
+    assert second is not first and second.name == "Doc"
+    second.name = "Тоже изменено"
+    assert client.objects.get("s", "o").name == "Doc"
+    assert second.markdown == "# Большой документ"
+    assert http_cache.stats == {"hits": 2, "misses": 1}
+
+def test_sqlite_cache_survives_restart(tmp_path):
+    """Тест ревалидации после перезапуска процесса"""
+    path = str(tmp_path / "cache.sqlite")
+    client, _ = _client(HTTPCache(SQLiteHTTPCacheBackend(path)))
+    client.objects.get("s", "o")
+    
+    client, seen = _client(HTTPCache(SQLiteHTTPCacheBackend(path)))
+    obj = client.objects.get("s", "o")
+    assert seen == ['"v1"']
+    assert obj.name == "Doc"
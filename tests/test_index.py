@@ -0,0 +1,65 @@
+"""Тесты вторичных индексов ObjectIndex"""
+
+from anytype import models
+from anytype.index import ObjectIndex
+
+def _obj(object_id, type_key="task", **props):
+    formats = {"estimate": "number", "due": "date", "labels": "multi_select", "blocks": "objects"}
+    properties = []
+    for key, value in props.items():
+        fmt = formats[key]
+        if fmt == "multi_select":
+            value = [{"id": f"tag-{v}", "key": v, "name": v.title(), "color": "grey"} for v in value]
+        properties.append({"key": key, "format": fmt, fmt: value})
+    return models.Object.model_validate({
+        "id": object_id,
+        "space_id": "s",
+        "name": object_id,
+        "type": {"id": type_key, "key": type_key, "name": type_key, "plural_name": type_key, "layout": "basic"},
+        "properties": properties,
+    })
+
+def _ids(objects):
+    return [obj.id for obj in objects]
+
+def test_object_index_lookups():
+    """Тест поиска по типу, тегу, диапазону и обратным связям"""
+    index = ObjectIndex([
+        _obj("a", estimate=3, due="2024-05-01T10:00:00Z", labels=["urgent"], blocks=["c"]),
+        _obj("b", estimate=1, due="2024-05-03T00:00:00Z", labels=["docs", "urgent"], blocks=["a", "c"]),
+        _obj("c", estimate=8),
+        _obj("n", type_key="note"),
+    ])
+    assert len(index) == 4 and "c" in index
+    assert _ids(index.by_type("task")) == ["a", "b", "c"]
+    # Тег ищется по id, key или name
+    assert _ids(index.find("labels", "urgent")) == ["a", "b"]
+    assert _ids(index.find("labels", "tag-docs")) == ["b"]
+    assert _ids(index.range("estimate", 2)) == ["a", "c"]
+    assert _ids(index.range("estimate", 1, 3, inclusive=(False, True))) == ["a"]
+    assert _ids(index.range("due", "2024-05-02")) == ["b"]
+    assert _ids(index.referrers("c")) == ["a", "b"]
+    assert _ids(index.referrers("a", key="blocks")) == ["b"]
+
+def test_object_index_update_and_remove():
+    """Тест инкрементального обновления индексов"""
+    index = ObjectIndex([_obj("a", estimate=3, labels=["urgent"], blocks=["c"]), _obj("b", estimate=5)])
+    
+    index.update(_obj("a", estimate=10, labels=["docs"]))
+    assert _ids(index.find("labels", "urgent")) == []
+    assert _ids(index.find("labels", "docs")) == ["a"]
+    assert _ids(index.referrers("c")) == []
+    assert _ids(index.range("estimate", 4)) == ["b", "a"]
+    
+    assert index.remove("b").id == "b"
+    assert index.remove("b") is None
+    assert _ids(index.range("estimate")) == ["a"]
+    assert index.values("type") == ["task"]
+
+def test_object_index_repeated_values():
+    """Тест повторяющихся элементов objects / multi_select"""
+    index = ObjectIndex([_obj("a", labels=["urgent", "urgent"], blocks=["b", "b"])])
+    assert _ids(index.referrers("b")) == ["a"]
+    index.update(_obj("a", labels=["docs"]))
+    assert index.find("labels", "urgent") == [] and index.referrers("b") == []
+    assert index.remove("a") is not None and len(index) == 0
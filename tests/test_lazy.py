@@ -0,0 +1,64 @@
+"""Тесты ленивого, доверенного и сырого режимов разбора ответов"""
+
+import httpx
+import pytest
+from anytype import AnytypeClient, models
+from anytype.lazy import LazyModel
+
+PAGE = {
+    "data": [
+        {
+            "id": "o1",
+            "space_id": "s",
+            "name": "Задача",
+            "layout": "action",
+            "icon": {"format": "emoji", "emoji": "✅"},
+            "properties": [
+                {"key": "estimate", "format": "number", "number": 3},
+                {"key": "links", "format": "objects", "objects": ["o2"]},
+            ],
+        },
+        {"id": "o2", "space_id": "s", "properties": [{"key": "bad", "format": "number", "number": "x"}]},
+    ],
+    "pagination": {"offset": 0, "limit": 100, "total": 2, "has_more": False},
+}
+
+def _client(**kwargs):
+    client = AnytypeClient(api_key="test-key", **kwargs)
+    client.client = httpx.Client(
+        base_url=client.base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=PAGE)),
+    )
+    return client
+
+def test_lazy_mode_validates_fields_on_access():
+    """Тест ленивой валидации полей"""
+    client = _client()
+    with pytest.raises(Exception):
+        client.objects.list("s")
+    
+    with client.with_response_mode("lazy"):
+        page = client.objects.list("s")
+    assert isinstance(page, LazyModel)
+    first, second = page.data
+    assert first.id == "o1"
+    assert first.layout == models.ObjectLayout.ACTION
+    assert first.get_display_name() == "Задача"
+    assert isinstance(first.properties[0], models.NumberPropertyValue)
+    assert second.id == "o2"
+    with pytest.raises(Exception):
+        second.properties
+    assert client.response_mode == "model"
+
+def test_trusted_and_raw_modes():
+    """Тест режимов trusted и raw"""
+    page = _client(response_mode="trusted").objects.list("s")
+    first, second = page.data
+    assert isinstance(first, models.Object) and first.name == "Задача"
+    # Значения вне схемы не проверяются, вложенные - как в JSON
+    assert second.properties[0]["number"] == "x"
+    
+    raw = _client(response_mode="raw").objects.list("s")
+    assert raw["data"][0]["id"] == "o1"
+    with pytest.raises(ValueError):
+        AnytypeClient(response_mode="fast")
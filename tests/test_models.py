@@ -0,0 +1,47 @@
+"""Тесты моделей"""
+
+from anytype import models
+
+def test_property_values_discriminated_by_format():
+    """Тест выбора класса свойства по format"""
+    obj = models.Object.model_validate({
+        "id": "o",
+        "space_id": "s",
+        "properties": [
+            {"key": "estimate", "format": "number", "number": 3},
+            {"key": "done", "format": "checkbox", "checkbox": True},
+            {"key": "links", "format": "objects", "objects": ["a"]},
+        ],
+    })
+    assert [type(p) for p in obj.properties] == [
+        models.NumberPropertyValue,
+        models.CheckboxPropertyValue,
+        models.ObjectsPropertyValue,
+    ]
+
+def test_property_values_without_format_fall_back_to_value_field():
+    """Тест разбора свойств без поля format"""
+    obj = models.Object.model_validate({
+        "id": "o",
+        "space_id": "s",
+        "icon": {"emoji": "📄"},
+        "properties": [
+            {"key": "tags", "multi_select": []},
+            {"key": "empty"},
+        ],
+    })
+    assert isinstance(obj.icon, models.EmojiIcon)
+    assert isinstance(obj.properties[0], models.MultiSelectPropertyValue)
+    assert isinstance(obj.properties[1], models.TextPropertyValue)
+
+def test_filter_items_discriminated_by_value_field():
+    """Тест разбора условий фильтра"""
+    expr = models.FilterExpression.model_validate({
+        "operator": "and",
+        "conditions": [
+            {"property_key": "done", "condition": "eq", "checkbox": False},
+            {"property_key": "due", "condition": "empty"},
+        ],
+    })
+    assert isinstance(expr.conditions[0], models.CheckboxFilter)
+    assert isinstance(expr.conditions[1], models.EmptyFilter)
@@ -0,0 +1,253 @@
+"""Тесты ORM: загрузка связанных объектов"""
+
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+import httpx
+import pytest
+from anytype import Anytype, ClientPool, Model, Task, models
+from anytype.exceptions import CommitError
+
+def _obj(object_id, type_key, **relations):
+    return {
+        "id": object_id,
+        "space_id": "s",
+        "name": object_id,
+        "type": {"id": type_key, "key": type_key, "name": type_key, "plural_name": type_key, "layout": "basic"},
+        "properties": [
+            {"key": key, "format": "objects", "objects": ids} for key, ids in relations.items()
+        ],
+    }
+
+OBJECTS = {
+    "p1": _obj("p1", "project", owner=["u1"]),
+    "p2": _obj("p2", "project", owner=["u1"]),
+    "u1": _obj("u1", "human"),
+}
+TASKS = [_obj("t1", "task", project=["p1"]), _obj("t2", "task", project=["p2", "p1"])]
+
+def test_query_prefetch_loads_nested_relations_in_batches():
+    """Тест prefetch со вложенными связями"""
+    requests = []
+    methods = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        methods.append(request.method)
+        if request.url.path.endswith("/search"):
+            return httpx.Response(200, json={
+                "data": TASKS,
+                "pagination": {"offset": 0, "limit": 100, "total": 2, "has_more": False},
+            })
+        return httpx.Response(200, json={"object": OBJECTS[request.url.path.rsplit("/", 1)[-1]]})
+    
+    at = Anytype(api_key="test-key", pool=ClientPool(transport=httpx.MockTransport(handler)))
+    with at.connect("s") as session:
+        tasks = session.query(Task).prefetch("project.owner").all()
+        # Загруженные связи не изменены: commit ничего не отправляет
+        assert not session.dirty
+        session.commit()
+    
+    assert "PATCH" not in methods
+    assert isinstance(tasks[0], Task)
+    assert [p.id for p in tasks[1].related("project")] == ["p2", "p1"]
+    owner = tasks[0].related("project")[0].related("owner")[0]
+    assert owner.id == "u1" and owner.type_key == "human"
+    # Поиск + p1, p2 одним пакетом + u1 один раз
+    assert len(requests) == 4
+
+def test_session_identity_map_and_partial_updates():
+    """Тест карты идентичности и PATCH только измененных полей"""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path, request.content))
+        object_id = request.url.path.rsplit("/", 1)[-1]
+        obj = _obj(object_id, "task")
+        obj["properties"] = [
+            {"key": "status", "format": "text", "text": "todo"},
+            {"key": "priority", "format": "text", "text": "low"},
+        ]
+        return httpx.Response(200, json={"object": obj})
+    
+    at = Anytype(api_key="test-key", pool=ClientPool(transport=httpx.MockTransport(handler)))
+    with at.connect("s") as session:
+        first = session.get(Task, "t1")
+        assert session.get(Task, "t1") is first
+        assert session.get_many(Task, ["t1", "t2"])["t1"] is first
+        assert len(requests) == 2
+        
+        first.status = "done"
+        session.get(Task, "t2").priority = "high"
+        assert session.dirty == [first, session.get(Task, "t2")]
+        session.commit()
+        assert not session.dirty
+    
+    patches = {path: json.loads(body) for method, path, body in requests if method == "PATCH"}
+    assert patches == {
+        "/v1/spaces/s/objects/t1": {"properties": [{"key": "status", "text": "done"}]},
+        "/v1/spaces/s/objects/t2": {"properties": [{"key": "priority", "text": "high"}]},
+    }
+
+class Project(Model):
+    name: Optional[str] = None
+    
+    class Meta:
+        type_key = "project"
+        title_field = "name"
+
+class Assignment(Model):
+    name: Optional[str] = None
+    project: Optional[Any] = None
+    
+    class Meta:
+        type_key = "assignment"
+        title_field = "name"
+
+class Sprint(Model):
+    name: Optional[str] = None
+    project: Optional[Project] = None
+    epics: Optional[List[Project]] = None
+    labels: Optional[List[str]] = None
+    stage: Optional[str] = None
+    
+    class Meta:
+        type_key = "sprint"
+        title_field = "name"
+        property_formats = {"stage": "select"}
+
+def _commit_server(fail_name=None):
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        requests.append((request.method, request.url.path, body))
+        if request.method == "POST":
+            if body["name"] == fail_name:
+                return httpx.Response(400, json={"message": "bad", "code": "bad_request"})
+            return httpx.Response(200, json={"object": _obj("id-" + body["name"], body["type_key"])})
+        object_id = request.url.path.rsplit("/", 1)[-1]
+        type_key = {"t": "task", "a": "assignment"}.get(object_id[0], "x")
+        return httpx.Response(200, json={"object": _obj(object_id, type_key)})
+    
+    at = Anytype(api_key="test-key", pool=ClientPool(transport=httpx.MockTransport(handler)))
+    return at, requests
+
+def test_commit_creates_then_links_relations():
+    """Тест порядка шагов commit: создание, затем связи"""
+    at, requests = _commit_server()
+    with at.connect("s") as session:
+        project = Project(name="P")
+        task = Assignment(name="T", project=project)
+        session.add(task)
+        session.add(project)
+        report = session.commit()
+    
+    assert sorted(report.created) == ["id-P", "id-T"]
+    assert report.updated == ["id-T"]
+    assert all(entry.elapsed >= 0 for entry in report.entries)
+    assert [method for method, _, _ in requests] == ["POST", "POST", "PATCH"]
+    assert all("properties" not in body for _, _, body in requests[:2])
+    assert requests[2][2] == {"properties": [{"key": "project", "objects": ["id-P"]}]}
+    assert not task.is_dirty
+
+def test_commit_rolls_back_created_objects_on_failure():
+    """Тест архивации созданных объектов при ошибке"""
+    at, requests = _commit_server(fail_name="bad")
+    with at.connect("s") as session:
+        good, bad = Project(name="good"), Project(name="bad")
+        session.add(good)
+        session.add(bad)
+        with pytest.raises(CommitError) as error:
+            session.commit()
+    
+    assert error.value.report.rolled_back == ["id-good"]
+    assert ("DELETE", "/v1/spaces/s/objects/id-good", None) in requests
+    assert good.id is None and bad.id is None
+    
+    with pytest.raises(ValueError):
+        with at.connect("s") as session:
+            session.add(Assignment(name="T", project=Project(name="not added")))
+            session.commit()
+
+def test_model_codec_formats():
+    """Тест форматов свойств из аннотаций, включая bool и связи"""
+    assert Task.codec() is Task.codec()
+    task = Task(name="T", completed=True, priority="high", due_date=datetime(2025, 1, 2))
+    links = {link.key: link.model_dump(exclude_none=True) for link in task.to_properties()}
+    assert links == {
+        "priority": {"key": "priority", "text": "high"},
+        "due_date": {"key": "due_date", "date": "2025-01-02T00:00:00"},
+        "completed": {"key": "completed", "checkbox": True},
+    }
+    
+    loaded = Assignment.from_anytype_object(models.Object.model_validate(
+        _obj("a1", "assignment", project=["p1"])
+    ))
+    assert loaded.project == ["p1"]
+    assert loaded.to_properties()[0].model_dump() == {"key": "project", "objects": ["p1"]}
+
+def test_commit_clears_properties_set_to_none():
+    """Тест очистки свойства: None отправляется явным null, а не пропускается"""
+    at, requests = _commit_server()
+    with at.connect("s") as session:
+        task = session.get(Task, "t1")
+        task.due_date = datetime(2025, 1, 2)
+        session.commit()
+        task.due_date = None
+        session.commit()
+        assert not task.is_dirty
+        
+        # Формат поля без аннотации неизвестен: commit не отправляет запросов
+        assignment = session.get(Assignment, "a1")
+        assignment.project = "p1"
+        session.commit()
+        assignment.project = None
+        sent = len(requests)
+        with pytest.raises(ValueError):
+            session.commit()
+        assert len(requests) == sent and assignment.is_dirty
+    
+    patches = [body for method, _, body in requests if method == "PATCH"]
+    assert patches[0] == {"properties": [{"key": "due_date", "date": "2025-01-02T00:00:00"}]}
+    assert patches[1] == {"properties": [{"key": "due_date", "date": None}]}
+
+def test_commit_rolls_back_on_unexpected_error(monkeypatch):
+    """Тест архивации созданных объектов при исключении вне шагов commit"""
+    at, requests = _commit_server()
+    
+    def broken(self, fields=None):
+        raise RuntimeError("encoding failed")
+    
+    with at.connect("s") as session:
+        project = Project(name="P")
+        session.add(project)
+        session.add(Assignment(name="T", project=project))
+        monkeypatch.setattr(Assignment, "to_update_request", broken)
+        with pytest.raises(RuntimeError):
+            session.commit()
+    
+    assert ("DELETE", "/v1/spaces/s/objects/id-P", None) in requests
+    assert ("DELETE", "/v1/spaces/s/objects/id-T", None) in requests
+    assert project.id is None
+
+def test_decode_typed_relations_and_tags():
+    """Тест загрузки связей в поля-модели и тегов в поля str / List[str]"""
+    data = _obj("s1", "sprint", project=["p1"], epics=["p1", "p2"])
+    tag = {"id": "tag-1", "key": "urgent", "name": "Urgent", "color": "red"}
+    data["properties"] += [
+        {"key": "labels", "format": "multi_select", "multi_select": [tag]},
+        {"key": "stage", "format": "select", "select": dict(tag, id="tag-2")},
+    ]
+    sprint = Sprint.from_anytype_object(models.Object.model_validate(data))
+    
+    assert sprint.project is None and sprint.epics is None
+    assert sprint.relation_ids("epics") == ["p1", "p2"]
+    assert sprint.labels == ["tag-1"] and sprint.stage == "tag-2"
+    assert not sprint.is_dirty
+    # Теги уходят обратно теми же ID
+    links = {link.key: link.model_dump(exclude_none=True) for link in sprint.to_properties()}
+    assert links == {
+        "labels": {"key": "labels", "multi_select": ["tag-1"]},
+        "stage": {"key": "stage", "select": "tag-2"},
+    }
@@ -0,0 +1,90 @@
+"""Тесты постраничного перебора"""
+
+import asyncio
+import httpx
+from anytype import AnytypeClient, AsyncAnytypeClient
+
+TOTAL = 2500
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    offset = int(request.url.params["offset"])
+    limit = int(request.url.params["limit"])
+    ids = range(offset, min(offset + limit, TOTAL))
+    return httpx.Response(200, json={
+        "data": [{"id": str(i), "space_id": "space"} for i in ids],
+        "pagination": {
+            "offset": offset,
+            "limit": limit,
+            "total": TOTAL,
+            "has_more": offset + limit < TOTAL,
+        },
+    })
+
+def _client() -> AnytypeClient:
+    client = AnytypeClient(api_key="test-key")
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(_handler))
+    return client
+
+def test_iter_list_streams_all_pages():
+    """Тест перебора всех страниц"""
+    client = _client()
+    ids = [obj.id for obj in client.objects.iter_list("space")]
+    assert ids == [str(i) for i in range(TOTAL)]
+    client.close()
+
+def test_iter_list_prefetch_keeps_order():
+    """Тест предзагрузки следующей страницы"""
+    client = _client()
+    ids = [obj.id for obj in client.objects.iter_list("space", page_size=700, prefetch=True)]
+    assert ids == [str(i) for i in range(TOTAL)]
+    client.close()
+
+def test_async_iter_list():
+    """Тест асинхронного перебора"""
+    async def run():
+        client = AsyncAnytypeClient(api_key="test-key")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(_handler)
+        )
+        ids = [obj.id async for obj in client.objects.iter_list("space", prefetch=True)]
+        await client.close()
+        return ids
+    
+    assert asyncio.run(run()) == [str(i) for i in range(TOTAL)]
+
+def test_iter_list_parallel_fan_out():
+    """Тест параллельной загрузки страниц"""
+    client = _client()
+    ordered = [obj.id for obj in client.objects.iter_list("space", page_size=300, concurrency=4)]
+    assert ordered == [str(i) for i in range(TOTAL)]
+    unordered = [
+        obj.id
+        for obj in client.objects.iter_list("space", page_size=300, concurrency=4, ordered=False)
+    ]
+    assert sorted(unordered, key=int) == [str(i) for i in range(TOTAL)]
+    client.close()
+
+def test_async_parallel_fan_out():
+    """Тест параллельной загрузки страниц в асинхронном клиенте"""
+    async def run():
+        client = AsyncAnytypeClient(api_key="test-key")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(_handler)
+        )
+        ids = [
+            obj.id
+            async for obj in client.objects.iter_list("space", page_size=300, concurrency=4)
+        ]
+        await client.close()
+        return ids
+    
+    assert asyncio.run(run()) == [str(i) for i in range(TOTAL)]
+
+def test_iter_list_raw_mode():
+    """Тест перебора страниц в режиме raw (страницы - словари)"""
+    client = _client()
+    with client.with_response_mode("raw"):
+        ids = [obj["id"] for obj in client.objects.iter_list("space", page_size=700)]
+        parallel = [obj["id"] for obj in client.objects.iter_list("space", page_size=700, concurrency=3)]
+    assert ids == parallel == [str(i) for i in range(TOTAL)]
+    client.close()
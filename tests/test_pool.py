@@ -0,0 +1,58 @@
+"""Тесты общего пула клиентов"""
+
+import pytest
+from anytype import AnytypeDatabase, AnytypeDB, ClientPool
+
+def test_connections_share_pooled_client():
+    """Тест переиспользования клиента между подключениями"""
+    pool = ClientPool(max_connections=10, keepalive_expiry=30)
+    db = AnytypeDatabase(api_key="key-1", pool=pool)
+    
+    with db.connect("space-a") as first:
+        client = first.client
+        with db.connect("space-b") as second:
+            assert second.client is client
+            assert pool.stats == {"clients": 1, "in_use": 1, "idle": 0}
+    assert pool.stats == {"clients": 1, "in_use": 0, "idle": 1}
+    assert not client.client.is_closed
+    assert client.limits.max_connections == 10
+    
+    with AnytypeDB(api_key="key-1", pool=pool).connect("space-c") as conn:
+        assert conn.client is client
+    with AnytypeDB(api_key="key-2", pool=pool).connect("space-c") as conn:
+        assert conn.client is not client
+    
+    pool.close()
+    assert client.client.is_closed
+
+def test_pool_closes_extra_idle_clients():
+    """Тест закрытия лишних свободных клиентов"""
+    pool = ClientPool(max_idle=0)
+    client = pool.acquire("key")
+    assert pool.acquire("key") is client
+    pool.release(client)
+    assert not client.client.is_closed
+    pool.release(client)
+    assert client.client.is_closed
+    assert pool.stats["clients"] == 0
+
+def test_double_close_keeps_shared_client():
+    """Тест повторного закрытия подключения при общем клиенте"""
+    pool = ClientPool(max_idle=0)
+    db = AnytypeDatabase(api_key="key", pool=pool)
+    with db.connect("space-a") as first:
+        with db.connect("space-b") as second:
+            second.close()
+        # Второй close из with не должен освободить клиент первого подключения
+        assert pool.stats == {"clients": 1, "in_use": 1, "idle": 0}
+        assert not first.client.client.is_closed
+    assert first.client.client.is_closed
+
+def test_pooled_client_keeps_its_api_key():
+    """Тест запрета смены ключа у общего клиента"""
+    pool = ClientPool()
+    client = pool.acquire("key")
+    with pytest.raises(RuntimeError):
+        client.set_api_key("other")
+    assert pool.acquire("key") is client and client.api_key == "key"
+    pool.close()
@@ -0,0 +1,30 @@
+"""Тесты ограничителя частоты запросов"""
+
+from anytype.ratelimit import RateLimiter, TokenBucket, default_group
+
+def test_token_bucket_burst_then_wait():
+    """Тест пачки запросов и ожидания"""
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+def test_adaptive_bucket_backs_off_and_recovers():
+    """Тест адаптивного снижения скорости после 429"""
+    bucket = TokenBucket(rate=10, adaptive=True)
+    bucket.on_throttled()
+    assert bucket.rate == 5
+    for _ in range(100):
+        bucket.on_success()
+    assert bucket.rate == 10
+
+def test_groups_by_endpoint():
+    """Тест разделения лимитов по группам эндпоинтов"""
+    assert default_group("POST", "/v1/spaces/s/search") == "search"
+    assert default_group("PATCH", "/v1/spaces/s/objects/o") == "write"
+    assert default_group("GET", "/v1/spaces/s/objects") == "read"
+    
+    limiter = RateLimiter(groups={"search": (1, 1)})
+    assert limiter.reserve("GET", "/v1/spaces") == 0.0
+    assert limiter.reserve("POST", "/v1/search") == 0.0
+    assert limiter.reserve("POST", "/v1/search") > 0.5
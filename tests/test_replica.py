@@ -0,0 +1,107 @@
+"""Тесты локальной реплики пространства"""
+
+import json
+import httpx
+from anytype import AnytypeClient, AnytypeDatabase, ClientPool
+from anytype.replica import Replica
+
+def _page(data):
+    return {"data": data, "pagination": {"offset": 0, "limit": 1000, "total": len(data), "has_more": False}}
+
+def _task(object_id, name, modified, status=None, estimate=None):
+    properties = [{"key": "last_modified_date", "format": "date", "date": modified}]
+    if status:
+        properties.append({"key": "status", "format": "select", "select": {
+            "id": f"tag-{status}", "key": status, "name": status, "color": "grey"
+        }})
+    if estimate is not None:
+        properties.append({"key": "estimate", "format": "number", "number": estimate})
+    return {
+        "id": object_id,
+        "space_id": "s",
+        "name": name,
+        "type": {"id": "t1", "key": "task", "name": "Task", "plural_name": "Tasks", "layout": "action"},
+        "properties": properties,
+    }
+
+def _transport(objects, searches, skipped=()):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if "/objects/" in path:
+            object_id = path.rsplit("/", 1)[-1]
+            found = [obj for obj in objects if obj["id"] == object_id]
+            if not found:
+                return httpx.Response(404, json={"message": "not found", "code": "not_found"})
+            return httpx.Response(200, json={"object": found[0]})
+        if path.endswith("/search"):
+            searches.append(json.loads(request.content)["sort"]["direction"])
+            # skipped: объекты, которые поиск пропустил (сдвиг страниц во время синхронизации)
+            return httpx.Response(200, json=_page([obj for obj in objects if obj["id"] not in skipped]))
+        if path.endswith("/tags"):
+            return httpx.Response(200, json=_page([
+                {"id": "tag-done", "key": "done", "name": "done", "color": "lime"}
+            ]))
+        if path.endswith("/properties"):
+            return httpx.Response(200, json=_page([
+                {"id": "p1", "key": "status", "name": "Status", "format": "select"}
+            ]))
+        return httpx.Response(200, json=_page([]))
+    
+    return httpx.MockTransport(handler)
+
+def test_replica_full_then_incremental_sync():
+    """Тест полной и инкрементальной синхронизации"""
+    searches = []
+    objects = [
+        _task("o1", "Alpha", "2024-01-01T00:00:00Z", status="done", estimate=3),
+        _task("o2", "Beta", "2024-01-02T00:00:00Z", estimate=1),
+    ]
+    replica = Replica(":memory:", "s")
+    client = AnytypeClient(api_key="test-key", transport=_transport(objects, searches))
+    
+    result = replica.sync(client)
+    assert result.full and result.upserted == 2
+    assert replica.watermark == "2024-01-02T00:00:00Z"
+    assert [t.name for t in replica.tags("status")] == ["done"]
+    
+    # Инкрементальная: новые сверху, старые объекты отсекаются по watermark
+    objects[:] = [
+        _task("o3", "Gamma", "2024-01-03T00:00:00Z", status="done"),
+        _task("o2", "Beta", "2024-01-02T00:00:00Z", estimate=1),
+        _task("o1", "Alpha", "2024-01-01T00:00:00Z", status="done", estimate=3),
+    ]
+    result = replica.sync(client)
+    assert not result.full and result.upserted == 2
+    assert searches == ["asc", "desc"]
+    assert replica.get("o3").name == "Gamma"
+    
+    # Полная синхронизация удаляет исчезнувшие объекты
+    objects[:] = objects[:2]
+    assert replica.sync(client, full=True).removed == 1
+    assert replica.get("o1") is None
+    
+    # Пропущенный поиском, но существующий объект остается
+    skipping = AnytypeClient(api_key="test-key", transport=_transport(objects, searches, skipped={"o2"}))
+    result = replica.sync(skipping, full=True)
+    assert result.removed == 0 and result.upserted == 2
+    assert replica.get("o2").name == "Beta"
+
+def test_connection_queries_replica():
+    """Тест поиска через db слой по реплике без запросов поиска к API"""
+    searches = []
+    transport = _transport([
+        _task("o1", "Alpha", "2024-01-01T00:00:00Z", status="done", estimate=3),
+        _task("o2", "Beta", "2024-01-02T00:00:00Z", estimate=1),
+        _task("o3", "Gamma", "2024-01-03T00:00:00Z", status="done", estimate=2),
+    ], searches)
+    replica = Replica(":memory:", "s")
+    replica.sync(AnytypeClient(api_key="test-key", transport=transport))
+    
+    db = AnytypeDatabase("test-key", pool=ClientPool(transport=transport))
+    with db.connect("s", replica=replica) as conn:
+        done = conn.query("task").filter(status="done").order_by("estimate", "desc").all()
+        assert [o.id for o in done] == ["o1", "o3"]
+        assert conn.query("task").filter(estimate__gte=2).count() == 2
+        assert conn.query("task").filter(status__ne="done").first().id == "o2"
+        assert [o.id for o in conn.objects.find(name__contains="amm")] == ["o3"]
+    assert searches == ["asc"]
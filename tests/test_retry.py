@@ -0,0 +1,64 @@
+"""Тесты политики повторов"""
+
+import httpx
+import pytest
+from anytype import AnytypeClient, RetryPolicy
+from anytype.exceptions import AnytypeAPIError, RateLimitError
+from anytype.retry import RetryBudget, parse_retry_after
+
+def _client(responses, retry):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return responses[min(len(calls), len(responses)) - 1]
+    
+    client = AnytypeClient(api_key="test-key", retry=retry)
+    client.client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client, calls
+
+OK = httpx.Response(200, json={"space": {
+    "id": "s", "name": "S", "network_id": "n", "gateway_url": "g"
+}})
+THROTTLED = httpx.Response(429, headers={"Retry-After": "0"}, json={"message": "slow down"})
+UNAVAILABLE = httpx.Response(503, json={"message": "unavailable"})
+
+def test_retries_rate_limit_with_retry_after():
+    """Тест повтора 429 с заголовком Retry-After"""
+    client, calls = _client([THROTTLED, THROTTLED, OK], RetryPolicy(max_attempts=3))
+    assert client.spaces.get("s").id == "s"
+    assert calls == ["GET", "GET", "GET"]
+
+def test_post_retried_only_when_rejected():
+    """Тест повтора неидемпотентных методов"""
+    policy = RetryPolicy(max_attempts=3, backoff_base=0)
+    client, calls = _client([THROTTLED, OK], policy)
+    client.spaces.create(name="S")
+    assert calls == ["POST", "POST"]
+    
+    client, calls = _client([UNAVAILABLE, OK], policy)
+    with pytest.raises(AnytypeAPIError):
+        client.spaces.create(name="S")
+    assert calls == ["POST"]
+
+def test_gives_up_after_max_attempts():
+    """Тест исчерпания попыток"""
+    client, calls = _client([THROTTLED], RetryPolicy(max_attempts=2))
+    with pytest.raises(RateLimitError):
+        client.spaces.get("s")
+    assert len(calls) == 2
+
+def test_retry_budget_limits_retries():
+    """Тест бюджета повторов"""
+    budget = RetryBudget(ratio=0.5, min_tokens=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+def test_parse_retry_after():
+    """Тест разбора Retry-After"""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("garbage") is None
@@ -0,0 +1,84 @@
+"""Тесты генерации моделей по схеме пространства"""
+
+import httpx
+from anytype import AnytypeClient, models
+from anytype.orm import _MODELS
+from anytype.schema import SpaceSchema, build_models, load_schema, render_module
+
+PAGE = {"offset": 0, "limit": 1000, "total": 1, "has_more": False}
+PROPERTIES = [
+    {"id": "p1", "key": "status", "name": "Status", "format": "select"},
+    {"id": "p2", "key": "68ab_estimate", "name": "Estimate", "format": "number"},
+    {"id": "p3", "key": "done", "name": "Done", "format": "checkbox"},
+]
+TYPE = {"id": "t1", "key": "bug_report", "name": "Bug report", "plural_name": "Bugs", "layout": "basic"}
+TYPE_PROPERTIES = [
+    {"key": "status", "format": "select"},
+    {"key": "68ab_estimate", "format": "number"},
+    {"key": "done", "format": "checkbox"},
+]
+
+def _client(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/properties"):
+            return httpx.Response(200, json={"data": PROPERTIES, "pagination": {**PAGE, "total": 3}})
+        if request.url.path.endswith("/types"):
+            return httpx.Response(200, json={"data": [TYPE], "pagination": PAGE})
+        return httpx.Response(200, json={"type": {**TYPE, "properties": TYPE_PROPERTIES}})
+    
+    return AnytypeClient(api_key="test-key", transport=httpx.MockTransport(handler))
+
+def test_load_schema_caches_snapshot(tmp_path):
+    """Тест загрузки схемы и снимка с хешем версии"""
+    requests = []
+    path = str(tmp_path / "schema.json")
+    schema = load_schema(_client(requests), "s", path=path)
+    
+    # Список свойств, список типов и get для типа без свойств
+    assert requests == ["/v1/spaces/s/properties", "/v1/spaces/s/types", "/v1/spaces/s/types/t1"]
+    assert schema.formats("bug_report") == {"status": "select", "68ab_estimate": "number", "done": "checkbox"}
+    
+    cached = load_schema(_client(requests), "s", path=path)
+    assert len(requests) == 3
+    assert cached.version == schema.version
+    
+    # Измененный снимок не проходит проверку хеша
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text.replace('"checkbox"', '"text"'))
+    assert SpaceSchema.load(path) is None
+
+def test_build_models_use_exact_keys_and_formats():
+    """Тест моделей по схеме: ключи свойств и форматы из Meta"""
+    schema = load_schema(_client([]), "s")
+    previous = dict(_MODELS)
+    BugReport = build_models(schema, register=False)["bug_report"]
+    assert _MODELS == previous
+    assert BugReport.__name__ == "BugReport"
+    
+    obj = models.Object.model_validate({
+        "id": "o1", "space_id": "s", "name": "Crash",
+        "properties": [
+            {"key": "68ab_estimate", "format": "number", "number": 3},
+            {"key": "done", "format": "checkbox", "checkbox": True},
+        ],
+    })
+    bug = BugReport.from_anytype_object(obj)
+    assert bug.p_68ab_estimate == 3 and bug.done is True
+    
+    bug.p_68ab_estimate = 5
+    bug.status = "tag-1"
+    request = bug.to_update_request()
+    assert {p.key: p.model_dump(exclude_none=True) for p in request.properties} == {
+        "68ab_estimate": {"key": "68ab_estimate", "number": 5.0},
+        "status": {"key": "status", "select": "tag-1"},
+    }
+    
+    namespace = {}
+    exec(render_module(schema), namespace)
+    generated = namespace["BugReport"]
+    assert generated.Meta.property_keys == {"p_68ab_estimate": "68ab_estimate"}
+    assert generated.codec().formats == BugReport.codec().formats
+    assert namespace["SCHEMA_VERSION"] == schema.version
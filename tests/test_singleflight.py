@@ -0,0 +1,89 @@
+"""Тесты объединения одинаковых одновременных запросов"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from anytype import AnytypeClient, AsyncAnytypeClient
+
+OBJECT = {"object": {"id": "o1", "space_id": "s", "name": "Hot"}}
+
+def _client(coalesce=True):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        time.sleep(0.05)
+        return httpx.Response(200, json=OBJECT)
+    
+    client = AnytypeClient(api_key="test-key", coalesce=coalesce, transport=httpx.MockTransport(handler))
+    return client, calls
+
+def test_concurrent_gets_share_one_request():
+    """Тест одного HTTP вызова на одинаковые GET из разных потоков"""
+    client, calls = _client()
+    start = threading.Barrier(8)
+    
+    def get(_):
+        start.wait()
+        return client.objects.get("s", "o1")
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(get, range(8)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert client._singleflight.shared == 7
+    
+    # Последовательные запросы не объединяются
+    client.objects.get("s", "o1")
+    assert len(calls) == 2
+    
+    # С coalesce=False (по умолчанию) запросы не объединяются
+    client, calls = _client(coalesce=False)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: client.objects.get("s", "o1"), range(4)))
+    assert len(calls) == 4
+
+def test_async_gets_share_one_request():
+    """Тест объединения запросов в асинхронном клиенте"""
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=OBJECT)
+    
+    async def run():
+        async with AsyncAnytypeClient(api_key="test-key", coalesce=True, transport=httpx.MockTransport(handler)) as client:
+            return await asyncio.gather(
+                *(client.objects.get("s", "o1") for _ in range(5)),
+                client.objects.get("s", "o1", format=None)
+            )
+    
+    results = asyncio.run(run())
+    assert len(calls) == 2
+    assert results[0] is results[4]
+
+def test_async_leader_cancel_keeps_request_for_waiters():
+    """Тест отмены первого вызвавшего: остальные получают результат"""
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=OBJECT)
+    
+    async def run():
+        async with AsyncAnytypeClient(api_key="test-key", coalesce=True, transport=httpx.MockTransport(handler)) as client:
+            leader = asyncio.ensure_future(client.objects.get("s", "o1"))
+            await asyncio.sleep(0.01)
+            waiter = asyncio.ensure_future(client.objects.get("s", "o1"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return leader, await waiter
+    
+    leader, result = asyncio.run(run())
+    assert leader.cancelled()
+    assert result.id == "o1"
+    assert len(calls) == 1
@@ -0,0 +1,40 @@
+"""Тесты настроек HTTP транспорта"""
+
+import asyncio
+import httpx
+import pytest
+from anytype import AnytypeClient, AsyncAnytypeClient, TransportConfig
+
+SPACE = {"space": {"id": "s1", "name": "Space", "network_id": "n", "gateway_url": "http://gw"}}
+
+def test_custom_transport_and_timeouts():
+    """Тест своего транспорта и таймаутов по фазам"""
+    config = TransportConfig(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=SPACE)),
+        connect_timeout=2,
+        read_timeout=60
+    )
+    client = AnytypeClient(api_key="test-key", timeout=10, transport=config)
+    assert client.spaces.get("s1").id == "s1"
+    assert client.client.timeout == httpx.Timeout(10, connect=2, read=60)
+    
+    # Готовый транспорт можно передать и без TransportConfig
+    async def handler(request):
+        return httpx.Response(200, json=SPACE)
+    
+    async def run():
+        async with AsyncAnytypeClient(api_key="test-key", transport=httpx.MockTransport(handler)) as client:
+            return await client.spaces.get("s1")
+    
+    assert asyncio.run(run()).id == "s1"
+
+def test_http2_requires_h2():
+    """Тест понятной ошибки без пакета h2"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="anytype-sdk\\[http2\\]"):
+            TransportConfig(http2=True)
+    else:
+        client = AnytypeClient(api_key="test-key", transport=TransportConfig(http2=True))
+        assert client.transport.http2